@@ -3,8 +3,8 @@ import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app.core.database import Base
-from app.models import user, user_role, language
+from app.core.database import Base, sync_database_url
+from app.models import user, user_role, language, refresh_token
 from sqlalchemy import engine_from_config, pool
 from alembic import context
 
@@ -24,7 +24,9 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 # Replace placeholder in alembic.ini with actual .env value
-config.set_main_option("sqlalchemy.url", os.getenv("DATABASE_URL"))
+# Async driver URLs (postgresql+asyncpg, sqlite+aiosqlite) are mapped to their
+# sync equivalents, migrations always run on a blocking connection
+config.set_main_option("sqlalchemy.url", sync_database_url(os.getenv("DATABASE_URL")))
 
 # add your model's MetaData object here
 # for 'autogenerate' support
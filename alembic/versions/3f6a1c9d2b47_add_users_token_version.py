@@ -0,0 +1,30 @@
+"""add users.token_version
+
+Revision ID: 3f6a1c9d2b47
+Revises: e2b212c57f58
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6a1c9d2b47'
+down_revision: Union[str, Sequence[str], None] = 'e2b212c57f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+    op.create_index(op.f('ix_users_token_version'), 'users', ['token_version'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_users_token_version'), table_name='users')
+    op.drop_column('users', 'token_version')
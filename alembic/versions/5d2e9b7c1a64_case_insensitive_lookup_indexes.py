@@ -0,0 +1,54 @@
+"""case-insensitive unique indexes on users.email, languages.code, user_roles.name
+
+Revision ID: 5d2e9b7c1a64
+Revises: 8c41d7e5a903
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e9b7c1a64'
+down_revision: Union[str, Sequence[str], None] = '8c41d7e5a903'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    ('users', 'email', 'ix_users_email_lower'),
+    ('languages', 'code', 'ix_languages_code_lower'),
+    ('user_roles', 'name', 'ix_user_roles_name_lower'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    for table, column, _ in _COLUMNS:
+        duplicates = conn.execute(sa.text(
+            f"SELECT lower(trim({column})) FROM {table} "
+            f"GROUP BY lower(trim({column})) HAVING count(*) > 1"
+        )).scalars().all()
+        if duplicates:
+            raise RuntimeError(
+                f"{table}.{column} has values differing only in case or spacing: "
+                f"{', '.join(duplicates)}. Merge them before upgrading."
+            )
+
+    for table, column, index in _COLUMNS:
+        # Store the normalized form the application now writes
+        op.execute(f"UPDATE {table} SET {column} = lower(trim({column}))")
+        op.create_index(index, table, [sa.text(f"lower({column})")], unique=True)
+
+    # Superseded by ix_users_email_lower
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    for table, _, index in reversed(_COLUMNS):
+        op.drop_index(index, table_name=table)
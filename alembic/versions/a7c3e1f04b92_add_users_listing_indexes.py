@@ -0,0 +1,32 @@
+"""add composite indexes for the keyset user listing
+
+Revision ID: a7c3e1f04b92
+Revises: 5d2e9b7c1a64
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e1f04b92'
+down_revision: Union[str, Sequence[str], None] = '5d2e9b7c1a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_role_id_id', 'users', ['role_id', 'id'], unique=False)
+    op.create_index('ix_users_language_id_id', 'users', ['language_id', 'id'], unique=False)
+    op.create_index('ix_users_is_active_id', 'users', ['is_active', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_is_active_id', table_name='users')
+    op.drop_index('ix_users_language_id_id', table_name='users')
+    op.drop_index('ix_users_role_id_id', table_name='users')
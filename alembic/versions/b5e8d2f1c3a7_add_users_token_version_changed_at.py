@@ -0,0 +1,32 @@
+"""add users.token_version_changed_at
+
+Revision ID: b5e8d2f1c3a7
+Revises: a7c3e1f04b92
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e8d2f1c3a7'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e1f04b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version_changed_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_users_token_version_changed_at'), 'users', ['token_version_changed_at'], unique=False)
+    # Existing bumps are picked up by the first sync, then age out with the tokens
+    op.execute("UPDATE users SET token_version_changed_at = CURRENT_TIMESTAMP WHERE token_version > 0")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_users_token_version_changed_at'), table_name='users')
+    op.drop_column('users', 'token_version_changed_at')
@@ -0,0 +1,189 @@
+# app/core/admission.py
+
+"""Admission control for CPU-heavy work such as password verification."""
+
+import asyncio
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from app.core.metrics import register_metrics_source
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when work is shed instead of queued.
+
+    Attributes:
+        reason (str): "queue_full" or "deadline_exceeded".
+        retry_after (int): Suggested client back-off in seconds.
+    """
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionLimiter:
+    """
+    Concurrency limiter with a bounded FIFO wait queue and a wait deadline.
+
+    - At most `max_concurrency` holders run at once.
+    - At most `max_queue` callers wait; extra callers are rejected immediately.
+    - A waiter that is not admitted within `deadline` seconds is rejected.
+
+    Intended for a single event loop (one per worker process).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        deadline: float,
+        retry_after: int = 1,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative.")
+
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.deadline = deadline
+        self.retry_after = retry_after
+
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        # Counters exposed through snapshot()
+        self._admitted = 0
+        self._rejected_queue_full = 0
+        self._rejected_deadline = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold one concurrency slot for the duration of the block.
+
+        Raises:
+            AdmissionRejected: If the queue is full or the deadline expires.
+        """
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self) -> None:
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            self._record_admission(0.0)
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self._rejected_queue_full += 1
+            raise AdmissionRejected("queue_full", self.retry_after)
+
+        started = time.perf_counter()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=self.deadline)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            self._rejected_deadline += 1
+            raise AdmissionRejected("deadline_exceeded", self.retry_after)
+        except asyncio.CancelledError:
+            self._discard(waiter)
+            # The slot may have been handed over right before cancellation
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+        self._record_admission(time.perf_counter() - started)
+
+    def _release(self) -> None:
+        # Hand the slot directly to the oldest live waiter (FIFO)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _record_admission(self, waited: float) -> None:
+        self._admitted += 1
+        self._wait_seconds_total += waited
+        self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return current queue depth, wait times and rejection counters.
+        """
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "deadline_seconds": self.deadline,
+            "active": self._active,
+            "queue_depth": len(self._waiters),
+            "admitted": self._admitted,
+            "rejected_queue_full": self._rejected_queue_full,
+            "rejected_deadline": self._rejected_deadline,
+            "wait_seconds_total": round(self._wait_seconds_total, 6),
+            "wait_seconds_max": round(self._wait_seconds_max, 6),
+            "wait_seconds_avg": round(self._wait_seconds_total / self._admitted, 6) if self._admitted else 0.0,
+        }
+
+
+# --- Lazy-initialized password verification limiter (private) ---
+_PASSWORD_LIMITER: Optional[AdmissionLimiter] = None
+
+
+def _env_number(name: str, default: str, cast):
+    raw = os.getenv(name, default).strip() or default
+    try:
+        return cast(raw)
+    except ValueError as exc:
+        raise EnvironmentError(f"{name} must be a number.") from exc
+
+
+def get_password_verification_limiter() -> AdmissionLimiter:
+    """
+    Return the limiter guarding bcrypt verification in /login (lazy).
+
+    Configured through:
+        - PASSWORD_VERIFY_MAX_CONCURRENCY (default: PASSWORD_HASH_WORKERS or CPU count)
+        - PASSWORD_VERIFY_MAX_QUEUE (default: 64)
+        - PASSWORD_VERIFY_DEADLINE_SECONDS (default: 2.0)
+        - PASSWORD_VERIFY_RETRY_AFTER_SECONDS (default: 1)
+    """
+    global _PASSWORD_LIMITER
+    if _PASSWORD_LIMITER is None:
+        default_concurrency = os.getenv("PASSWORD_HASH_WORKERS", "") or str(os.cpu_count() or 1)
+        _PASSWORD_LIMITER = AdmissionLimiter(
+            max_concurrency=_env_number("PASSWORD_VERIFY_MAX_CONCURRENCY", default_concurrency, int),
+            max_queue=_env_number("PASSWORD_VERIFY_MAX_QUEUE", "64", int),
+            deadline=_env_number("PASSWORD_VERIFY_DEADLINE_SECONDS", "2.0", float),
+            retry_after=_env_number("PASSWORD_VERIFY_RETRY_AFTER_SECONDS", "1", int),
+        )
+    return _PASSWORD_LIMITER
+
+
+register_metrics_source(
+    "password_verification",
+    lambda: get_password_verification_limiter().snapshot(),
+)
+
+
+__all__ = ["AdmissionLimiter", "AdmissionRejected", "get_password_verification_limiter"]
@@ -1,22 +1,70 @@
 # app/core/database.py
 
-"""Database configuration with lazy engine/session initialization."""
+"""
+Database configuration with lazy engine/session initialization.
 
+The request path runs in one of two modes, selected by the DATABASE_URL driver:
+
+- sync (e.g. `postgresql+psycopg2://`, `sqlite://`): a `Session` whose work
+  runs in the request threadpool.
+- async (`postgresql+asyncpg://`, `postgresql+psycopg_async://`,
+  `sqlite+aiosqlite://`): an `AsyncSession` on `create_async_engine`, so
+  waiting on the database does not hold a thread.
+
+Routes are written once against `run_db`, which executes a plain
+Session-based function in whichever mode is active. Scripts (seeds,
+Alembic) always use the sync engine, built from the equivalent sync driver.
+Pool sizing, instrumentation and warm-up live in `app.core.db_pool`; with
+DATABASE_REPLICA_URLS set, sessions route reads to replicas
+(`app.core.db_routing`). Every engine reports its statements to
+`app.core.sql_stats` for per-request counts and DB time.
+"""
+
+import asyncio
+import logging
 import os
-from typing import Generator, Optional
+import time
+from typing import Any, AsyncGenerator, Callable, Optional, TypeVar
 
 from fastapi import HTTPException, status
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 
+from app.core.db_pool import pool_options, pool_snapshot, warmup_size
+from app.core.db_routing import ReplicaSet, RoutingSession
+from app.core.metrics import register_metrics_source
+from app.core.sql_stats import record_statement
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Async drivers and the sync driver used for scripts on the same database
+_ASYNC_DRIVERS = {
+    "asyncpg": "psycopg2",
+    "psycopg_async": "psycopg",
+    "aiosqlite": "pysqlite",
+}
+
 # --- Lazy-initialized globals (private) ---
 _ENGINE: Optional[Engine] = None
 _SessionLocal: Optional[sessionmaker] = None
+_ASYNC_ENGINE: Optional[AsyncEngine] = None
+_AsyncSessionLocal: Optional[async_sessionmaker] = None
+_REPLICAS: Optional[ReplicaSet] = None
+_ASYNC_REPLICA_ENGINES: list[AsyncEngine] = []
 
 # Declarative base for ORM models
 Base = declarative_base()
 
+# Shared by the sync and async session factories, so `run_db` helpers behave
+# the same in both modes: loaded attributes stay readable after commit
+# (an AsyncSession cannot refresh them implicitly)
+_SESSION_OPTIONS = {"autoflush": False, "expire_on_commit": False}
+
 
 def _get_database_url() -> str:
     """
@@ -32,26 +80,136 @@ def _get_database_url() -> str:
     return url
 
 
+def is_async_database_url(url: str) -> bool:
+    """
+    Return True if the URL names an async driver (asyncpg, psycopg_async, aiosqlite).
+    """
+    return make_url(url).get_driver_name() in _ASYNC_DRIVERS
+
+
+def sync_database_url(url: str) -> str:
+    """
+    Return the URL with an async driver replaced by its sync equivalent.
+    """
+    parsed = make_url(url)
+    driver = parsed.get_driver_name()
+    if driver not in _ASYNC_DRIVERS:
+        return url
+    sync_url = parsed.set(drivername=f"{parsed.get_backend_name()}+{_ASYNC_DRIVERS[driver]}")
+    return sync_url.render_as_string(hide_password=False)
+
+
+def replica_urls() -> list[str]:
+    """
+    Return the read replica URLs from DATABASE_REPLICA_URLS (comma-separated).
+
+    Replica URLs use the same driver as DATABASE_URL.
+    """
+    return [u.strip() for u in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if u.strip()]
+
+
+def _replica_down_seconds() -> float:
+    return float(os.getenv("DB_REPLICA_HEALTH_CHECK_SECONDS", "10"))
+
+
+def is_async_mode() -> bool:
+    """
+    Return True if requests use the async engine (based on DATABASE_URL).
+    """
+    url = os.getenv("DATABASE_URL")
+    return bool(url) and is_async_database_url(url)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._sql_stats_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    record_statement(time.perf_counter() - context._sql_stats_start)
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """
+    Count statements and DB time of `engine` into the current request's stats (idempotent).
+
+    Args:
+        engine (Engine): A sync engine (for async engines, pass `sync_engine`).
+
+    Returns:
+        Engine: The same engine.
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
 def _init_engine() -> None:
     """
     Initialize SQLAlchemy engine and sessionmaker once (idempotent).
     """
-    global _ENGINE, _SessionLocal
+    global _ENGINE, _SessionLocal, _REPLICAS
     if _ENGINE is not None and _SessionLocal is not None:
         return
 
-    database_url = _get_database_url()
-    _ENGINE = create_engine(
+    database_url = sync_database_url(_get_database_url())
+    _ENGINE = instrument_engine(create_engine(
         database_url,
         echo=False,
-        pool_pre_ping=True,
         future=True,
-    )
+        **pool_options(database_url),
+    ))
+    replicas = None
+    if replica_urls() and not is_async_mode():
+        replicas = ReplicaSet(
+            [
+                instrument_engine(create_engine(sync_database_url(url), echo=False, future=True, **pool_options(url)))
+                for url in replica_urls()
+            ],
+            down_seconds=_replica_down_seconds(),
+        )
+        _REPLICAS = replicas
     _SessionLocal = sessionmaker(
+        class_=RoutingSession,
         autocommit=False,
-        autoflush=False,
         bind=_ENGINE,
         future=True,
+        replicas=replicas,
+        **_SESSION_OPTIONS,
+    )
+
+
+def _init_async_engine() -> None:
+    """
+    Initialize the async engine and sessionmaker once (idempotent).
+    """
+    global _ASYNC_ENGINE, _AsyncSessionLocal, _REPLICAS, _ASYNC_REPLICA_ENGINES
+    if _ASYNC_ENGINE is not None and _AsyncSessionLocal is not None:
+        return
+
+    database_url = _get_database_url()
+    _ASYNC_ENGINE = create_async_engine(
+        database_url,
+        echo=False,
+        **pool_options(database_url, is_async=True),
+    )
+    instrument_engine(_ASYNC_ENGINE.sync_engine)
+    replicas = None
+    if replica_urls():
+        _ASYNC_REPLICA_ENGINES = [
+            create_async_engine(url, echo=False, **pool_options(url, is_async=True))
+            for url in replica_urls()
+        ]
+        replicas = ReplicaSet(
+            [instrument_engine(engine.sync_engine) for engine in _ASYNC_REPLICA_ENGINES],
+            down_seconds=_replica_down_seconds(),
+        )
+        _REPLICAS = replicas
+    _AsyncSessionLocal = async_sessionmaker(
+        bind=_ASYNC_ENGINE,
+        sync_session_class=RoutingSession,
+        replicas=replicas,
+        **_SESSION_OPTIONS,
     )
 
 
@@ -70,6 +228,19 @@ class _SessionFactory:
 SessionLocal = _SessionFactory()
 
 
+class _AsyncSessionFactory:
+    """
+    Public, callable async session factory (`db = AsyncSessionLocal()`).
+    """
+    def __call__(self) -> AsyncSession:
+        _init_async_engine()
+        assert _AsyncSessionLocal is not None  # for type-checkers
+        return _AsyncSessionLocal()
+
+
+AsyncSessionLocal = _AsyncSessionFactory()
+
+
 def get_engine() -> Engine:
     """
     Return the initialized SQLAlchemy engine (lazy).
@@ -79,15 +250,172 @@ def get_engine() -> Engine:
     return _ENGINE
 
 
-def get_db() -> Generator[Session, None, None]:
+def get_async_engine() -> AsyncEngine:
+    """
+    Return the initialized async engine (lazy).
+    """
+    _init_async_engine()
+    assert _ASYNC_ENGINE is not None
+    return _ASYNC_ENGINE
+
+
+async def get_db() -> AsyncGenerator[Session | AsyncSession, None]:
     """
     FastAPI dependency yielding a DB session with proper cleanup.
+
+    Yields an `AsyncSession` in async mode and a `Session` otherwise;
+    routes use `run_db` so they work with either.
     """
+    if is_async_mode():
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
+        # Closing may roll back on the connection: keep it off the event loop
+        await run_in_threadpool(db.close)
+
+
+async def run_db(db: Session | AsyncSession, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run `fn(session, *args, **kwargs)` without blocking the event loop.
+
+    - AsyncSession: `run_sync`, so ORM code (including lazy loads) runs on
+      the async driver without a thread.
+    - Session: the request threadpool.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
+async def warm_up_pool() -> int:
+    """
+    Open DB_POOL_WARMUP connections up front and return them to the pool.
+
+    Called at startup so the first requests after a deploy reuse open
+    connections instead of paying connection setup. Failures are logged and
+    leave the pool cold; they never block startup.
+
+    Returns:
+        int: Number of connections opened.
+    """
+    count = warmup_size()
+    if count == 0 or not os.getenv("DATABASE_URL"):
+        return 0
+
+    try:
+        if is_async_mode():
+            engine = get_async_engine()
+            connections = []
+            try:
+                for _ in range(count):
+                    connections.append(await engine.connect().start())
+            finally:
+                for connection in connections:
+                    await connection.close()
+        else:
+            connections = await run_in_threadpool(_open_sync_connections, get_engine(), count)
+    except Exception:
+        logger.warning("Database pool warm-up failed", exc_info=True)
+        return 0
+    return len(connections)
+
+
+def _open_sync_connections(engine: Engine, count: int) -> list:
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+    return connections
+
+
+def _probe(engine: Engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+async def check_replicas() -> None:
+    """
+    Probe every replica with `SELECT 1`, marking it up or down.
+    """
+    if _REPLICAS is None:
+        return
+    if _ASYNC_REPLICA_ENGINES:
+        for engine in _ASYNC_REPLICA_ENGINES:
+            try:
+                async with engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+            except Exception:
+                logger.warning("Read replica %s is unavailable", engine.url.render_as_string(), exc_info=True)
+                _REPLICAS.mark_down(engine.sync_engine)
+            else:
+                _REPLICAS.mark_up(engine.sync_engine)
+        return
+    for engine in _REPLICAS.engines:
+        try:
+            await run_in_threadpool(_probe, engine)
+        except Exception:
+            logger.warning("Read replica %s is unavailable", engine.url.render_as_string(), exc_info=True)
+            _REPLICAS.mark_down(engine)
+        else:
+            _REPLICAS.mark_up(engine)
+
+
+async def run_replica_health_checks() -> None:
+    """
+    Probe the replicas every DB_REPLICA_HEALTH_CHECK_SECONDS until cancelled.
+    """
+    if not replica_urls():
+        return
+    if is_async_mode():
+        _init_async_engine()
+    else:
+        _init_engine()
+    while True:
+        await check_replicas()
+        await asyncio.sleep(_replica_down_seconds())
+
+
+def _pool_metrics() -> dict:
+    """
+    Snapshot the pools of the engines created so far (never creates one).
+    """
+    data: dict = {"mode": "async" if is_async_mode() else "sync"}
+    if _ENGINE is not None:
+        data["sync"] = pool_snapshot(_ENGINE.pool)
+    if _ASYNC_ENGINE is not None:
+        data["async"] = pool_snapshot(_ASYNC_ENGINE.sync_engine.pool)
+    if _REPLICAS is not None:
+        data["replicas"] = [
+            {**status, "pool": pool_snapshot(engine.pool)}
+            for status, engine in zip(_REPLICAS.snapshot(), _REPLICAS.engines)
+        ]
+    return data
+
+
+register_metrics_source("db_pool", _pool_metrics)
 
 
-__all__ = ["Base", "SessionLocal", "get_engine", "get_db"]
+__all__ = [
+    "Base",
+    "SessionLocal",
+    "AsyncSessionLocal",
+    "get_engine",
+    "get_async_engine",
+    "get_db",
+    "run_db",
+    "warm_up_pool",
+    "instrument_engine",
+    "check_replicas",
+    "run_replica_health_checks",
+    "replica_urls",
+    "is_async_mode",
+    "sync_database_url",
+]
@@ -0,0 +1,173 @@
+# app/core/db_pool.py
+
+"""
+Connection pool configuration and instrumentation.
+
+Pool settings come from the environment:
+    - DB_POOL_SIZE (default: 5): connections kept open.
+    - DB_MAX_OVERFLOW (default: 10): extra connections allowed under load.
+    - DB_POOL_TIMEOUT (default: 30): seconds to wait for a free connection.
+    - DB_POOL_RECYCLE (default: -1): max connection age in seconds (-1 = never).
+    - DB_POOL_PRE_PING (default: true): test connections on checkout; with
+      false, stale connections are only replaced after a failed statement
+      (pair it with DB_POOL_RECYCLE below the server idle timeout).
+    - DB_POOL_WARMUP (default: DB_POOL_SIZE): connections opened at startup
+      (capped at DB_POOL_SIZE, overflow connections are not kept).
+
+The engines use `InstrumentedQueuePool` / `InstrumentedAsyncAdaptedQueuePool`,
+which record checkout wait time and pool timeouts for `/metrics`.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+def _env_int(name: str, default: str) -> int:
+    raw = os.getenv(name, default).strip() or default
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise EnvironmentError(f"{name} must be an integer.") from exc
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+class PoolStats:
+    """
+    Thread-safe counters for connection checkouts.
+
+    Wait time covers the whole `pool.connect()` call: queueing for a free
+    slot, opening a new connection when needed and the pre-ping.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, waited: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += waited
+            if waited > self.wait_seconds_max:
+                self.wait_seconds_max = waited
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / attempts, 6) if attempts else 0.0,
+            }
+
+
+class _InstrumentedPoolMixin:
+    """
+    Times every checkout and counts pool timeouts.
+    """
+
+    stats: PoolStats
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except sa_exc.TimeoutError:
+            self.stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - start, timed_out=False)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool recording checkout wait time and timeouts."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording checkout wait time and timeouts."""
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def pool_options(url: str, is_async: bool = False) -> Dict[str, Any]:
+    """
+    Return `create_engine` / `create_async_engine` keyword arguments for the pool.
+
+    In-memory SQLite keeps SQLAlchemy's single-connection pool, since a
+    queue of connections would each see a different empty database.
+
+    Raises:
+        EnvironmentError: If a DB_POOL_* value is not an integer.
+    """
+    options: Dict[str, Any] = {"pool_pre_ping": _env_flag("DB_POOL_PRE_PING", "true")}
+    if _is_memory_sqlite(url):
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=_env_int("DB_POOL_SIZE", "5"),
+        max_overflow=_env_int("DB_MAX_OVERFLOW", "10"),
+        pool_timeout=_env_int("DB_POOL_TIMEOUT", "30"),
+        pool_recycle=_env_int("DB_POOL_RECYCLE", "-1"),
+    )
+    return options
+
+
+def warmup_size() -> int:
+    """
+    Return how many connections to open at startup (DB_POOL_WARMUP, default DB_POOL_SIZE).
+    """
+    pool_size = _env_int("DB_POOL_SIZE", "5")
+    return max(0, min(_env_int("DB_POOL_WARMUP", str(pool_size)), pool_size))
+
+
+def pool_snapshot(pool: Pool) -> Dict[str, Any]:
+    """
+    Return live occupancy and checkout statistics for a pool.
+    """
+    snapshot: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        snapshot.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            timeout=pool.timeout(),
+        )
+    stats = getattr(pool, "stats", None)
+    if isinstance(stats, PoolStats):
+        snapshot.update(stats.snapshot())
+    return snapshot
+
+
+__all__ = [
+    "PoolStats",
+    "InstrumentedQueuePool",
+    "InstrumentedAsyncAdaptedQueuePool",
+    "pool_options",
+    "pool_snapshot",
+    "warmup_size",
+]
@@ -0,0 +1,174 @@
+# app/core/db_routing.py
+
+"""
+Read-replica routing for the request sessions.
+
+When DATABASE_REPLICA_URLS is set, sessions are `RoutingSession`s:
+
+- plain SELECTs go to a replica, picked round-robin once per session and
+  skipping replicas marked down;
+- flushes, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE and any textual SQL
+  go to the primary, and once a session has written, all its later reads
+  stay on the primary (read-your-writes within a request);
+- `use_primary(db)` pins a session to the primary up front, for
+  read-modify-write paths;
+- `record_write(key)` / `stick_to_primary_if_written(db, key)` extend
+  read-your-writes across requests: reads about a key written in the last
+  DB_REPLICA_STICKY_SECONDS seconds (default: 5) go to the primary.
+
+A replica is marked down when connecting to it fails, and re-admitted by
+the periodic health check after DB_REPLICA_HEALTH_CHECK_SECONDS
+(default: 10). With no healthy replica, reads fall back to the primary.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.utils.cache import TTLCache
+
+# Session.info key pinning a session to the primary
+PRIMARY = "use_primary"
+_REPLICA = "replica"
+
+
+class ReplicaSet:
+    """
+    Round-robin selection over replica engines with health tracking.
+
+    Args:
+        engines (List[Engine]): Sync engines (for async engines, their `sync_engine`).
+        down_seconds (float): How long a failed replica is skipped.
+    """
+
+    def __init__(self, engines: List[Engine], down_seconds: float = 10.0):
+        self.engines = list(engines)
+        self.down_seconds = down_seconds
+        self._down_until: Dict[int, float] = {}
+        self._selected: Dict[int, int] = {id(e): 0 for e in self.engines}
+        self._next = 0
+        self._lock = threading.Lock()
+        for engine in self.engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def _on_error(self, context) -> None:
+        # Connect failures have no Connection; dropped connections are disconnects
+        if context.connection is None or context.is_disconnect:
+            self.mark_down(context.engine)
+
+    def choose(self) -> Optional[Engine]:
+        """
+        Return the next healthy replica, or None to use the primary.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.engines)):
+                engine = self.engines[self._next % len(self.engines)]
+                self._next += 1
+                if self._down_until.get(id(engine), 0.0) <= now:
+                    self._selected[id(engine)] += 1
+                    return engine
+        return None
+
+    def mark_down(self, engine: Engine) -> None:
+        with self._lock:
+            self._down_until[id(engine)] = time.monotonic() + self.down_seconds
+
+    def mark_up(self, engine: Engine) -> None:
+        with self._lock:
+            self._down_until.pop(id(engine), None)
+
+    def is_healthy(self, engine: Engine) -> bool:
+        with self._lock:
+            return self._down_until.get(id(engine), 0.0) <= time.monotonic()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "url": engine.url.render_as_string(hide_password=True),
+                "healthy": self.is_healthy(engine),
+                "selected": self._selected[id(engine)],
+            }
+            for engine in self.engines
+        ]
+
+
+def _is_read(clause: Any) -> bool:
+    return bool(getattr(clause, "is_select", False)) and getattr(clause, "_for_update_arg", None) is None
+
+
+class RoutingSession(Session):
+    """
+    Session sending reads to a replica and everything else to the primary (its `bind`).
+
+    Args:
+        replicas (ReplicaSet | None): Replica engines; None routes everything to the primary.
+    """
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replicas is None or self.info.get(PRIMARY):
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        if self._flushing or not _is_read(clause):
+            self.info[PRIMARY] = True
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        replica = self.info.get(_REPLICA)
+        if replica is None:
+            replica = self.replicas.choose()
+            if replica is None:
+                return super().get_bind(mapper, clause=clause, **kwargs)
+            self.info[_REPLICA] = replica
+        return replica
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _stick_after_flush(session: Session, flush_context) -> None:
+    session.info[PRIMARY] = True
+
+
+def use_primary(db: Session) -> None:
+    """
+    Send every following statement of this session to the primary.
+    """
+    db.info[PRIMARY] = True
+
+
+# --- Recently written keys for cross-request read-your-writes (private) ---
+_RECENT_WRITES: TTLCache[bool] = TTLCache(
+    maxsize=10000,
+    ttl=float(os.getenv("DB_REPLICA_STICKY_SECONDS", "5")),
+)
+
+
+def record_write(key: Hashable) -> None:
+    """
+    Remember that `key` (e.g. a user id) was just written on the primary.
+    """
+    _RECENT_WRITES.set(key, True)
+
+
+def stick_to_primary_if_written(db: Session, key: Hashable) -> None:
+    """
+    Pin the session to the primary if `key` was written within the sticky window.
+    """
+    if _RECENT_WRITES.get(key):
+        use_primary(db)
+
+
+__all__ = [
+    "PRIMARY",
+    "ReplicaSet",
+    "RoutingSession",
+    "use_primary",
+    "record_write",
+    "stick_to_primary_if_written",
+]
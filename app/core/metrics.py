@@ -0,0 +1,32 @@
+# app/core/metrics.py
+
+"""In-process metrics registry backing the /metrics endpoint."""
+
+import threading
+from typing import Any, Callable, Dict
+
+# --- Registered metric sources (private) ---
+_SOURCES: Dict[str, Callable[[], Dict[str, Any]]] = {}
+_SOURCES_LOCK = threading.Lock()
+
+
+def register_metrics_source(name: str, source: Callable[[], Dict[str, Any]]) -> None:
+    """
+    Register a callable returning a snapshot dict under the given name.
+
+    Registering the same name again replaces the previous source.
+    """
+    with _SOURCES_LOCK:
+        _SOURCES[name] = source
+
+
+def collect_metrics() -> Dict[str, Any]:
+    """
+    Return a snapshot of every registered metrics source.
+    """
+    with _SOURCES_LOCK:
+        sources = dict(_SOURCES)
+    return {name: source() for name, source in sorted(sources.items())}
+
+
+__all__ = ["register_metrics_source", "collect_metrics"]
@@ -0,0 +1,130 @@
+# app/core/sql_stats.py
+
+"""
+Per-request SQL statement counts and database time.
+
+`app.core.database` hooks every engine's cursor events into `record_statement`.
+`SQLStatsMiddleware` opens an accumulator for each HTTP request (a context
+variable, which follows the request into the threadpool and into
+`AsyncSession.run_sync`), aggregates the totals per route for `/metrics`
+and, with SQL_STATS_HEADER=true, reports them on the response:
+
+    X-DB-Query-Count: 3
+    Server-Timing: db;dur=1.84;desc="3 queries"
+"""
+
+import os
+import threading
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from app.core.metrics import register_metrics_source
+
+
+class QueryStats:
+    """Statements and seconds spent in the database by one request."""
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+_CURRENT: ContextVar[Optional[QueryStats]] = ContextVar("sql_query_stats", default=None)
+
+
+def record_statement(seconds: float) -> None:
+    """
+    Add one executed statement to the current request, if any.
+    """
+    stats = _CURRENT.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += seconds
+
+
+class _RouteTotals:
+    """Aggregated statement counts and DB time per route."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, Dict[str, float]] = {}
+
+    def add(self, route: str, stats: QueryStats) -> None:
+        with self._lock:
+            totals = self._routes.setdefault(
+                route, {"requests": 0, "statements": 0, "statements_max": 0, "db_seconds": 0.0}
+            )
+            totals["requests"] += 1
+            totals["statements"] += stats.count
+            totals["statements_max"] = max(totals["statements_max"], stats.count)
+            totals["db_seconds"] += stats.seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                route: {
+                    "requests": int(t["requests"]),
+                    "statements": int(t["statements"]),
+                    "statements_max": int(t["statements_max"]),
+                    "statements_avg": round(t["statements"] / t["requests"], 3),
+                    "db_seconds": round(t["db_seconds"], 6),
+                }
+                for route, t in sorted(self._routes.items())
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+route_totals = _RouteTotals()
+register_metrics_source("sql", route_totals.snapshot)
+
+
+class SQLStatsMiddleware:
+    """
+    ASGI middleware measuring SQL per HTTP request.
+
+    Args:
+        app: The wrapped ASGI application.
+        expose_header (bool | None): Add the stats headers to responses;
+            defaults to the SQL_STATS_HEADER environment variable.
+    """
+
+    def __init__(self, app, expose_header: bool | None = None):
+        self.app = app
+        if expose_header is None:
+            expose_header = os.getenv("SQL_STATS_HEADER", "false").lower() in {"1", "true", "yes"}
+        self.expose_header = expose_header
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _CURRENT.set(stats)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start" and self.expose_header:
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(stats.count).encode()))
+                headers.append((
+                    b"server-timing",
+                    f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries"'.encode(),
+                ))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _CURRENT.reset(token)
+            route = scope.get("route")
+            if route is not None:
+                route_totals.add(f"{scope['method']} {route.path}", stats)
+
+
+__all__ = ["QueryStats", "SQLStatsMiddleware", "record_statement", "route_totals"]
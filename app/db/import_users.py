@@ -0,0 +1,67 @@
+"""
+CLI for bulk user import.
+
+Usage:
+  python -m app.db.import_users users.ndjson
+  python -m app.db.import_users users.csv --batch-size 5000 --workers 8
+  cat users.csv | python -m app.db.import_users - --format csv
+
+Prints one NDJSON line per rejected row and a final summary line.
+Exits with 0 when every row was imported, 2 when some were rejected.
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Sequence
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.services.user_import import IMPORT_BATCH_SIZE, IMPORT_FORMATS, import_users, parse_rows
+
+
+def _executor(kind: str, workers: int) -> Executor:
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+    # bcrypt is CPU-bound: one process per core hashes in parallel
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Parse arguments, stream the file through `import_users` and print the results.
+    """
+    parser = argparse.ArgumentParser(description="Bulk import users from NDJSON or CSV.")
+    parser.add_argument("path", help="Input file, or - for stdin.")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="Defaults to the file extension (csv or ndjson).")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="Rows per INSERT and commit.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Password hashing workers.")
+    parser.add_argument("--executor", choices=("process", "thread"), default="process")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    if args.path == "-":
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace", newline="")
+    else:
+        stream = open(args.path, encoding="utf-8", errors="replace", newline="")
+
+    failed = 0
+    db: Session = SessionLocal()
+    try:
+        with stream, _executor(args.executor, args.workers) as executor:
+            for result in import_users(db, parse_rows(stream, fmt), executor, batch_size=args.batch_size):
+                print(json.dumps(result), flush=True)
+                if result["status"] == "summary":
+                    failed = result["failed"]
+    finally:
+        db.close()
+    return 2 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,8 @@ Public seeding API.
 
 - Exposes `run_seeds(db, include_examples=True)` to seed dictionaries and example data.
 - Must be idempotent; safe to run multiple times.
+- `seed_synthetic_users(db, count, seed=...)` generates large, deterministic
+  datasets for load testing (see `python -m app.db.seeds --help`).
 """
 
 from sqlalchemy.orm import Session
@@ -10,8 +12,9 @@ from sqlalchemy.orm import Session
 from .seed_user_roles import seed_user_roles
 from .seed_languages import seed_languages
 from .seed_example_users import seed_example_users
+from .seed_synthetic_users import seed_synthetic_users
 
-__all__ = ["run_seeds", "seed_user_roles", "seed_languages", "seed_example_users"]
+__all__ = ["run_seeds", "seed_user_roles", "seed_languages", "seed_example_users", "seed_synthetic_users"]
 
 
 def run_seeds(db: Session, *, include_examples: bool = True) -> None:
@@ -3,24 +3,69 @@ CLI runner for seeding.
 
 Usage:
   python -m app.db.seeds
+  python -m app.db.seeds --synthetic 1000000 --seed 42
+  python -m app.db.seeds --synthetic 200000 --roles user=95,admin=5 --languages en=1,es=1
+
+Synthetic users are added after the regular seeds; see
+`app.db.seeds.seed_synthetic_users` for what is generated.
 """
 
+import argparse
 import os
+import sys
+from typing import Dict, Sequence
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal
-from app.db.seeds import run_seeds
+from app.db.seeds import run_seeds, seed_synthetic_users
+
 
+def _weights(value: str) -> Dict[str, float]:
+    """Parse `name=weight,name=weight`."""
+    try:
+        weights = {}
+        for item in value.split(","):
+            key, weight = item.split("=", 1)
+            weights[key.strip()] = float(weight)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Expected name=weight[,name=weight...], got {value!r}") from exc
+    if any(w < 0 for w in weights.values()) or not sum(weights.values()):
+        raise argparse.ArgumentTypeError("Weights must be non-negative and not all zero")
+    return weights
 
-def main() -> None:
+
+def main(argv: Sequence[str] | None = None) -> None:
     """
-    Opens a DB session, runs seeds, and closes the session.
-    Controlled via `SEED_INCLUDE_EXAMPLES` env var (default: true).
+    Opens a DB session, runs seeds (and synthetic users if requested), and closes the session.
+    Example users are controlled via `SEED_INCLUDE_EXAMPLES` env var (default: true).
     """
+    parser = argparse.ArgumentParser(description="Seed dictionaries, example users and synthetic users.")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N", help="Generate N synthetic users.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for synthetic users.")
+    parser.add_argument("--roles", type=_weights, help="Role weights, e.g. user=98,admin=2.")
+    parser.add_argument("--languages", type=_weights, help="Language weights, e.g. en=6,es=3,fr=1.")
+    parser.add_argument("--inactive-ratio", type=float, default=0.05, help="Share of inactive synthetic users.")
+    parser.add_argument("--hash-pool", type=int, default=16, help="Distinct precomputed password hashes.")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Synthetic users per INSERT and commit.")
+    args = parser.parse_args(argv)
+
     include_examples = os.getenv("SEED_INCLUDE_EXAMPLES", "true").lower() in {"1", "true", "yes"}
 
     db: Session = SessionLocal()
     try:
         run_seeds(db, include_examples=include_examples)
+        if args.synthetic > 0:
+            created = seed_synthetic_users(
+                db,
+                args.synthetic,
+                seed=args.seed,
+                role_weights=args.roles,
+                language_weights=args.languages,
+                inactive_ratio=args.inactive_ratio,
+                hash_pool_size=args.hash_pool,
+                batch_size=args.batch_size,
+                progress=lambda done, new: print(f"{done}/{args.synthetic} generated, {new} created", file=sys.stderr),
+            )
+            print(f"Synthetic users created: {created}")
     finally:
         db.close()
 
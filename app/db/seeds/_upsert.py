@@ -0,0 +1,32 @@
+# app/db/seeds/_upsert.py
+
+from typing import Any, Dict, List
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+_ON_CONFLICT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def insert_missing(session: Session, model, key: str, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert the rows whose `key` (compared case-insensitively) is not stored yet.
+
+    One INSERT ... ON CONFLICT DO NOTHING on PostgreSQL and SQLite (the
+    lower() unique indexes raise the conflicts); elsewhere one SELECT of the
+    existing keys followed by one multi-row INSERT.
+    """
+    if not rows:
+        return
+    dialect_insert = _ON_CONFLICT_INSERTS.get(session.get_bind().dialect.name)
+    if dialect_insert is not None:
+        session.execute(dialect_insert(model).values(rows).on_conflict_do_nothing())
+        return
+
+    column = getattr(model, key)
+    wanted = [row[key].lower() for row in rows]
+    existing = set(session.scalars(select(func.lower(column)).where(func.lower(column).in_(wanted))))
+    missing = [row for row in rows if row[key].lower() not in existing]
+    if missing:
+        session.execute(insert(model), missing)
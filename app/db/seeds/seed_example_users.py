@@ -1,6 +1,8 @@
 # app/db/seeds/seed_example_users.py
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
+from app.db.seeds._upsert import insert_missing
 from app.models.user import User
 from app.models.user_role import UserRole
 from app.models.language import Language
@@ -14,28 +16,31 @@ def seed_example_users(session: Session) -> None:
         {"name": "Inactive User", "email": "inactive@example.net", "role": "user", "language": "es", "password": "inactivePassword", "is_active": False}
     ]
 
-    for user_data in examples:
-        if session.query(User).filter_by(email=user_data["email"]).first():
-            continue
+    # Only hash the passwords of users that are not seeded yet
+    existing = set(session.scalars(
+        select(func.lower(User.email)).where(func.lower(User.email).in_([u["email"] for u in examples]))
+    ))
+    missing = [u for u in examples if u["email"] not in existing]
+    if not missing:
+        return
 
-        role = session.query(UserRole).filter_by(name=user_data["role"]).first()
-        if not role:
-            raise ValueError(f"Role '{user_data['role']}' not found. Run seed_user_roles first.")
+    roles = dict(session.execute(select(func.lower(UserRole.name), UserRole.id)).all())
+    languages = dict(session.execute(select(func.lower(Language.code), Language.id)).all())
 
-        lang = session.query(Language).filter_by(code=user_data["language"]).first()
-        if not lang:
+    rows = []
+    for user_data in missing:
+        if user_data["role"] not in roles:
+            raise ValueError(f"Role '{user_data['role']}' not found. Run seed_user_roles first.")
+        if user_data["language"] not in languages:
             raise ValueError(f"Language '{user_data['language']}' not found. Run seed_languages first.")
 
-        hashed = get_password_hash(user_data["password"])
-
-        user = User(
-            name=user_data["name"],
-            email=user_data["email"],
-            hashed_password=hashed,
-            role_id=role.id,
-            language_id=lang.id,
-            is_active=user_data.get("is_active", True)
-        )
-
-        session.add(user)
+        rows.append({
+            "name": user_data["name"],
+            "email": user_data["email"],
+            "hashed_password": get_password_hash(user_data["password"]),
+            "role_id": roles[user_data["role"]],
+            "language_id": languages[user_data["language"]],
+            "is_active": user_data.get("is_active", True),
+        })
 
+    insert_missing(session, User, "email", rows)
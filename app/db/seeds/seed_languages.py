@@ -1,6 +1,7 @@
 # app/db/seeds/seed_languages.py
 
 from sqlalchemy.orm import Session
+from app.db.seeds._upsert import insert_missing
 from app.models.language import Language
 
 
@@ -10,7 +11,4 @@ def seed_languages(session: Session) -> None:
         {"code": "es", "name": "Español"},
         {"code": "fr", "name": "Français"},
     ]
-    for lang in languages:
-        exists = session.query(Language).filter_by(code=lang["code"]).first()
-        if not exists:
-            session.add(Language(**lang))
\ No newline at end of file
+    insert_missing(session, Language, "code", languages)
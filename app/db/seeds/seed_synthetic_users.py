@@ -0,0 +1,124 @@
+# app/db/seeds/seed_synthetic_users.py
+
+"""
+Synthetic users for load and scale testing.
+
+Generates `count` users named `synthetic{i}@example.test` with roles,
+languages and activity drawn from configurable weights. Everything derives
+from `seed`, including the bcrypt salts, so the same arguments always
+produce the same rows. Passwords come from a small pool
+(`synthetic-password-{i % hash_pool_size}`) hashed once up front, and rows
+are written in batches with one existence query and one bulk INSERT (COPY
+on PostgreSQL/psycopg2) per batch. Re-running skips users already present.
+"""
+
+import random
+from itertools import accumulate
+from typing import Callable, Dict, List, Mapping, Optional
+
+import bcrypt
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.language import Language
+from app.models.user import User
+from app.models.user_role import UserRole
+from app.services.user_import import insert_user_rows
+
+DEFAULT_ROLE_WEIGHTS = {"user": 0.98, "admin": 0.019, "superadmin": 0.001}
+DEFAULT_LANGUAGE_WEIGHTS = {"en": 0.6, "es": 0.25, "fr": 0.15}
+
+_FIRST_NAMES = ("Ada", "Alan", "Grace", "Linus", "Barbara", "Ken", "Margaret", "Dennis", "Frances", "Edsger")
+_LAST_NAMES = ("Lovelace", "Turing", "Hopper", "Torvalds", "Liskov", "Thompson", "Hamilton", "Ritchie", "Allen", "Dijkstra")
+_BCRYPT_ALPHABET = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+
+def synthetic_email(index: int) -> str:
+    return f"synthetic{index}@example.test"
+
+
+def synthetic_password(index: int, hash_pool_size: int) -> str:
+    return f"synthetic-password-{index % hash_pool_size}"
+
+
+def _password_hashes(rng: random.Random, size: int) -> List[str]:
+    """bcrypt hashes of the pool passwords, with salts drawn from `rng`."""
+    hashes = []
+    for i in range(size):
+        # 22 salt characters; the last one only carries 2 significant bits
+        salt = "".join(rng.choice(_BCRYPT_ALPHABET) for _ in range(21)) + rng.choice(".Oeu")
+        hashed = bcrypt.hashpw(synthetic_password(i, size).encode("utf-8"), f"$2b$12${salt}".encode())
+        hashes.append(hashed.decode("utf-8"))
+    return hashes
+
+
+def _resolve(session: Session, column, weights: Mapping[str, float], what: str) -> Dict[int, float]:
+    ids = dict(session.execute(select(func.lower(column), column.class_.id)).all())
+    missing = [key for key in weights if key.lower() not in ids]
+    if missing:
+        raise ValueError(f"{what} {', '.join(missing)} not found. Run the dictionary seeds first.")
+    return {ids[key.lower()]: weight for key, weight in weights.items()}
+
+
+def seed_synthetic_users(
+    session: Session,
+    count: int,
+    *,
+    seed: int = 0,
+    role_weights: Optional[Mapping[str, float]] = None,
+    language_weights: Optional[Mapping[str, float]] = None,
+    inactive_ratio: float = 0.05,
+    hash_pool_size: int = 16,
+    batch_size: int = 10000,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Insert the synthetic users that are missing, committing once per batch.
+
+    Args:
+        session (Session): SQLAlchemy session.
+        count (int): Number of synthetic users (indexes 0 to count - 1).
+        seed (int): Random seed; the same seed yields the same users.
+        role_weights (Mapping[str, float] | None): Relative weight per role name.
+        language_weights (Mapping[str, float] | None): Relative weight per language code.
+        inactive_ratio (float): Share of users created inactive.
+        hash_pool_size (int): Distinct passwords (and bcrypt hashes) to cycle through.
+        batch_size (int): Users per existence query, INSERT and commit.
+        progress (Callable[[int, int], None] | None): Called with (generated, created) after each batch.
+
+    Returns:
+        int: Number of users created.
+    """
+    roles = _resolve(session, UserRole.name, role_weights or DEFAULT_ROLE_WEIGHTS, "Role(s)")
+    languages = _resolve(session, Language.code, language_weights or DEFAULT_LANGUAGE_WEIGHTS, "Language(s)")
+    role_ids, role_cum = list(roles), list(accumulate(roles.values()))
+    language_ids, language_cum = list(languages), list(accumulate(languages.values()))
+
+    rng = random.Random(seed)
+    hashes = _password_hashes(rng, hash_pool_size)
+
+    created = 0
+    for start in range(0, count, batch_size):
+        # Rows are drawn for every index, present or not, so the stream never shifts
+        rows = {}
+        for i in range(start, min(start + batch_size, count)):
+            email = synthetic_email(i)
+            rows[email] = {
+                "name": f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)} {i}",
+                "email": email,
+                "hashed_password": hashes[i % hash_pool_size],
+                "is_active": rng.random() >= inactive_ratio,
+                "role_id": rng.choices(role_ids, cum_weights=role_cum)[0],
+                "language_id": rng.choices(language_ids, cum_weights=language_cum)[0],
+            }
+
+        for email in session.scalars(select(User.email).where(func.lower(User.email).in_(list(rows)))):
+            rows.pop(email.lower(), None)
+        if rows:
+            insert_user_rows(session, list(rows.values()))
+            session.commit()
+            created += len(rows)
+        if progress is not None:
+            progress(min(start + batch_size, count), created)
+    return created
+
@@ -1,6 +1,7 @@
 # app/db/seeds/seed_user_roles.py
 
 from sqlalchemy.orm import Session
+from app.db.seeds._upsert import insert_missing
 from app.models.user_role import UserRole
 
 
@@ -10,7 +11,4 @@ def seed_user_roles(session: Session) -> None:
         {"name": "admin", "description": "Administrator"},
         {"name": "superadmin", "description": "Super administrator"},
     ]
-    for role in roles:
-        exists = session.query(UserRole).filter_by(name=role["name"]).first()
-        if not exists:
-            session.add(UserRole(**role))
+    insert_missing(session, UserRole, "name", roles)
@@ -1,12 +1,36 @@
 # app/main.py
 
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.routes import auth_routes, health_routes, user_routes, admin_user_routes, example_users_routes
+from app.core.database import run_replica_health_checks, warm_up_pool
+from app.core.sql_stats import SQLStatsMiddleware
+from app.routes import (
+    auth_routes, health_routes, metrics_routes, user_routes, admin_user_routes,
+    example_users_routes, token_routes, verify_routes, well_known_routes,
+)
+from app.services.reference_data import preload_reference_data
+from app.utils.security import shutdown_hash_executor, shutdown_import_hash_executor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    # Open pooled DB connections before serving traffic
+    await warm_up_pool()
+    await preload_reference_data()
+    replica_health = asyncio.create_task(run_replica_health_checks())
+    yield
+    replica_health.cancel()
+    # Release password hashing workers (threads or processes)
+    shutdown_hash_executor()
+    shutdown_import_hash_executor()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 # --- CORS setup ---
 # Parse ALLOWED_ORIGINS as CSV; fallback to localhost dev if unset/empty.
@@ -25,14 +49,21 @@ app.add_middleware(
     max_age=600,
 )
 
+# Per-request SQL statement count and DB time (metrics, optional headers)
+app.add_middleware(SQLStatsMiddleware)
+
 @app.get("/")
-def read_root():
+async def read_root():
     """Simple liveness endpoint."""
     return {"message": "Auth Control API is running"}
 
 # Routers
 app.include_router(auth_routes.router)
+app.include_router(token_routes.router)
+app.include_router(verify_routes.router)
 app.include_router(user_routes.router)
 app.include_router(admin_user_routes.router)
 app.include_router(example_users_routes.router)
 app.include_router(health_routes.router)
+app.include_router(metrics_routes.router)
+app.include_router(well_known_routes.router)
@@ -1,8 +1,9 @@
 # app/models/language.py
 
-from sqlalchemy import Column, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Index, func
+from sqlalchemy.orm import relationship, validates
 from app.core.database import Base
+from app.utils.normalization import normalize_key
 
 class Language(Base):
     __tablename__ = "languages"
@@ -11,3 +12,11 @@ class Language(Base):
     code = Column(String, unique=True, nullable=False)  # e.g. 'en', 'es', 'fr'
     name = Column(String, nullable=False)
     users = relationship("User", back_populates="language")
+
+    __table_args__ = (
+        Index("ix_languages_code_lower", func.lower(code), unique=True),
+    )
+
+    @validates("code")
+    def _normalize_code(self, key, value):
+        return normalize_key(value) if value is not None else value
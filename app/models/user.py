@@ -1,11 +1,12 @@
 # app/models/user.py
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Index
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from app.core.database import Base
 from app.models.user_role import UserRole
 from app.models.language import Language
+from app.utils.normalization import normalize_email
 
 
 class User(Base):
@@ -13,7 +14,8 @@ class User(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
-    email = Column(String, unique=True, index=True, nullable=False)
+    # Stored normalized; unique case-insensitively through ix_users_email_lower
+    email = Column(String, nullable=False)
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
     role_id = Column(Integer, ForeignKey("user_roles.id"), nullable=False)
@@ -21,3 +23,19 @@ class User(Base):
     language_id = Column(Integer, ForeignKey("languages.id"), nullable=False)
     language = relationship("Language", back_populates="users")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Bumped whenever previously issued tokens must stop authorizing (stateless mode)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0", index=True)
+    # When token_version was last bumped (UTC); drives the incremental revocation sync
+    token_version_changed_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
+    __table_args__ = (
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+        # Keyset pagination by id under each listing filter (app/services/user_listing.py)
+        Index("ix_users_role_id_id", role_id, id),
+        Index("ix_users_language_id_id", language_id, id),
+        Index("ix_users_is_active_id", is_active, id),
+    )
+
+    @validates("email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value) if value is not None else value
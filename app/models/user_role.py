@@ -1,8 +1,9 @@
 # app/models/user_role.py
 
-from sqlalchemy import Column, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Index, func
+from sqlalchemy.orm import relationship, validates
 from app.core.database import Base
+from app.utils.normalization import normalize_key
 
 class UserRole(Base):
     __tablename__ = "user_roles"
@@ -10,4 +11,12 @@ class UserRole(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, nullable=False)
     description = Column(String, nullable=True)
-    users = relationship("User", back_populates="role")
\ No newline at end of file
+    users = relationship("User", back_populates="role")
+
+    __table_args__ = (
+        Index("ix_user_roles_name_lower", func.lower(name), unique=True),
+    )
+
+    @validates("name")
+    def _normalize_name(self, key, value):
+        return normalize_key(value) if value is not None else value
\ No newline at end of file
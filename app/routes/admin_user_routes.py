@@ -1,14 +1,36 @@
 # app/routes/admin_user_routes.py
 
-from fastapi import APIRouter, Depends, status
-from pydantic import BaseModel, Field, ConfigDict
+import io
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Iterator, Literal
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db, run_db
 from app.models.user import User
-from app.models.language import Language
-from app.services.users import get_current_admin_or_superadmin_user
+from app.services.reference_data import reference_data
+from app.services.token_revocations import revocations
+from app.services.user_bulk_update import bulk_update_users
+from app.services.user_export import export_users
+from app.services.user_import import import_users, parse_rows
+from app.services.user_listing import decode_cursor, list_users
+from app.services.user_queries import update_user_returning
+from app.services.users import (
+    clear_principal_cache,
+    get_current_admin_or_superadmin_user,
+    invalidate_principal,
+)
 from app.utils.response import json_response
+from app.utils.security import get_import_hash_executor
 
 router = APIRouter(prefix="/users", tags=["Admin Users"])
 
@@ -36,11 +58,336 @@ class AdminUserPartialUpdate(BaseModel):
     )
 
 
+class AdminUserFilter(BaseModel):
+    """
+    Selects users by attributes for a bulk update (all given fields must match).
+    """
+    model_config = ConfigDict(extra="forbid")
+
+    role: str | None = Field(default=None, description="Role name (case-insensitive).")
+    language: str | None = Field(default=None, description="Language code (case-insensitive).")
+    is_active: bool | None = Field(default=None, description="Active status flag.")
+
+    @model_validator(mode="after")
+    def _not_empty(self):
+        if self.role is None and self.language is None and self.is_active is None:
+            raise ValueError("filter needs at least one of role, language, is_active")
+        return self
+
+
+class AdminUserBulkUpdate(BaseModel):
+    """
+    Bulk update payload: exactly one of `user_ids` or `filter`, plus the changes.
+    """
+    model_config = ConfigDict(extra="forbid")
+
+    user_ids: list[int] | None = Field(default=None, min_length=1, max_length=10000)
+    filter: AdminUserFilter | None = None
+    changes: AdminUserPartialUpdate
+    dry_run: bool = Field(default=False, description="Only report the matching users.")
+
+    @model_validator(mode="after")
+    def _one_selector(self):
+        if (self.user_ids is None) == (self.filter is None):
+            raise ValueError("provide exactly one of user_ids or filter")
+        return self
+
+
+@router.get("")
+async def admin_list_users(
+    limit: int = Query(50, ge=1, le=500, description="Page size."),
+    cursor: str | None = Query(None, description="`next_cursor` of the previous page."),
+    order: Literal["asc", "desc"] = Query("asc", description="By id; desc lists newest first."),
+    role: str | None = Query(None, description="Role name (case-insensitive)."),
+    language: str | None = Query(None, description="Language code (case-insensitive)."),
+    is_active: bool | None = Query(None, description="Active status flag."),
+    db: Session | AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_admin_or_superadmin_user)
+):
+    """
+    Lists users page by page (admin scope).
+
+    Rules
+    -----
+    - Keyset pagination: pass `data.next_cursor` back as `cursor` until it is null.
+    - Optional filters on role, language and is_active; unknown values match nobody.
+    - Password hashes are never read.
+    - Requires admin or superadmin.
+
+    Responses follow the standard envelope: success, message, data.
+    """
+    return await run_db(db, _admin_list_users, limit, cursor, order, role, language, is_active)
+
+
+def _admin_list_users(
+    db: Session,
+    limit: int,
+    cursor: str | None,
+    order: str,
+    role: str | None,
+    language: str | None,
+    is_active: bool | None,
+) -> JSONResponse:
+    """
+    Read one page of users (see `admin_list_users`) and build the response.
+    """
+    try:
+        after_id = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        return json_response(False, "Invalid cursor", status.HTTP_400_BAD_REQUEST)
+
+    # Names and codes resolve to ids in memory; the query filters on indexed ids
+    role_ref = reference_data.role(db, role) if role else None
+    language_ref = reference_data.language(db, language) if language else None
+    if (role and role_ref is None) or (language and language_ref is None):
+        return json_response(True, "Users retrieved successfully", data={"users": [], "next_cursor": None})
+
+    rows, next_cursor = list_users(
+        db,
+        limit=limit,
+        after_id=after_id,
+        descending=order == "desc",
+        role_id=role_ref.id if role_ref else None,
+        language_id=language_ref.id if language_ref else None,
+        is_active=is_active,
+    )
+
+    users = [
+        {
+            "user_id": row["id"],
+            "user_name": row["name"],
+            "user_email": row["email"],
+            "user_role": getattr(reference_data.role_by_id(db, row["role_id"]), "name", None),
+            "user_language": getattr(reference_data.language_by_id(db, row["language_id"]), "code", None),
+            "is_active": row["is_active"],
+            "created_at": row["created_at"].isoformat() if row["created_at"] else None,
+        }
+        for row in rows
+    ]
+    return json_response(
+        success=True,
+        message="Users retrieved successfully",
+        data={"users": users, "next_cursor": next_cursor},
+    )
+
+
+@router.get("/export")
+async def admin_export_users(
+    format: Literal["csv", "ndjson"] = Query("csv", description="Output format."),
+    current_user=Depends(get_current_admin_or_superadmin_user)
+):
+    """
+    Streams every user as CSV or NDJSON (admin scope).
+
+    Columns: id, name, email, role, language, is_active, created_at.
+    Rows are read through a server-side cursor in batches, so memory use does
+    not grow with the table. Requires admin or superadmin.
+    """
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _stream_export(format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="users.{format}"'},
+    )
+
+
+def _stream_export(fmt: str) -> Iterator[str]:
+    """
+    Run the export with its own session: the response outlives the request's dependencies.
+    """
+    db = SessionLocal()
+    try:
+        yield from export_users(db, fmt)
+    finally:
+        db.close()
+
+
+# Request bodies above this size are spooled to disk while importing
+IMPORT_SPOOL_MAX_MEMORY = int(os.getenv("IMPORT_SPOOL_MAX_MEMORY", str(8 * 1024 * 1024)))
+# Larger import bodies are rejected with 413
+IMPORT_MAX_BYTES = int(os.getenv("IMPORT_MAX_BYTES", str(256 * 1024 * 1024)))
+
+
+@router.post("/import")
+async def admin_import_users(
+    request: Request,
+    format: Literal["ndjson", "csv"] | None = Query(
+        None, description="Body format; defaults to csv for text/csv, otherwise ndjson."
+    ),
+    current_user=Depends(get_current_admin_or_superadmin_user)
+):
+    """
+    Creates users from an NDJSON or CSV body (admin scope).
+
+    Rules
+    -----
+    - Fields: name, email, password, role (default user), language (default en), is_active.
+    - The body is spooled (to disk past IMPORT_SPOOL_MAX_MEMORY) and imported in
+      batches; each batch is hashed in parallel on the import hashing pool
+      (IMPORT_HASH_WORKERS, separate from the login pool) and committed on its own.
+    - The response is NDJSON streamed while importing: one line per rejected row
+      (`status: "error"`, line number, reason), then a `status: "summary"` line.
+    - Bodies over IMPORT_MAX_BYTES are rejected with 413.
+    - Requires admin or superadmin.
+    """
+    if format is None:
+        format = "csv" if request.headers.get("content-type", "").startswith("text/csv") else "ndjson"
+
+    too_large = json_response(
+        False, f"Import body exceeds {IMPORT_MAX_BYTES} bytes", status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    )
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > IMPORT_MAX_BYTES:
+        return too_large
+
+    spool = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_MEMORY)
+    try:
+        received = 0
+        async for chunk in request.stream():
+            # Chunked bodies carry no Content-Length: enforce the limit while reading
+            received += len(chunk)
+            if received > IMPORT_MAX_BYTES:
+                spool.close()
+                return too_large
+            await run_in_threadpool(spool.write, chunk)
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+
+    return StreamingResponse(_stream_import(spool, format), media_type="application/x-ndjson")
+
+
+def _stream_import(spool, fmt: str) -> Iterator[str]:
+    """
+    Run the import over the spooled body, yielding NDJSON result lines.
+
+    Uses its own session: the response outlives the request's dependencies.
+    """
+    db = SessionLocal()
+    try:
+        stream = io.TextIOWrapper(spool, encoding="utf-8", errors="replace", newline="")
+        for result in import_users(db, parse_rows(stream, fmt), get_import_hash_executor()):
+            yield json.dumps(result) + "\n"
+    finally:
+        db.close()
+        spool.close()
+
+
+@router.patch("")
+async def admin_bulk_update_users(
+    payload: AdminUserBulkUpdate,
+    db: Session | AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_admin_or_superadmin_user)
+):
+    """
+    Applies the same partial update to many users (admin scope).
+
+    Rules
+    -----
+    - Targets are `user_ids` or a `filter` on role, language and is_active.
+    - Changes follow the single-user PATCH rules (language and role must exist).
+    - One SELECT and one UPDATE per chunk of ids, all in one transaction.
+    - `dry_run` reports the matching users without writing.
+    - `user_ids` mode lists a result per id; filter mode only returns the count.
+    - Requires admin or superadmin.
+
+    Responses follow the standard envelope: success, message, data.
+    """
+    return await run_db(db, _admin_bulk_update, payload)
+
+
+def _admin_bulk_update(db: Session, payload: AdminUserBulkUpdate) -> JSONResponse:
+    """
+    Resolve a bulk update (see `admin_bulk_update_users`), apply it and build the response.
+    """
+    changes = payload.changes.model_dump(exclude_none=True)
+    if not changes:
+        return json_response(False, "Empty payload not allowed", status.HTTP_400_BAD_REQUEST)
+
+    # Same validation as the single-user PATCH: blank values are 400, unknown ones 404
+    values: dict = {}
+    if "is_active" in changes:
+        values["is_active"] = changes["is_active"]
+    if "language" in changes:
+        lang_code = str(changes["language"]).strip()
+        if not lang_code:
+            return json_response(False, "Invalid language value", status.HTTP_400_BAD_REQUEST)
+        language = reference_data.language(db, lang_code)
+        if not language:
+            return json_response(False, "Language not found", status.HTTP_404_NOT_FOUND)
+        values["language_id"] = language.id
+    if "role" in changes:
+        role_name = str(changes["role"]).strip()
+        if not role_name:
+            return json_response(False, "Invalid role value", status.HTTP_400_BAD_REQUEST)
+        role = reference_data.role(db, role_name)
+        if not role:
+            return json_response(False, "Role not found", status.HTTP_404_NOT_FOUND)
+        values["role_id"] = role.id
+
+    filters = None
+    if payload.filter is not None:
+        filters = {"is_active": payload.filter.is_active}
+        if payload.filter.role is not None:
+            if not payload.filter.role.strip():
+                return json_response(False, "Invalid role value", status.HTTP_400_BAD_REQUEST)
+            role_ref = reference_data.role(db, payload.filter.role)
+            if not role_ref:
+                return json_response(False, "Role not found", status.HTTP_404_NOT_FOUND)
+            filters["role_id"] = role_ref.id
+        if payload.filter.language is not None:
+            if not payload.filter.language.strip():
+                return json_response(False, "Invalid language value", status.HTTP_400_BAD_REQUEST)
+            language_ref = reference_data.language(db, payload.filter.language)
+            if not language_ref:
+                return json_response(False, "Language not found", status.HTTP_404_NOT_FOUND)
+            filters["language_id"] = language_ref.id
+
+    # Same revocation rule as the single-user update
+    revoke_tokens = values.get("is_active") is False or "role_id" in values
+    started = time.time()
+    result = bulk_update_users(
+        db,
+        values,
+        user_ids=payload.user_ids,
+        filters=filters,
+        revoke_tokens=revoke_tokens,
+        dry_run=payload.dry_run,
+    )
+
+    if not payload.dry_run:
+        if payload.user_ids is not None:
+            for user_id in result.matched:
+                invalidate_principal(user_id)
+            for user_id, version in result.versions.items():
+                revocations.record(user_id, version)
+        else:
+            # A filter may match any number of users: drop every cached
+            # principal and read the new versions back with one incremental sync
+            clear_principal_cache()
+            if revoke_tokens:
+                revocations.sync(db, since=started)
+
+    # Per-id results for explicit ids only; filter mode reports the count
+    status_name = "matched" if payload.dry_run else "updated"
+    results = [{"user_id": i, "status": status_name} for i in result.matched]
+    results += [{"user_id": i, "status": "not_found"} for i in result.not_found]
+    data = {
+        "dry_run": payload.dry_run,
+        "matched": result.count if result.count is not None else len(result.matched),
+        "updated_fields": [f for f in ("is_active", "language", "role") if f in changes],
+        "results": results,
+    }
+    message = "Bulk update dry run" if payload.dry_run else "Users updated"
+    return json_response(success=True, message=message, data=data)
+
+
 @router.patch("/{user_id}")
-def admin_partial_update_user(
+async def admin_partial_update_user(
     user_id: int,
     payload: AdminUserPartialUpdate,
-    db: Session = Depends(get_db),
+    db: Session | AsyncSession = Depends(get_db),
     current_user=Depends(get_current_admin_or_superadmin_user)
 ):
     """
@@ -55,25 +402,31 @@ def admin_partial_update_user(
 
     Responses follow the standard envelope: success, message, data.
     """
-    # Fetch target user
-    user = db.query(User).filter_by(id=user_id).first()
-    if not user:
-        return json_response(False, "User not found", status.HTTP_404_NOT_FOUND)
+    return await run_db(db, _admin_partial_update, user_id, payload)
+
 
+def _admin_partial_update(db: Session, user_id: int, payload: AdminUserPartialUpdate) -> JSONResponse:
+    """
+    Apply an admin partial update (see `admin_partial_update_user`) and build the response.
+
+    The payload is validated against the cached reference data first, then
+    applied with a single UPDATE ... RETURNING (no SELECT, refresh or lazy loads).
+    """
     # Reject empty payloads
     changes = payload.model_dump(exclude_none=True)
     if not changes:
         return json_response(False, "Empty payload not allowed", status.HTTP_400_BAD_REQUEST)
 
-    # Apply updates conditionally
+    # Collect the column values
     # Track what changed to craft a clear message if needed
+    values: dict = {}
     updated_fields: list[str] = []
 
     # 1) is_active
     if "is_active" in changes:
         if not isinstance(changes["is_active"], bool):
             return json_response(False, "Invalid is_active value", status.HTTP_400_BAD_REQUEST)
-        user.is_active = bool(changes["is_active"])
+        values["is_active"] = bool(changes["is_active"])
         updated_fields.append("is_active")
 
     # 2) language
@@ -82,12 +435,12 @@ def admin_partial_update_user(
         if not lang_code:
             return json_response(False, "Invalid language value", status.HTTP_400_BAD_REQUEST)
 
-        # Case-insensitive match against Language table
-        language = db.query(Language).filter(Language.code.ilike(lang_code)).first()
+        # Case-insensitive match against the cached languages
+        language = reference_data.language(db, lang_code)
         if not language:
             return json_response(False, "Language not found", status.HTTP_404_NOT_FOUND)
 
-        user.language = language
+        values["language_id"] = language.id
         updated_fields.append("language")
 
     # 3) role
@@ -96,29 +449,39 @@ def admin_partial_update_user(
         if not role_name:
             return json_response(False, "Invalid role value", status.HTTP_400_BAD_REQUEST)
 
-        # Late import to avoid circulars if any
-        from app.models.user_role import UserRole as RoleModel
-
-        role = db.query(RoleModel).filter(RoleModel.name.ilike(role_name)).first()
+        role = reference_data.role(db, role_name)
         if not role:
             return json_response(False, "Role not found", status.HTTP_404_NOT_FOUND)
 
-        user.role_id = role.id
+        values["role_id"] = role.id
         updated_fields.append("role")
 
     # Persist only if something changed (safety)
     if not updated_fields:
         return json_response(False, "No valid fields to update", status.HTTP_400_BAD_REQUEST)
 
+    # Deactivation and role changes must revoke previously issued tokens
+    revoke_tokens = values.get("is_active") is False or "role" in updated_fields
+    if revoke_tokens:
+        values["token_version"] = User.token_version + 1
+        values["token_version_changed_at"] = datetime.now(timezone.utc)
+
+    user = update_user_returning(db, user_id, values)
+    if user is None:
+        db.rollback()
+        return json_response(False, "User not found", status.HTTP_404_NOT_FOUND)
+
     db.commit()
-    db.refresh(user)
+    invalidate_principal(user_id)
+    if revoke_tokens:
+        revocations.record(user.id, user.token_version)
 
     # Build response data snapshot
     data = {
         "user_id": user.id,
-        "user_role": getattr(user.role, "name", None),
-        "user_language": getattr(user.language, "code", None),
-        "is_active": getattr(user, "is_active", None),
+        "user_role": getattr(reference_data.role_by_id(db, user.role_id), "name", None),
+        "user_language": getattr(reference_data.language_by_id(db, user.language_id), "code", None),
+        "is_active": user.is_active,
         "updated_fields": updated_fields,
     }
 
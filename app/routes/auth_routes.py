@@ -1,38 +1,114 @@
 # app/routes/auth_routes.py
 
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.schemas.auth_schema import LoginRequest
-from app.core.database import get_db
+from app.schemas.auth_schema import LoginRequest, RefreshTokenRequest
+from app.core.admission import AdmissionRejected, get_password_verification_limiter
+from app.core.database import get_db, run_db
 from app.models.user import User
-from app.utils.security import verify_password, create_access_token
+from app.services.refresh_tokens import RefreshTokenError, issue_refresh_token, rotate_refresh_token
+from app.services.user_queries import login_user
+from app.services.users import principal_claims
+from app.utils.security import verify_password_async, create_access_token
+from app.utils.normalization import normalize_email
 from app.utils.response import json_response
 
 router = APIRouter(tags=["Auth"])
 
+
+def _get_login_user(db: Session, email: str) -> User | None:
+    """
+    Fetch the user for a login attempt, loading the fields the response needs.
+
+    Role and language are joined into the same SELECT, so building the
+    response and the claims never lazy-loads (one query per login). The
+    email matches case-insensitively through `ix_users_email_lower`.
+    Uses the prebuilt statement from `app.services.user_queries`.
+    Runs through `run_db` so the event loop never blocks on the DB.
+    """
+    return login_user(db, normalize_email(email))
+
+
+def _issue_login_refresh_token(db: Session, user_id: int) -> str:
+    """
+    Start a new refresh token family for a successful login and commit it.
+    """
+    refresh_token = issue_refresh_token(db, user_id)
+    db.commit()
+    return refresh_token
+
+
 @router.post("/login")
-def login(request: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == request.email).first()
+async def login(request: LoginRequest, db: Session | AsyncSession = Depends(get_db)):
+    user = await run_db(db, _get_login_user, request.email)
 
     if not user:
         return json_response(False, "Invalid credentials", status.HTTP_401_UNAUTHORIZED)
 
-    if not verify_password(request.password, user.hashed_password):
+    # bcrypt runs on the dedicated hashing executor, not the request threadpool,
+    # and only once admitted by the limiter (shed with 503 under overload)
+    try:
+        async with get_password_verification_limiter().slot():
+            password_ok = await verify_password_async(request.password, user.hashed_password)
+    except AdmissionRejected as exc:
+        return json_response(
+            False,
+            "Too many login attempts, retry later",
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    if not password_ok:
         return json_response(False, "Invalid credentials", status.HTTP_401_UNAUTHORIZED)
     
     if not user.is_active:
         return json_response(False, "Inactive user", status.HTTP_403_FORBIDDEN)
 
-    access_token = create_access_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data=principal_claims(user))
+    data = {
+        "access_token": access_token,
+        "user_name": user.name,
+        "user_email": user.email,
+        "user_role": user.role.name if user.role else None,
+        "user_language": user.language.code if user.language else None,
+    }
+    # Issued last: committing expires the loaded user attributes
+    data["refresh_token"] = await run_db(db, _issue_login_refresh_token, user.id)
 
     return json_response(
         success=True,
         message="Login successful",
+        data=data,
+    )
+
+
+def _refresh_token_pair(db: Session, raw: str) -> tuple[str, str]:
+    """
+    Rotate a refresh token and sign a new access token for its owner.
+    """
+    user, refresh_token = rotate_refresh_token(db, raw)
+    return create_access_token(data=principal_claims(user)), refresh_token
+
+
+@router.post("/token/refresh")
+async def refresh_access_token(request: RefreshTokenRequest, db: Session | AsyncSession = Depends(get_db)):
+    """
+    Exchange a refresh token for a new access/refresh token pair.
+
+    - Costs one indexed lookup by token digest (no password hashing).
+    - The presented refresh token is consumed; reusing it revokes its family.
+    """
+    try:
+        access_token, refresh_token = await run_db(db, _refresh_token_pair, request.refresh_token)
+    except RefreshTokenError as exc:
+        return json_response(False, exc.message, exc.status_code)
+
+    return json_response(
+        success=True,
+        message="Token refreshed",
         data={
             "access_token": access_token,
-            "user_name": user.name,
-            "user_email": user.email,
-            "user_role": user.role.name if user.role else None,
-            "user_language": user.language.code if user.language else None,
+            "refresh_token": refresh_token,
         }
     )
@@ -1,16 +1,50 @@
 # app/routes/example_users_routes.py
 
 from fastapi import APIRouter, Depends
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import get_db, run_db
+from app.models.language import Language
 from app.models.user import User
+from app.models.user_role import UserRole
 from app.utils.response import json_response
 
 router = APIRouter(tags=["Users"])
 
 
+def _load_example_users(db: Session, example_emails: list[str], passwords: dict[str, str]) -> list[dict]:
+    """
+    Retrieve the example users and format them for the response payload.
+
+    A single projected query returns only the needed columns, with role and
+    language joined in, instead of loading users and lazy-loading relations.
+    """
+    rows = (
+        db.query(User.id, User.name, User.email, Language.code, UserRole.name, User.is_active)
+        .outerjoin(Language, User.language_id == Language.id)
+        .outerjoin(UserRole, User.role_id == UserRole.id)
+        .filter(func.lower(User.email).in_(example_emails))
+        .all()
+    )
+
+    # Format response payload
+    data = []
+    for user_id, name, email, language_code, role_name, is_active in rows:
+        data.append({
+            "user_id": user_id,
+            "user_name": name,
+            "user_email": email,
+            "user_password": passwords.get(email),
+            "user_language": language_code,
+            "user_role": role_name,
+            "user_active": is_active
+        })
+    return data
+
+
 @router.get("/users/examples")
-def get_example_users(db: Session = Depends(get_db)):
+async def get_example_users(db: Session | AsyncSession = Depends(get_db)):
     """
     Returns a list of predefined example users.
 
@@ -19,7 +53,7 @@ def get_example_users(db: Session = Depends(get_db)):
     - Includes additional fields: user_id, user_email, user_language, user_role, and is_active status.
 
     Args:
-        db (Session): SQLAlchemy database session.
+        db (Session | AsyncSession): SQLAlchemy database session.
 
     Returns:
         JSONResponse: Response containing a list of example users with credentials and metadata.
@@ -40,21 +74,7 @@ def get_example_users(db: Session = Depends(get_db)):
         "inactive@example.net": "inactivePassword"
     }
 
-    # Retrieve users from the database
-    users = db.query(User).filter(User.email.in_(example_emails)).all()
-
-    # Format response payload
-    data = []
-    for user in users:
-        data.append({
-            "user_id": user.id,
-            "user_name": user.name,
-            "user_email": user.email,
-            "user_password": passwords.get(user.email),
-            "user_language": user.language.code if user.language else None,
-            "user_role": user.role.name if user.role else None,
-            "user_active": user.is_active
-        })
+    data = await run_db(db, _load_example_users, example_emails, passwords)
 
     return json_response(
         success=True,
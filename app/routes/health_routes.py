@@ -5,6 +5,6 @@ from fastapi import APIRouter
 router = APIRouter()
 
 @router.get("/health")
-def health():
+async def health():
     """Liveness endpoint without DB access."""
     return {"status": "ok", "service": "auth-control-api"}
@@ -0,0 +1,12 @@
+# app/routes/metrics_routes.py
+
+from fastapi import APIRouter
+
+from app.core.metrics import collect_metrics
+
+router = APIRouter(tags=["Metrics"])
+
+@router.get("/metrics")
+async def metrics():
+    """In-process runtime metrics for this worker, without DB access."""
+    return collect_metrics()
@@ -0,0 +1,43 @@
+# app/routes/token_routes.py
+
+import hmac
+import os
+from fastapi import APIRouter, Depends, Header, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db, run_db
+from app.schemas.auth_schema import TokenIntrospectionRequest
+from app.services.token_introspection import introspect_tokens
+from app.utils.response import json_response
+
+router = APIRouter(prefix="/tokens", tags=["Tokens"])
+
+# Shared key required from gateways (unset = endpoint is disabled)
+INTROSPECTION_API_KEY = os.getenv("INTROSPECTION_API_KEY")
+
+
+@router.post("/introspect")
+async def introspect(
+    payload: TokenIntrospectionRequest,
+    db: Session | AsyncSession = Depends(get_db),
+    x_api_key: str | None = Header(default=None),
+):
+    """
+    Batch token introspection for API gateways.
+
+    - Accepts up to 500 tokens and returns one result per token, in order.
+    - Subjects are resolved with a single `IN` query over users.
+    - Requires the `X-API-Key` header to match INTROSPECTION_API_KEY; fails
+      closed with 503 while no key is configured.
+    """
+    if not INTROSPECTION_API_KEY:
+        return json_response(False, "Token introspection is not configured", status.HTTP_503_SERVICE_UNAVAILABLE)
+    if not hmac.compare_digest(x_api_key or "", INTROSPECTION_API_KEY):
+        return json_response(False, "Invalid API key", status.HTTP_401_UNAUTHORIZED)
+
+    return json_response(
+        success=True,
+        message="Tokens introspected",
+        data={"tokens": await run_db(db, introspect_tokens, payload.tokens)},
+    )
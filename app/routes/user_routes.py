@@ -1,39 +1,62 @@
 # app/routes/user_routes.py
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.models.user import User
-from app.models.language import Language
+from app.core.database import get_db, run_db
 from app.schemas.user_schema import UpdateUserRequest
-from app.services.users import get_current_user
+from app.services.reference_data import reference_data
+from app.services.user_queries import update_user_returning
+from app.services.users import Principal, get_current_user, invalidate_principal
 from app.utils.response import json_response
 
 router = APIRouter(prefix="/users/me", tags=["User"])
 
-@router.put("")
-def update_user(
-    payload: UpdateUserRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
+def _update_language(db: Session, user_id: int, language_code: str) -> JSONResponse:
     """
-    Update the language preference of the authenticated user.
-    
-    - Requires valid and active authentication.
-    - Returns 400 if the provided language code does not exist.
-    - Returns updated language code on success.
+    Set a user's language by code, commit and build the response.
+
+    One UPDATE ... RETURNING round-trip; the language comes from the registry.
     """
-    language = db.query(Language).filter_by(code=payload.language_code).first()
+    language = reference_data.language(db, language_code)
     if not language:
         return json_response(False, "Language not found", status.HTTP_400_BAD_REQUEST)
 
-    current_user.language_id = language.id
+    row = update_user_returning(db, user_id, {"language_id": language.id})
+    if row is None:
+        # The authenticated user's row is gone
+        db.rollback()
+        invalidate_principal(user_id)
+        # Shaped like the authentication failures of authenticate_token
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Inactive or invalid user",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     db.commit()
-    db.refresh(current_user)
+    invalidate_principal(user_id)
 
     return json_response(
         success=True,
         message="User updated successfully",
         data={"user_language": language.code}
     )
+
+
+@router.put("")
+async def update_user(
+    payload: UpdateUserRequest,
+    db: Session | AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Update the language preference of the authenticated user.
+    
+    - Requires valid and active authentication.
+    - Returns 400 if the provided language code does not exist.
+    - Returns 401 if the user no longer exists.
+    - Returns updated language code on success.
+    """
+    return await run_db(db, _update_language, current_user.id, payload.language_code)
@@ -0,0 +1,62 @@
+# app/routes/verify_routes.py
+
+import os
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.services.users import authenticate_token
+
+router = APIRouter(prefix="/auth", tags=["Auth"])
+
+# How long a reverse proxy may reuse an allow/deny decision for the same token
+VERIFY_CACHE_SECONDS = int(os.getenv("AUTH_VERIFY_CACHE_SECONDS", "5"))
+
+
+def _decision(status_code: int, headers: dict[str, str] | None = None, cacheable: bool = True) -> Response:
+    # Shared-cache directive: proxies skip "private" responses and, without
+    # "public"/s-maxage, responses to requests carrying Authorization.
+    # Vary: Authorization keeps the cached decisions keyed per token.
+    cache_control = f"public, s-maxage={VERIFY_CACHE_SECONDS}" if cacheable else "no-store"
+    return Response(
+        status_code=status_code,
+        headers={"Cache-Control": cache_control, "Vary": "Authorization", **(headers or {})},
+    )
+
+
+@router.get("/verify", response_class=Response, status_code=status.HTTP_204_NO_CONTENT)
+async def verify(
+    request: Request,
+    role: str | None = Query(
+        default=None,
+        description="Comma-separated roles accepted, e.g. 'admin,superadmin'.",
+    ),
+    db: Session | AsyncSession = Depends(get_db),
+):
+    """
+    Minimal auth check for reverse-proxy `auth_request` subrequests.
+
+    - 204 with `X-User-Id` / `X-User-Role` headers when the bearer token is valid.
+    - 401 when the token is missing, invalid, expired or the user is inactive.
+    - 403 when `role` is given and the user's role is not in it.
+    - No body; 204/403 carry a short `Cache-Control` so the proxy can cache them.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return _decision(status.HTTP_401_UNAUTHORIZED, {"WWW-Authenticate": "Bearer"}, cacheable=False)
+
+    try:
+        principal = await authenticate_token(token, db)
+    except HTTPException:
+        return _decision(status.HTTP_401_UNAUTHORIZED, {"WWW-Authenticate": "Bearer"}, cacheable=False)
+
+    if role:
+        accepted = {name.strip().lower() for name in role.split(",") if name.strip()}
+        if (principal.role_name or "").lower() not in accepted:
+            return _decision(status.HTTP_403_FORBIDDEN)
+
+    return _decision(status.HTTP_204_NO_CONTENT, {
+        "X-User-Id": str(principal.id),
+        "X-User-Role": principal.role_name or "",
+    })
@@ -0,0 +1,28 @@
+# app/routes/well_known_routes.py
+
+from fastapi import APIRouter, Request, Response
+
+from app.utils.keyring import get_keyring
+
+router = APIRouter(tags=["Well-known"])
+
+# Downstream verifiers may cache the key set; rotation keeps old keys published
+JWKS_CACHE_CONTROL = "public, max-age=300"
+
+
+@router.get("/.well-known/jwks.json")
+async def jwks(request: Request):
+    """
+    Public signing keys (JWKS) for offline token verification.
+
+    - Served from a document precomputed when the key ring is loaded.
+    - Supports conditional requests through ETag / If-None-Match.
+    - Symmetric (HS*) secrets are never published, so the set may be empty.
+    """
+    keyring = get_keyring()
+    headers = {"Cache-Control": JWKS_CACHE_CONTROL, "ETag": keyring.jwks_etag}
+
+    if request.headers.get("if-none-match") == keyring.jwks_etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=keyring.jwks_json, media_type="application/json", headers=headers)
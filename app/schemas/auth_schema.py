@@ -1,7 +1,15 @@
 # app/schemas/auth_schema.py
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 class LoginRequest(BaseModel):
     email: EmailStr
     password: str
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
+
+
+class TokenIntrospectionRequest(BaseModel):
+    tokens: list[str] = Field(..., min_length=1, max_length=500)
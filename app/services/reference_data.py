@@ -0,0 +1,157 @@
+# app/services/reference_data.py
+
+"""
+In-memory registry of the reference tables (languages and user roles).
+
+Both tables are tiny and only change through the seeds, so each worker
+keeps a snapshot and resolves codes and names with dict lookups instead of
+querying on every profile or admin update. The snapshot is loaded at
+startup, reloaded once it is older than REFERENCE_DATA_TTL_SECONDS
+(default: 300) and can be dropped explicitly with `invalidate()`.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db, run_db
+from app.core.metrics import register_metrics_source
+from app.models.language import Language
+from app.models.user_role import UserRole
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LanguageRef:
+    id: int
+    code: str
+    name: str
+
+
+@dataclass(frozen=True)
+class RoleRef:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    languages: Dict[str, LanguageRef]
+    roles: Dict[str, RoleRef]
+    languages_by_id: Dict[int, LanguageRef]
+    roles_by_id: Dict[int, RoleRef]
+    loaded_at: float
+
+
+class ReferenceDataRegistry:
+    """
+    Case-insensitive lookups of languages by code and roles by name.
+
+    Lookups take the session only to (re)load the snapshot when it is
+    missing or expired; otherwise they do not touch the database.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = threading.Lock()
+        self._loads = 0
+
+    def load(self, db: Session) -> None:
+        """
+        Read both tables and replace the snapshot.
+        """
+        languages: Dict[str, LanguageRef] = {}
+        languages_by_id: Dict[int, LanguageRef] = {}
+        for id_, code, name in db.query(Language.id, Language.code, Language.name).order_by(Language.id):
+            ref = LanguageRef(id=id_, code=code, name=name)
+            # Same precedence as a case-insensitive query: lowest id wins
+            languages.setdefault(code.lower(), ref)
+            languages_by_id[id_] = ref
+
+        roles: Dict[str, RoleRef] = {}
+        roles_by_id: Dict[int, RoleRef] = {}
+        for id_, name in db.query(UserRole.id, UserRole.name).order_by(UserRole.id):
+            ref = RoleRef(id=id_, name=name)
+            roles.setdefault(name.lower(), ref)
+            roles_by_id[id_] = ref
+
+        snapshot = _Snapshot(languages, roles, languages_by_id, roles_by_id, time.monotonic())
+        with self._lock:
+            self._snapshot = snapshot
+            self._loads += 1
+
+    def _current(self, db: Session) -> _Snapshot:
+        snapshot = self._snapshot
+        if snapshot is None or time.monotonic() - snapshot.loaded_at >= self.ttl:
+            self.load(db)
+            snapshot = self._snapshot
+            assert snapshot is not None
+        return snapshot
+
+    def language(self, db: Session, code: str) -> Optional[LanguageRef]:
+        """Return the language with this code (case-insensitive), or None."""
+        return self._current(db).languages.get(code.strip().lower())
+
+    def role(self, db: Session, name: str) -> Optional[RoleRef]:
+        """Return the role with this name (case-insensitive), or None."""
+        return self._current(db).roles.get(name.strip().lower())
+
+    def language_by_id(self, db: Session, language_id: Optional[int]) -> Optional[LanguageRef]:
+        """Return the language with this id, or None."""
+        return self._current(db).languages_by_id.get(language_id) if language_id is not None else None
+
+    def role_by_id(self, db: Session, role_id: Optional[int]) -> Optional[RoleRef]:
+        """Return the role with this id, or None."""
+        return self._current(db).roles_by_id.get(role_id) if role_id is not None else None
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; the next lookup reloads it."""
+        with self._lock:
+            self._snapshot = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return snapshot size and age."""
+        snapshot = self._snapshot
+        return {
+            "loaded": snapshot is not None,
+            "languages": len(snapshot.languages_by_id) if snapshot else 0,
+            "roles": len(snapshot.roles_by_id) if snapshot else 0,
+            "loads": self._loads,
+            "ttl_seconds": self.ttl,
+            "age_seconds": round(time.monotonic() - snapshot.loaded_at, 3) if snapshot else None,
+        }
+
+
+reference_data = ReferenceDataRegistry(
+    ttl=float(os.getenv("REFERENCE_DATA_TTL_SECONDS", "300")),
+)
+register_metrics_source("reference_data", reference_data.stats)
+
+
+async def preload_reference_data() -> None:
+    """
+    Load the registry at startup. Failures are logged; lookups load lazily.
+    """
+    if not os.getenv("DATABASE_URL"):
+        return
+    try:
+        async for db in get_db():
+            await run_db(db, reference_data.load)
+    except Exception:
+        logger.warning("Reference data preload failed", exc_info=True)
+
+
+__all__ = [
+    "LanguageRef",
+    "RoleRef",
+    "ReferenceDataRegistry",
+    "reference_data",
+    "preload_reference_data",
+]
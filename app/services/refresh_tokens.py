@@ -0,0 +1,155 @@
+# app/services/refresh_tokens.py
+
+"""
+Opaque refresh tokens with rotation and reuse detection.
+
+- Tokens are random strings; only their SHA-256 digest is stored, so a
+  refresh costs one indexed lookup instead of a bcrypt verification.
+- Every refresh marks the presented token as used and issues a new one
+  in the same family.
+- Presenting a used or revoked token is treated as theft: the whole family
+  is revoked and the caller must log in again.
+"""
+
+import hashlib
+import os
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.db_routing import use_primary
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
+
+
+class RefreshTokenError(Exception):
+    """
+    Raised when a refresh token cannot be exchanged.
+
+    Attributes:
+        message (str): Client-facing error message.
+        status_code (int): HTTP status to respond with.
+    """
+
+    def __init__(self, message: str, status_code: int = 401):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+def hash_refresh_token(token: str) -> str:
+    """
+    Return the SHA-256 hex digest used to store and look up a refresh token.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes even for timezone-aware columns
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def issue_refresh_token(db: Session, user_id: int, family_id: str | None = None) -> str:
+    """
+    Create a refresh token for a user and add it to the session.
+
+    The caller is responsible for committing.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        user_id (int): Owner of the token.
+        family_id (str | None): Family to continue; a new one is started if None.
+
+    Returns:
+        str: The raw refresh token (only ever returned to the client).
+    """
+    raw = secrets.token_urlsafe(48)
+    db.add(RefreshToken(
+        user_id=user_id,
+        token_hash=hash_refresh_token(raw),
+        family_id=family_id or uuid.uuid4().hex,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    ))
+    return raw
+
+
+def revoke_family(db: Session, family_id: str) -> None:
+    """
+    Revoke every still-valid token of a family. The caller commits.
+    """
+    db.query(RefreshToken).filter(
+        RefreshToken.family_id == family_id,
+        RefreshToken.revoked_at.is_(None),
+    ).update({"revoked_at": datetime.now(timezone.utc)}, synchronize_session=False)
+
+
+def rotate_refresh_token(db: Session, raw: str) -> tuple[User, str]:
+    """
+    Exchange a refresh token for a new one (single use) and commit.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        raw (str): Refresh token presented by the client.
+
+    Returns:
+        tuple[User, str]: The token owner (role and language loaded) and the
+        new raw refresh token.
+
+    Raises:
+        RefreshTokenError: If the token is unknown, expired, reused or its
+        owner is inactive.
+    """
+    # The token may have been issued moments ago: skip replicas
+    use_primary(db)
+    token = (
+        db.query(RefreshToken)
+        .options(joinedload(RefreshToken.user).joinedload(User.role),
+                 joinedload(RefreshToken.user).joinedload(User.language))
+        .filter(RefreshToken.token_hash == hash_refresh_token(raw))
+        .first()
+    )
+    if token is None:
+        raise RefreshTokenError("Invalid refresh token")
+
+    now = datetime.now(timezone.utc)
+    family_id = token.family_id
+
+    if token.used_at is not None or token.revoked_at is not None:
+        revoke_family(db, family_id)
+        db.commit()
+        raise RefreshTokenError("Refresh token reuse detected")
+
+    if _as_utc(token.expires_at) <= now:
+        raise RefreshTokenError("Refresh token expired")
+
+    user = token.user
+    if user is None or not user.is_active:
+        raise RefreshTokenError("Inactive user", status_code=403)
+
+    # Conditional update so two concurrent refreshes cannot both succeed
+    claimed = db.query(RefreshToken).filter(
+        RefreshToken.id == token.id,
+        RefreshToken.used_at.is_(None),
+    ).update({"used_at": now}, synchronize_session=False)
+    if claimed != 1:
+        db.rollback()
+        revoke_family(db, family_id)
+        db.commit()
+        raise RefreshTokenError("Refresh token reuse detected")
+
+    new_raw = issue_refresh_token(db, user.id, family_id=family_id)
+    db.commit()
+    return user, new_raw
+
+
+__all__ = [
+    "RefreshTokenError",
+    "hash_refresh_token",
+    "issue_refresh_token",
+    "revoke_family",
+    "rotate_refresh_token",
+]
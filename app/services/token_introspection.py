@@ -0,0 +1,65 @@
+# app/services/token_introspection.py
+
+"""Batch token introspection for API gateways."""
+
+from typing import Any, Dict
+
+from jose import ExpiredSignatureError, JWTError
+from sqlalchemy.orm import Session
+
+from app.services.token_revocations import revocations
+from app.services.users import decode_token, load_principals
+
+
+def introspect_tokens(db: Session, tokens: list[str]) -> list[Dict[str, Any]]:
+    """
+    Report the status of many access tokens in one pass.
+
+    - Every token is verified (through the verified-claims cache).
+    - All subjects are resolved together: principal cache first, then a
+      single `IN` query for the rest.
+    - Results keep the order of `tokens`.
+
+    Each result has `active` and, when active, `sub`, `role` and `exp`;
+    inactive results carry an `error` code instead: 'token_expired',
+    'invalid_token', 'token_revoked' or 'inactive_or_invalid_user'.
+    """
+    results: list[Dict[str, Any] | None] = [None] * len(tokens)
+    pending: list[tuple[int, int, Dict[str, Any]]] = []
+
+    for index, token in enumerate(tokens):
+        try:
+            claims = decode_token(token)
+            user_id = int(claims.get("sub"))
+        except ExpiredSignatureError:
+            results[index] = {"active": False, "error": "token_expired"}
+            continue
+        except (JWTError, TypeError, ValueError):
+            results[index] = {"active": False, "error": "invalid_token"}
+            continue
+        pending.append((index, user_id, claims))
+
+    if any(isinstance(claims.get("ver"), int) for _, _, claims in pending):
+        revocations.sync_if_stale(db)
+
+    principals = load_principals(db, {user_id for _, user_id, _ in pending}) if pending else {}
+
+    for index, user_id, claims in pending:
+        version = claims.get("ver")
+        principal = principals.get(user_id)
+        if isinstance(version, int) and revocations.is_revoked(user_id, version):
+            results[index] = {"active": False, "error": "token_revoked"}
+        elif principal is None or not principal.is_active:
+            results[index] = {"active": False, "error": "inactive_or_invalid_user"}
+        else:
+            results[index] = {
+                "active": True,
+                "sub": str(user_id),
+                "role": principal.role_name,
+                "exp": claims.get("exp"),
+            }
+
+    return results  # type: ignore[return-value]
+
+
+__all__ = ["introspect_tokens"]
@@ -0,0 +1,142 @@
+# app/services/token_revocations.py
+
+"""
+In-memory revocation list for stateless authorization.
+
+Tracks, per user id, the latest account version (`users.token_version`).
+A token carrying an older version ('ver' claim) no longer authorizes.
+Each worker records the changes it commits and periodically resyncs from
+the database to pick up changes committed by other workers.
+
+Both stay bounded by the revocations of one access token lifetime:
+
+- a sync only reads the versions bumped since the previous sync
+  (`users.token_version_changed_at`), looking back an extra
+  AUTH_REVOCATION_SYNC_OVERLAP_SECONDS (default: 60) for transactions that
+  commit late or clocks that drift;
+- an entry is dropped once it is older than the access token lifetime
+  (ACCESS_TOKEN_EXPIRE_MINUTES), since every token it could revoke has
+  expired by then.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.metrics import register_metrics_source
+from app.models.user import User
+
+
+def _epoch(value: datetime) -> float:
+    # SQLite returns naive datetimes; they are stored in UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class RevocationList:
+    """
+    Map of user id -> (latest token version, when it was bumped).
+
+    Args:
+        sync_interval (float): Seconds between database resyncs.
+        retention (float | None): Seconds an entry is kept; defaults to the
+            access token lifetime (ACCESS_TOKEN_EXPIRE_MINUTES).
+        overlap (float): Extra seconds each incremental sync looks back.
+    """
+
+    def __init__(self, sync_interval: float, retention: Optional[float] = None, overlap: float = 60.0):
+        self.sync_interval = sync_interval
+        self.retention = retention
+        self.overlap = overlap
+        self._versions: Dict[int, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._synced_at: float | None = None
+        # Wall-clock time of the last sync (the next one reads changes after it)
+        self._watermark: float | None = None
+
+    def _retention_seconds(self) -> float:
+        if self.retention is not None:
+            return self.retention
+        return float(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60")) * 60
+
+    def record(self, user_id: int, version: int, changed_at: float | None = None) -> None:
+        """Remember a committed version bump for a user."""
+        with self._lock:
+            if version > self._versions.get(user_id, (0, 0.0))[0]:
+                self._versions[user_id] = (version, time.time() if changed_at is None else changed_at)
+
+    def is_revoked(self, user_id: int, version: int) -> bool:
+        """Return True if tokens carrying `version` are no longer valid."""
+        entry = self._versions.get(user_id)
+        return entry is not None and version < entry[0]
+
+    def is_stale(self) -> bool:
+        """Return True if the list should be resynced from the database."""
+        return self._synced_at is None or time.monotonic() - self._synced_at >= self.sync_interval
+
+    def sync(self, db: Session, since: float | None = None) -> None:
+        """
+        Read the versions bumped since the last sync and drop expired entries.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            since (float | None): Also read bumps from this wall-clock time on,
+                e.g. the start of a long transaction that just committed.
+        """
+        now = time.time()
+        horizon = now - self._retention_seconds()
+        start = horizon if self._watermark is None else max(horizon, self._watermark - self.overlap)
+        since = start if since is None else max(horizon, min(start, since))
+        rows = (
+            db.query(User.id, User.token_version, User.token_version_changed_at)
+            .filter(User.token_version_changed_at >= datetime.fromtimestamp(since, timezone.utc))
+            .all()
+        )
+        with self._lock:
+            for user_id, version, changed_at in rows:
+                if version > self._versions.get(user_id, (0, 0.0))[0]:
+                    self._versions[user_id] = (version, _epoch(changed_at))
+            for user_id in [u for u, (_, changed_at) in self._versions.items() if changed_at < horizon]:
+                del self._versions[user_id]
+            self._watermark = now
+            self._synced_at = time.monotonic()
+
+    def sync_if_stale(self, db: Session) -> None:
+        """
+        Resync from the database once per sync interval.
+        """
+        if self.is_stale():
+            self.sync(db)
+
+    def clear(self) -> None:
+        """Forget every recorded version and force a full resync."""
+        with self._lock:
+            self._versions.clear()
+            self._synced_at = None
+            self._watermark = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and sync information."""
+        return {
+            "tracked_users": len(self._versions),
+            "sync_interval_seconds": self.sync_interval,
+            "retention_seconds": self._retention_seconds(),
+            "seconds_since_sync": (
+                round(time.monotonic() - self._synced_at, 3) if self._synced_at is not None else None
+            ),
+        }
+
+
+revocations = RevocationList(
+    sync_interval=float(os.getenv("AUTH_REVOCATION_SYNC_SECONDS", "30")),
+    overlap=float(os.getenv("AUTH_REVOCATION_SYNC_OVERLAP_SECONDS", "60")),
+)
+register_metrics_source("token_revocations", revocations.stats)
+
+
+__all__ = ["RevocationList", "revocations"]
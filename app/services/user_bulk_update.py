@@ -0,0 +1,165 @@
+# app/services/user_bulk_update.py
+
+"""
+Set-based admin updates over many users.
+
+Targets are either explicit ids or a filter (role, language, is_active).
+They are processed in chunks of BULK_UPDATE_CHUNK_SIZE ids (default: 1000):
+per chunk one SELECT finds the existing ids and one UPDATE applies every
+requested field at once (plus a SELECT of the new token versions when
+tokens are revoked). All chunks share a single transaction, committed at
+the end, so either every chunk is applied or none is.
+
+Only explicit ids are reported one by one; a filter can match any number
+of users, so filter mode only counts them and memory stays bounded by the
+chunk size.
+"""
+
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
+
+from app.core.db_routing import use_primary
+from app.models.user import User
+
+BULK_UPDATE_CHUNK_SIZE = int(os.getenv("BULK_UPDATE_CHUNK_SIZE", "1000"))
+
+
+@dataclass
+class BulkUpdateResult:
+    """
+    Outcome of a bulk update.
+
+    Attributes:
+        matched (list[int]): Ids that exist (updated unless dry run); id mode only.
+        not_found (list[int]): Requested ids that do not exist; id mode only.
+        versions (dict[int, int]): New token_version per id when tokens were revoked; id mode only.
+        count (int | None): Matching users in filter mode (ids are not listed).
+    """
+
+    matched: List[int] = field(default_factory=list)
+    not_found: List[int] = field(default_factory=list)
+    versions: Dict[int, int] = field(default_factory=dict)
+    count: Optional[int] = None
+
+
+def _chunks(ids: Sequence[int], size: int) -> Iterator[List[int]]:
+    for start in range(0, len(ids), size):
+        yield list(ids[start:start + size])
+
+
+def _filtered(
+    query: Query,
+    role_id: Optional[int] = None,
+    language_id: Optional[int] = None,
+    is_active: Optional[bool] = None,
+) -> Query:
+    if role_id is not None:
+        query = query.filter(User.role_id == role_id)
+    if language_id is not None:
+        query = query.filter(User.language_id == language_id)
+    if is_active is not None:
+        query = query.filter(User.is_active.is_(is_active))
+    return query
+
+
+def _target_chunks(
+    db: Session,
+    user_ids: Optional[Sequence[int]],
+    filters: Dict[str, Any],
+    chunk_size: int,
+    result: BulkUpdateResult,
+) -> Iterator[List[int]]:
+    """Yield the existing target ids chunk by chunk."""
+    if user_ids is not None:
+        for chunk in _chunks(sorted(set(user_ids)), chunk_size):
+            found = {row[0] for row in db.query(User.id).filter(User.id.in_(chunk))}
+            result.not_found.extend(i for i in chunk if i not in found)
+            if found:
+                yield sorted(found)
+        return
+
+    # Keyset walk over the filter, served by the (filter column, id) indexes
+    last_id = 0
+    while True:
+        chunk = [
+            row[0]
+            for row in _filtered(db.query(User.id), **filters)
+            .filter(User.id > last_id)
+            .order_by(User.id)
+            .limit(chunk_size)
+        ]
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1]
+
+
+def bulk_update_users(
+    db: Session,
+    values: Dict[str, Any],
+    *,
+    user_ids: Optional[Sequence[int]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    revoke_tokens: bool = False,
+    dry_run: bool = False,
+    chunk_size: int = BULK_UPDATE_CHUNK_SIZE,
+) -> BulkUpdateResult:
+    """
+    Apply `values` to the targeted users and commit (unless `dry_run`).
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        values (dict): Column values to set (is_active, language_id, role_id).
+        user_ids (Sequence[int] | None): Explicit targets.
+        filters (dict | None): role_id / language_id / is_active filter, used
+            when `user_ids` is None.
+        revoke_tokens (bool): Also bump token_version in the same UPDATE.
+        dry_run (bool): Only report what would be updated.
+        chunk_size (int): Ids per SELECT/UPDATE pair.
+
+    Returns:
+        BulkUpdateResult: Matched and missing ids and bumped versions (by ids),
+        or the number of updated users (by filter).
+    """
+    use_primary(db)
+    filters = filters or {}
+    result = BulkUpdateResult()
+
+    if dry_run and user_ids is None:
+        result.count = _filtered(db.query(func.count(User.id)), **filters).scalar()
+        return result
+
+    if revoke_tokens:
+        values = {
+            **values,
+            "token_version": User.token_version + 1,
+            "token_version_changed_at": datetime.now(timezone.utc),
+        }
+
+    by_ids = user_ids is not None
+    if not by_ids:
+        result.count = 0
+    for chunk in _target_chunks(db, user_ids, filters, chunk_size, result):
+        if by_ids:
+            result.matched.extend(chunk)
+        else:
+            result.count += len(chunk)
+        if dry_run:
+            continue
+        db.query(User).filter(User.id.in_(chunk)).update(values, synchronize_session=False)
+        if revoke_tokens and by_ids:
+            result.versions.update(
+                db.query(User.id, User.token_version).filter(User.id.in_(chunk)).all()
+            )
+
+    if not dry_run:
+        db.commit()
+    return result
+
+
+__all__ = ["BULK_UPDATE_CHUNK_SIZE", "BulkUpdateResult", "bulk_update_users"]
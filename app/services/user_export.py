@@ -0,0 +1,87 @@
+# app/services/user_export.py
+
+"""
+Streaming export of the users table as CSV or NDJSON.
+
+Rows come from one projected SELECT executed with `yield_per`, which turns
+on a server-side cursor (`stream_results`) where the driver supports it and
+fetches EXPORT_BATCH_SIZE rows (default: 1000) at a time. Only plain column
+tuples are produced, so nothing enters the session identity map; role and
+language names come from the reference-data registry. Memory therefore
+stays bounded by one batch regardless of the table size.
+"""
+
+import csv
+import io
+import json
+import os
+from typing import Any, Dict, Iterator, List, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+from app.services.reference_data import reference_data
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+EXPORT_FORMATS = ("csv", "ndjson")
+EXPORT_FIELDS = ("id", "name", "email", "role", "language", "is_active", "created_at")
+
+
+def _batches(db: Session, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the users as lists of export records, one fetched batch at a time."""
+    statement = (
+        select(User.id, User.name, User.email, User.role_id, User.language_id, User.is_active, User.created_at)
+        .order_by(User.id)
+        .execution_options(yield_per=batch_size)
+    )
+    result = db.execute(statement)
+    try:
+        for partition in result.partitions():
+            yield [
+                {
+                    "id": id_,
+                    "name": name,
+                    "email": email,
+                    "role": getattr(reference_data.role_by_id(db, role_id), "name", None),
+                    "language": getattr(reference_data.language_by_id(db, language_id), "code", None),
+                    "is_active": is_active,
+                    "created_at": created_at.isoformat() if created_at else None,
+                }
+                for id_, name, email, role_id, language_id, is_active, created_at in partition
+            ]
+    finally:
+        result.close()
+
+
+def export_users(db: Session, fmt: str, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """
+    Yield the export as text chunks (one chunk per fetched batch, CSV header first).
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        fmt (str): "csv" or "ndjson".
+        batch_size (int): Rows fetched from the cursor per round-trip.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    if fmt == "csv":
+        yield _csv_chunk([list(EXPORT_FIELDS)])
+    for records in _batches(db, batch_size):
+        if fmt == "csv":
+            yield _csv_chunk([[record[f] for f in EXPORT_FIELDS] for record in records])
+        else:
+            yield "".join(json.dumps(record) + "\n" for record in records)
+
+
+def _csv_chunk(rows: Sequence[Sequence[Any]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
+
+
+__all__ = ["EXPORT_BATCH_SIZE", "EXPORT_FIELDS", "EXPORT_FORMATS", "export_users"]
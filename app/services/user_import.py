@@ -0,0 +1,265 @@
+# app/services/user_import.py
+
+"""
+Streaming bulk import of users from NDJSON or CSV.
+
+Rows are read lazily from a text stream and processed in batches of
+IMPORT_BATCH_SIZE (default: 1000):
+
+1. validate fields and normalize the email;
+2. resolve role and language through the reference-data registry;
+3. drop emails already present in the batch or in the database (one query);
+4. hash the passwords in parallel on an executor (a process pool in the CLI);
+5. write the batch with one multi-row INSERT (COPY on PostgreSQL/psycopg2)
+   and commit.
+
+Each batch is committed on its own, so memory stays bounded by the batch
+size. If writing a batch fails (e.g. a concurrent insert of the same email),
+it is rolled back, each of its rows is reported as an error and the import
+continues with the next batch. `import_users` yields one
+result per rejected row and a final summary, which callers stream out as
+NDJSON.
+
+Expected fields: name, email, password, role (default: "user"),
+language (default: "en"), is_active (default: true).
+"""
+
+import csv
+import io
+import json
+import os
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from email_validator import EmailNotValidError, validate_email
+from sqlalchemy import func, insert
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.db_routing import use_primary
+from app.models.user import User
+from app.services.reference_data import reference_data
+from app.utils.normalization import normalize_email
+from app.utils.security import get_password_hash
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+IMPORT_FORMATS = ("ndjson", "csv")
+
+_COLUMNS = ("name", "email", "hashed_password", "is_active", "role_id", "language_id")
+_TRUE = {"1", "true", "yes", "y", "t"}
+_FALSE = {"0", "false", "no", "n", "f"}
+
+# (line number, parsed row) or (line number, error message)
+ParsedRow = Tuple[int, Dict[str, Any] | str]
+
+
+def parse_rows(stream: TextIO, fmt: str) -> Iterator[ParsedRow]:
+    """
+    Lazily parse an NDJSON or CSV stream (CSV needs a header row).
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if fmt == "ndjson":
+        for line_no, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                yield line_no, "Invalid JSON"
+                continue
+            yield line_no, row if isinstance(row, dict) else "Expected a JSON object"
+    elif fmt == "csv":
+        # reader.line_num is not reliable after a csv.Error: count consumed lines
+        consumed = [0]
+
+        def lines() -> Iterator[str]:
+            for line in stream:
+                consumed[0] += 1
+                yield line
+
+        reader = csv.DictReader(lines())
+        try:
+            reader.fieldnames
+        except csv.Error:
+            yield consumed[0], "Malformed CSV header"
+            return
+        while True:
+            # e.g. a field over csv.field_size_limit(): report the row and go on
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error:
+                yield consumed[0], "Malformed CSV row"
+                continue
+            yield consumed[0], row
+    else:
+        raise ValueError(f"Unsupported import format: {fmt}")
+
+
+def _parse_bool(value: Any) -> Optional[bool]:
+    if value is None or value == "":
+        return True
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    return None
+
+
+def _validate(db: Session, row: Dict[str, Any]) -> Dict[str, Any] | str:
+    """Return the column values for a row, or an error message."""
+    name = str(row.get("name") or "").strip()
+    email = str(row.get("email") or "").strip()
+    password = row.get("password")
+    if not name:
+        return "Missing name"
+    if not password or not isinstance(password, str):
+        return "Missing password"
+    if "\x00" in name or "\x00" in email or "\x00" in password:
+        # Text columns (PostgreSQL) cannot store NUL characters
+        return "Invalid NUL character"
+    try:
+        validate_email(email, check_deliverability=False)
+    except EmailNotValidError:
+        return "Invalid email"
+
+    role = reference_data.role(db, str(row.get("role") or "user"))
+    if role is None:
+        return "Role not found"
+    language = reference_data.language(db, str(row.get("language") or "en"))
+    if language is None:
+        return "Language not found"
+    is_active = _parse_bool(row.get("is_active"))
+    if is_active is None:
+        return "Invalid is_active value"
+
+    return {
+        "name": name,
+        "email": normalize_email(email),
+        "password": password,
+        "is_active": is_active,
+        "role_id": role.id,
+        "language_id": language.id,
+    }
+
+
+def _copy_rows(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """Write rows with COPY ... FROM STDIN (PostgreSQL with psycopg2)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([row[column] for column in _COLUMNS])
+    buffer.seek(0)
+    statement = f"COPY users ({', '.join(_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+    dbapi = db.get_bind().dialect.loaded_dbapi
+    cursor = db.connection().connection.driver_connection.cursor()
+    try:
+        cursor.copy_expert(statement, buffer)
+    except dbapi.Error as exc:
+        # Raw driver errors surface like any other statement failure
+        raise DBAPIError.instance(statement, None, exc, dbapi.Error) from exc
+    finally:
+        cursor.close()
+
+
+def insert_user_rows(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Write prepared users rows in one round-trip (COPY on PostgreSQL/psycopg2).
+    """
+    bind = db.get_bind()
+    if bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2":
+        _copy_rows(db, rows)
+    else:
+        # executemany is rendered as multi-row INSERT ... VALUES batches
+        db.execute(insert(User), rows)
+
+
+def _import_batch(
+    db: Session,
+    batch: List[ParsedRow],
+    executor: Executor,
+    stats: Dict[str, int],
+) -> Iterator[Dict[str, Any]]:
+    """Import one batch; yield a result per rejected row."""
+    def reject(line_no: int, error: str, email: Optional[str] = None) -> Dict[str, Any]:
+        stats["failed"] += 1
+        result: Dict[str, Any] = {"line": line_no, "status": "error", "error": error}
+        if email is not None:
+            result["email"] = email
+        return result
+
+    valid: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    for line_no, row in batch:
+        values = _validate(db, row) if isinstance(row, dict) else row
+        if isinstance(values, str):
+            yield reject(line_no, values)
+        elif values["email"] in valid:
+            yield reject(line_no, "Duplicate email in import", values["email"])
+        else:
+            valid[values["email"]] = (line_no, values)
+    if not valid:
+        return
+
+    existing = db.query(func.lower(User.email)).filter(func.lower(User.email).in_(list(valid)))
+    for (email,) in existing:
+        line_no, _ = valid.pop(email)
+        yield reject(line_no, "Email already exists", email)
+    if not valid:
+        return
+
+    rows = [values for _, values in valid.values()]
+    hashes = executor.map(get_password_hash, [row.pop("password") for row in rows], chunksize=16)
+    for row, hashed in zip(rows, hashes):
+        row["hashed_password"] = hashed
+    try:
+        insert_user_rows(db, rows)
+        db.commit()
+    except SQLAlchemyError as exc:
+        db.rollback()
+        error = f"Batch write failed: {type(exc).__name__}"
+        for line_no, values in valid.values():
+            yield reject(line_no, error, values["email"])
+        return
+    stats["created"] += len(rows)
+
+
+def import_users(
+    db: Session,
+    rows: Iterable[ParsedRow],
+    executor: Executor,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Import parsed rows batch by batch.
+
+    Args:
+        db (Session): SQLAlchemy database session (committed once per batch).
+        rows (Iterable[ParsedRow]): Output of `parse_rows`.
+        executor (Executor): Executor for bcrypt hashing.
+        batch_size (int): Rows per INSERT/commit.
+
+    Yields:
+        dict: `{"line", "status": "error", "error"[, "email"]}` per rejected
+        row, then `{"status": "summary", "processed", "created", "failed"}`.
+    """
+    use_primary(db)
+    stats = {"processed": 0, "created": 0, "failed": 0}
+    batch: List[ParsedRow] = []
+    for parsed in rows:
+        batch.append(parsed)
+        stats["processed"] += 1
+        if len(batch) >= batch_size:
+            yield from _import_batch(db, batch, executor, stats)
+            batch = []
+    if batch:
+        yield from _import_batch(db, batch, executor, stats)
+    yield {"status": "summary", **stats}
+
+
+__all__ = ["IMPORT_BATCH_SIZE", "IMPORT_FORMATS", "parse_rows", "import_users", "insert_user_rows"]
@@ -0,0 +1,98 @@
+# app/services/user_listing.py
+
+"""
+Keyset (seek) pagination over the users table.
+
+Pages are read with `WHERE id > :last_id ORDER BY id LIMIT :n` (or the
+descending equivalent), so every page costs one index range scan no matter
+how deep the client is, unlike OFFSET which re-reads all skipped rows.
+Filters on role, language and active flag are served by the composite
+indexes `(role_id, id)`, `(language_id, id)` and `(is_active, id)`.
+
+Ids are assigned in insertion order, so `order="desc"` lists the newest
+users first; `created_at` is nullable and therefore not used as a key.
+"""
+
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+
+# Columns returned by the listing: never the password hash
+LISTING_COLUMNS = (
+    User.id,
+    User.name,
+    User.email,
+    User.is_active,
+    User.role_id,
+    User.language_id,
+    User.created_at,
+)
+
+
+def encode_cursor(last_id: int) -> str:
+    """Return the opaque cursor for the page following `last_id`."""
+    return base64.urlsafe_b64encode(f"id:{last_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Return the last id encoded in a cursor.
+
+    Raises:
+        ValueError: If the cursor was not produced by `encode_cursor`.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    prefix, _, value = raw.partition(":")
+    if prefix != "id" or not value.isdigit():
+        raise ValueError("Invalid cursor")
+    return int(value)
+
+
+def list_users(
+    db: Session,
+    *,
+    limit: int,
+    after_id: Optional[int] = None,
+    descending: bool = False,
+    role_id: Optional[int] = None,
+    language_id: Optional[int] = None,
+    is_active: Optional[bool] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Read one page of users.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        limit (int): Page size.
+        after_id (int | None): Last id of the previous page (from the cursor).
+        descending (bool): Newest first.
+        role_id, language_id, is_active: Optional equality filters.
+
+    Returns:
+        tuple[list[dict], str | None]: Rows as column dicts and the cursor of
+        the next page (None on the last page).
+    """
+    query = db.query(*LISTING_COLUMNS)
+    if role_id is not None:
+        query = query.filter(User.role_id == role_id)
+    if language_id is not None:
+        query = query.filter(User.language_id == language_id)
+    if is_active is not None:
+        query = query.filter(User.is_active.is_(is_active))
+    if after_id is not None:
+        query = query.filter(User.id < after_id if descending else User.id > after_id)
+
+    # One extra row tells whether another page exists
+    rows = query.order_by(User.id.desc() if descending else User.id.asc()).limit(limit + 1).all()
+    next_cursor = encode_cursor(rows[limit - 1].id) if len(rows) > limit else None
+    return [row._asdict() for row in rows[:limit]], next_cursor
+
+
+__all__ = ["LISTING_COLUMNS", "encode_cursor", "decode_cursor", "list_users"]
@@ -0,0 +1,96 @@
+# app/services/user_queries.py
+
+"""
+Prebuilt statements for the hottest user lookups.
+
+Each statement is built once at import time with bound parameters, so a
+call only binds values and hits SQLAlchemy's compiled-statement cache; it
+does not rebuild a `db.query(...)` construct (joins, options, criteria) per
+request. `benchmarks/bench_hot_queries.py` measures the difference.
+
+Single-user writes go through `update_user_returning`: one
+UPDATE ... RETURNING round-trip that reports the new state, falling back to
+UPDATE + SELECT on dialects without RETURNING support.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.language import Language
+from app.models.user import User
+from app.models.user_role import UserRole
+
+# (id, is_active, role name, language code): everything a Principal needs
+_PRINCIPAL_COLUMNS = (
+    select(User.id, User.is_active, UserRole.name, Language.code)
+    .outerjoin(UserRole, User.role_id == UserRole.id)
+    .outerjoin(Language, User.language_id == Language.id)
+)
+PRINCIPAL_BY_ID = _PRINCIPAL_COLUMNS.where(User.id == bindparam("user_id"))
+PRINCIPALS_BY_IDS = _PRINCIPAL_COLUMNS.where(User.id.in_(bindparam("user_ids", expanding=True)))
+
+# Login: the user with role and language joined in, by normalized email (ix_users_email_lower)
+LOGIN_USER_BY_EMAIL = (
+    select(User)
+    .options(joinedload(User.role), joinedload(User.language))
+    .where(func.lower(User.email) == bindparam("email"))
+    .limit(1)
+)
+
+# State reported after a single-user write; names and codes come from the reference-data registry
+UPDATED_USER_COLUMNS = (User.id, User.is_active, User.role_id, User.language_id, User.token_version)
+
+
+def principal_row(db: Session, user_id: int) -> Any:
+    """Return the principal row of a user, or None."""
+    return db.execute(PRINCIPAL_BY_ID, {"user_id": user_id}).first()
+
+
+def principal_rows(db: Session, user_ids: Iterable[int]) -> List[Any]:
+    """Return the principal rows of the given users (missing ids are absent)."""
+    return db.execute(PRINCIPALS_BY_IDS, {"user_ids": list(user_ids)}).all()
+
+
+def login_user(db: Session, email: str) -> User | None:
+    """Return the user with this normalized email, role and language loaded, or None."""
+    return db.execute(LOGIN_USER_BY_EMAIL, {"email": email}).scalars().first()
+
+
+def update_user_returning(db: Session, user_id: int, values: Dict[str, Any]) -> Any:
+    """
+    Apply `values` to one user (not committed) and return its new state.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        user_id (int): Target user.
+        values (dict): Column values or SQL expressions (e.g. `User.token_version + 1`).
+
+    Returns:
+        Row | None: `UPDATED_USER_COLUMNS` after the update, or None if the user does not exist.
+    """
+    statement = (
+        update(User)
+        .where(User.id == user_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+    if db.get_bind(clause=statement).dialect.update_returning:
+        return db.execute(statement.returning(*UPDATED_USER_COLUMNS)).first()
+
+    if not db.execute(statement).rowcount:
+        return None
+    return db.execute(select(*UPDATED_USER_COLUMNS).where(User.id == user_id)).first()
+
+
+__all__ = [
+    "PRINCIPAL_BY_ID",
+    "PRINCIPALS_BY_IDS",
+    "LOGIN_USER_BY_EMAIL",
+    "UPDATED_USER_COLUMNS",
+    "principal_row",
+    "principal_rows",
+    "login_user",
+    "update_user_returning",
+]
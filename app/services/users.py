@@ -1,42 +1,236 @@
 # app/services/users.py
 
+import hashlib
 import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from jose import JWTError, ExpiredSignatureError, jwt
-from app.core.database import get_db
+from jose import JWTError, ExpiredSignatureError
+from app.core.database import get_db, run_db
+from app.core.db_routing import record_write, stick_to_primary_if_written
+from app.core.metrics import register_metrics_source
 from app.models.user import User
+from app.services.token_revocations import revocations
+from app.services.user_queries import principal_row, principal_rows
+from app.utils.cache import TTLCache
+from app.utils.jwt_codec import get_codec
+from app.utils.keyring import get_keyring
 
 # OAuth2 scheme to extract the token from the Authorization header
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
-# JWT configuration from environment variables
-JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
-JWT_ALGORITHM = os.getenv("JWT_ALGORITHM")
+# Opt-in: authorize from token claims (role, language, account version) without a DB lookup
+AUTH_STATELESS = os.getenv("AUTH_STATELESS", "false").lower() in {"1", "true", "yes"}
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
+@dataclass(frozen=True)
+class Principal:
     """
-    Extracts and validates the current authenticated user from the JWT token.
+    Compact, immutable snapshot of an authenticated user.
+
+    Attributes:
+        id (int): User ID.
+        is_active (bool): Whether the account is active.
+        role_name (str | None): Role name (e.g. 'admin').
+        language_code (str | None): Preferred language code (e.g. 'en').
+    """
+    id: int
+    is_active: bool
+    role_name: str | None
+    language_code: str | None
+
+
+def principal_claims(user: User) -> Dict[str, Any]:
+    """
+    Build the claims to embed in an access token for the given user.
+
+    In stateless mode the role name, language code and account version
+    ('ver') are embedded so requests can be authorized from the token alone.
+    The user's role and language relationships must already be loaded.
+    """
+    claims: Dict[str, Any] = {"sub": str(user.id)}
+    if AUTH_STATELESS:
+        claims.update({
+            "role": user.role.name if user.role else None,
+            "lang": user.language.code if user.language else None,
+            "ver": user.token_version or 0,
+        })
+    return claims
+
+
+# Verified JWT claims keyed by token digest, bound to the verifying key
+_TOKEN_CACHE: TTLCache[tuple[str | None, bytes, Dict[str, Any]]] = TTLCache(
+    maxsize=int(os.getenv("TOKEN_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300")),
+)
+register_metrics_source("token_cache", _TOKEN_CACHE.stats)
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    """
+    Verify a JWT and return its claims, reusing previously verified claims.
+
+    - The verification key is chosen by the token's `kid` header.
+    - Cache entries are bound to the fingerprint of the key that verified
+      them, so a rotated or replaced key never serves stale claims.
+    - Entries expire no later than the token's 'exp' claim.
+
+    Raises:
+        ExpiredSignatureError: If the token is expired.
+        JWTError: If the token is invalid or signed with an unknown key.
+    """
+    keyring = get_keyring()
+    cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached is not None:
+        kid, fingerprint, claims = cached
+        key = keyring.get(kid)
+        if key is not None and key.fingerprint == fingerprint:
+            return claims
+
+    codec = get_codec()
+    kid = codec.get_unverified_header(token).get("kid")
+    key = keyring.get(kid)
+    if key is None:
+        raise JWTError("Unknown signing key")
+
+    claims = codec.decode(token, key)
+
+    entry = (kid, key.fingerprint, claims)
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        # Translate the wall-clock expiry onto the cache's monotonic clock
+        _TOKEN_CACHE.set(cache_key, entry, expires_at=time.monotonic() + (exp - time.time()))
+    else:
+        _TOKEN_CACHE.set(cache_key, entry)
+    return claims
+
+
+# Principal snapshots keyed by user id (bounded LRU with TTL)
+_PRINCIPAL_CACHE: TTLCache[Principal] = TTLCache(
+    maxsize=int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30")),
+)
+register_metrics_source("principal_cache", _PRINCIPAL_CACHE.stats)
+
+
+def invalidate_principal(user_id: int) -> None:
+    """
+    Drop the cached principal of a user. Call after committing changes to it.
+
+    The user is also read from the primary for the replica sticky window,
+    so a lagging replica cannot put the old state back in the cache.
+    """
+    _PRINCIPAL_CACHE.pop(user_id)
+    record_write(user_id)
+
+
+def clear_principal_cache() -> None:
+    """
+    Drop every cached principal.
+    """
+    _PRINCIPAL_CACHE.clear()
+
+
+def _principal_from_row(row) -> Principal:
+    return Principal(
+        id=row[0],
+        is_active=bool(row[1]),
+        role_name=row[2],
+        language_code=row[3],
+    )
+
+
+def _load_principal(db: Session, user_id: int) -> Principal | None:
+    """
+    Build a principal snapshot with a single query (user + role + language).
+    """
+    stick_to_primary_if_written(db, user_id)
+    row = principal_row(db, user_id)
+    return _principal_from_row(row) if row is not None else None
+
 
-    - Decodes the token and retrieves the user ID from the 'sub' claim.
+def load_principals(db: Session, user_ids: set[int]) -> Dict[int, Principal]:
+    """
+    Resolve many principals at once: cache hits first, then one IN query.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        user_ids (set[int]): User IDs to resolve.
+
+    Returns:
+        dict[int, Principal]: Found principals by user id (missing ids are absent).
+    """
+    found: Dict[int, Principal] = {}
+    missing: list[int] = []
+    for user_id in user_ids:
+        principal = _PRINCIPAL_CACHE.get(user_id)
+        if principal is None:
+            missing.append(user_id)
+        else:
+            found[user_id] = principal
+
+    if missing:
+        for user_id in missing:
+            stick_to_primary_if_written(db, user_id)
+        for row in principal_rows(db, missing):
+            principal = _principal_from_row(row)
+            _PRINCIPAL_CACHE.set(principal.id, principal)
+            found[principal.id] = principal
+    return found
+
+
+async def _principal_from_claims(db: Session | AsyncSession, user_id: int, payload: Dict[str, Any]) -> Principal:
+    """
+    Authorize from token claims alone (stateless mode).
+
+    Tokens are only issued to active users, and deactivation or role changes
+    bump the account version, so a non-revoked token implies an active user
+    with the embedded role. The DB is only hit by the periodic revocation sync.
+    """
+    if revocations.is_stale():
+        await run_db(db, revocations.sync)
+    if revocations.is_revoked(user_id, payload["ver"]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Inactive or invalid user",
+        )
+    return Principal(
+        id=user_id,
+        is_active=True,
+        role_name=payload.get("role"),
+        language_code=payload.get("lang"),
+    )
+
+
+async def authenticate_token(token: str, db: Session | AsyncSession) -> Principal:
+    """
+    Resolve a bearer token to an active principal.
+
+    - Decodes the token (through the verified-claims cache) and retrieves
+      the user ID from the 'sub' claim.
     - Raises 401 with 'Token expired' if the token is expired.
     - Raises 401 with 'Invalid authentication credentials' for other decode errors.
     - Verifies the user exists and is active.
+    - Serves the user snapshot from the principal cache when possible.
+    - In stateless mode (AUTH_STATELESS), versioned tokens are authorized from
+      their claims and the revocation list, without querying users.
+    - Runs on the event loop; only cache misses go to the database.
 
     Args:
-        token (str): Bearer token from the Authorization header.
-        db (Session): SQLAlchemy database session.
+        token (str): Raw bearer token.
+        db (Session | AsyncSession): SQLAlchemy database session.
 
     Returns:
-        User: Authenticated and active user.
+        Principal: Snapshot of the authenticated and active user.
     """
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        payload = decode_token(token)
         user_id = int(payload.get("sub"))
     except ExpiredSignatureError:
         raise HTTPException(
@@ -49,19 +243,50 @@ def get_current_user(
             detail="Invalid authentication credentials",
         )
 
-    user = db.query(User).filter_by(id=user_id).first()
-    if user is None or not user.is_active:
+    if AUTH_STATELESS and isinstance(payload.get("ver"), int):
+        return await _principal_from_claims(db, user_id, payload)
+
+    principal = _PRINCIPAL_CACHE.get(user_id)
+    if principal is None:
+        principal = await run_db(db, _load_principal, user_id)
+        if principal is not None:
+            _PRINCIPAL_CACHE.set(user_id, principal)
+
+    if principal is None or not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Inactive or invalid user",
         )
 
-    return user
+    return principal
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session | AsyncSession = Depends(get_db)
+) -> Principal:
+    """
+    Extracts and validates the current authenticated user from the JWT token.
+
+    See `authenticate_token` for the validation rules and error responses.
+
+    Args:
+        token (str): Bearer token from the Authorization header.
+        db (Session | AsyncSession): SQLAlchemy database session.
+
+    Returns:
+        Principal: Snapshot of the authenticated and active user.
+    """
+    return await authenticate_token(token, db)
+
+
+# Roles allowed through get_current_admin_or_superadmin_user
+ADMIN_ROLES = ("admin", "superadmin")
 
 
-def get_current_admin_or_superadmin_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+async def get_current_admin_or_superadmin_user(
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """
     Grants access only to users with 'admin' or 'superadmin' roles.
 
@@ -69,12 +294,12 @@ def get_current_admin_or_superadmin_user(
     - Raises 403 if the user role is not allowed.
 
     Args:
-        current_user (User): Authenticated user.
+        current_user (Principal): Authenticated user.
 
     Returns:
-        User: Authenticated user with admin or superadmin role.
+        Principal: Authenticated user with admin or superadmin role.
     """
-    if current_user.role.name not in ("admin", "superadmin"):
+    if current_user.role_name not in ADMIN_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin or Superadmin privileges required"
@@ -0,0 +1,216 @@
+# app/utils/jwt_codec.py
+
+"""
+Pluggable JWT encode/decode backends.
+
+- "jose": python-jose (every algorithm supported by the key ring).
+- "hmac": minimal HS256/HS384/HS512 codec on the standard library, with
+  precomputed HMAC states per key. Other algorithms are rejected.
+
+Both backends raise python-jose exceptions (`JWTError`,
+`ExpiredSignatureError`, `JWTClaimsError`), so callers handle errors the
+same way whichever backend is configured through JWT_CODEC.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Protocol
+
+from jose import jwt
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
+
+from app.utils.keyring import SigningKey
+
+
+class JWTCodec(Protocol):
+    """Token encode/decode backend working on key ring keys."""
+
+    name: str
+
+    def encode(self, claims: Dict[str, Any], key: SigningKey) -> str:
+        """Sign claims with `key`, stamping its `kid` header."""
+
+    def decode(self, token: str, key: SigningKey) -> Dict[str, Any]:
+        """Verify a token with `key` and validate registered claims."""
+
+    def get_unverified_header(self, token: str) -> Dict[str, Any]:
+        """Return the token header without verifying the signature."""
+
+
+class JoseCodec:
+    """Codec backed by python-jose."""
+
+    name = "jose"
+
+    def encode(self, claims: Dict[str, Any], key: SigningKey) -> str:
+        return jwt.encode(claims, key.signing_key, algorithm=key.algorithm, headers={"kid": key.kid})
+
+    def decode(self, token: str, key: SigningKey) -> Dict[str, Any]:
+        return jwt.decode(token, key.verification_key, algorithms=[key.algorithm])
+
+    def get_unverified_header(self, token: str) -> Dict[str, Any]:
+        return jwt.get_unverified_header(token)
+
+
+def _b64encode(raw: bytes) -> bytes:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+
+def _b64decode(segment: bytes) -> bytes:
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+def _json_dumps(value: Dict[str, Any]) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+class HMACCodec:
+    """
+    Minimal HS256/HS384/HS512 codec.
+
+    - Only whitelisted algorithms are accepted, both when signing and in
+      token headers (no 'none', no algorithm confusion).
+    - One keyed HMAC state and one encoded header are prepared per key and
+      reused, so neither is recomputed for every token.
+    - Validates 'exp', 'nbf' and 'sub' like python-jose.
+    """
+
+    name = "hmac"
+    ALGORITHMS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+    def __init__(self):
+        self._macs: Dict[bytes, Any] = {}
+        self._headers: Dict[bytes, bytes] = {}
+        self._lock = threading.Lock()
+
+    def _mac(self, key: SigningKey):
+        mac = self._macs.get(key.fingerprint)
+        if mac is None:
+            digest = self.ALGORITHMS.get(key.algorithm)
+            if digest is None:
+                raise JWTError(f"Algorithm {key.algorithm} is not supported by the hmac codec.")
+            mac = hmac.new(key.verification_key.prepared_key, digestmod=digest)
+            with self._lock:
+                self._macs[key.fingerprint] = mac
+        return mac.copy()
+
+    def encode(self, claims: Dict[str, Any], key: SigningKey) -> str:
+        payload = dict(claims)
+        for name in ("exp", "iat", "nbf"):
+            if isinstance(payload.get(name), datetime):
+                payload[name] = int(payload[name].timestamp())
+
+        mac = self._mac(key)
+        header = self._headers.get(key.fingerprint)
+        if header is None:
+            header = _b64encode(_json_dumps({"alg": key.algorithm, "typ": "JWT", "kid": key.kid}))
+            with self._lock:
+                self._headers[key.fingerprint] = header
+
+        signing_input = header + b"." + _b64encode(_json_dumps(payload))
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64encode(mac.digest())).decode("ascii")
+
+    def _split(self, token: str) -> tuple[bytes, bytes, bytes]:
+        try:
+            header, payload, signature = token.encode("ascii").split(b".")
+        except (UnicodeEncodeError, ValueError):
+            raise JWTError("Not enough segments")
+        return header, payload, signature
+
+    def get_unverified_header(self, token: str) -> Dict[str, Any]:
+        header, _, _ = self._split(token)
+        try:
+            value = json.loads(_b64decode(header))
+        except (binascii.Error, ValueError):
+            raise JWTError("Invalid header padding")
+        if not isinstance(value, dict):
+            raise JWTError("Invalid header string: must be a json object")
+        return value
+
+    def decode(self, token: str, key: SigningKey) -> Dict[str, Any]:
+        header_segment, payload_segment, signature_segment = self._split(token)
+        header = self.get_unverified_header(token)
+
+        algorithm = header.get("alg")
+        if algorithm not in self.ALGORITHMS or algorithm != key.algorithm:
+            raise JWTError("The specified alg value is not allowed")
+
+        mac = self._mac(key)
+        mac.update(header_segment + b"." + payload_segment)
+        try:
+            signature = _b64decode(signature_segment)
+        except (binascii.Error, ValueError):
+            raise JWTError("Invalid crypto padding")
+        if not hmac.compare_digest(mac.digest(), signature):
+            raise JWTError("Signature verification failed.")
+
+        try:
+            claims = json.loads(_b64decode(payload_segment))
+        except (binascii.Error, ValueError):
+            raise JWTError("Invalid payload string")
+        if not isinstance(claims, dict):
+            raise JWTError("Invalid payload string: must be a json object")
+
+        self._validate(claims)
+        return claims
+
+    @staticmethod
+    def _validate(claims: Dict[str, Any]) -> None:
+        now = int(time.time())
+        if "exp" in claims:
+            try:
+                exp = int(claims["exp"])
+            except (TypeError, ValueError):
+                raise JWTClaimsError("Expiration Time claim (exp) must be an integer.")
+            if exp < now:
+                raise ExpiredSignatureError("Signature has expired.")
+        if "nbf" in claims:
+            try:
+                nbf = int(claims["nbf"])
+            except (TypeError, ValueError):
+                raise JWTClaimsError("Not Before claim (nbf) must be an integer.")
+            if nbf > now:
+                raise JWTClaimsError("The token is not yet valid (nbf)")
+        if "sub" in claims and not isinstance(claims["sub"], str):
+            raise JWTClaimsError("Subject must be a string.")
+
+
+CODECS = {"jose": JoseCodec, "hmac": HMACCodec}
+
+# --- Lazy-initialized codec (private) ---
+_CODEC: Optional[JWTCodec] = None
+
+
+def get_codec() -> JWTCodec:
+    """
+    Return the configured codec (JWT_CODEC: 'jose' by default, or 'hmac').
+
+    Raises:
+        EnvironmentError: If JWT_CODEC names an unknown backend.
+    """
+    global _CODEC
+    if _CODEC is None:
+        name = os.getenv("JWT_CODEC", "jose").strip().lower()
+        if name not in CODECS:
+            raise EnvironmentError(f"JWT_CODEC must be one of: {', '.join(sorted(CODECS))}.")
+        _CODEC = CODECS[name]()
+    return _CODEC
+
+
+def set_codec(codec: JWTCodec | None) -> None:
+    """
+    Replace the process-wide codec (None re-reads JWT_CODEC on next use).
+    """
+    global _CODEC
+    _CODEC = codec
+
+
+__all__ = ["JWTCodec", "JoseCodec", "HMACCodec", "CODECS", "get_codec", "set_codec"]
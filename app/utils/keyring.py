@@ -0,0 +1,374 @@
+# app/utils/keyring.py
+
+"""
+JWT signing keys indexed by `kid`.
+
+Supports symmetric (HS*) and asymmetric (RS*, ES*) algorithms. Keys are
+parsed once into python-jose key objects, so signing and verification never
+re-read configuration or re-parse PEM material per token.
+
+Rotation
+--------
+When `JWT_KEYRING_FILE` points to a JSON document, the ring holds several
+keys: the active one signs new tokens, the others only verify tokens until
+their `not_after` instant (overlap window). The file is re-checked every
+`JWT_KEYRING_RELOAD_SECONDS` and reloaded when it changes, without a restart:
+
+    {
+      "active": "2026-10",
+      "keys": [
+        {"kid": "2026-10", "algorithm": "RS256", "private_key_file": "/run/keys/2026-10.pem"},
+        {"kid": "2026-09", "algorithm": "HS256", "secret": "...", "not_after": "2026-10-25T00:00:00Z"}
+      ]
+    }
+
+Without that file, a single key is built from JWT_ALGORITHM and
+JWT_SECRET_KEY / JWT_PRIVATE_KEY / JWT_PRIVATE_KEY_FILE (and JWT_KEY_ID).
+
+Public keys of asymmetric algorithms are published as a JWKS document so
+other services can verify tokens locally; symmetric secrets never are.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from jose import jwk
+from jose.backends.base import Key
+
+from app.core.metrics import register_metrics_source
+
+logger = logging.getLogger(__name__)
+
+HMAC_ALGORITHMS = frozenset({"HS256", "HS384", "HS512"})
+ASYMMETRIC_ALGORITHMS = frozenset({"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"})
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """
+    One signing/verification key, preloaded as python-jose key objects.
+
+    Attributes:
+        kid (str): Key identifier stamped in token headers.
+        algorithm (str): JWS algorithm (e.g. 'HS256', 'RS256').
+        signing_key (Key | None): Preloaded signing key (None for verify-only keys).
+        verification_key (Key): Preloaded verification key.
+        public_jwk (dict | None): Public JWK to publish (None for HMAC keys).
+        fingerprint (bytes): Digest identifying the verification material.
+        not_after (float | None): Epoch seconds after which the key no longer verifies.
+    """
+    kid: str
+    algorithm: str
+    signing_key: Optional[Key] = field(repr=False)
+    verification_key: Key = field(repr=False)
+    public_jwk: Optional[Dict[str, Any]] = None
+    fingerprint: bytes = field(default=b"", repr=False)
+    not_after: Optional[float] = None
+
+    def is_valid_at(self, now: float) -> bool:
+        return self.not_after is None or now < self.not_after
+
+
+def build_signing_key(
+    kid: str | None,
+    algorithm: str,
+    material: str,
+    *,
+    public_only: bool = False,
+    not_after: float | None = None,
+) -> SigningKey:
+    """
+    Build a SigningKey from a secret (HS*) or a PEM key (RS*/ES*).
+
+    Args:
+        kid (str | None): Key identifier; derived from the key material if None.
+        algorithm (str): JWS algorithm.
+        material (str): HMAC secret, PEM private key, or PEM public key
+            when `public_only` is True.
+        public_only (bool): Build a verify-only key from a public key.
+        not_after (float | None): End of the verification window (epoch seconds).
+
+    Raises:
+        EnvironmentError: If the algorithm is unsupported or the key is invalid.
+    """
+    if algorithm in HMAC_ALGORITHMS:
+        key = jwk.construct(material, algorithm)
+        fingerprint = hashlib.sha256(f"{algorithm}:{material}".encode("utf-8")).digest()
+        return SigningKey(
+            kid=kid or fingerprint.hex()[:16],
+            algorithm=algorithm,
+            signing_key=key,
+            verification_key=key,
+            fingerprint=fingerprint,
+            not_after=not_after,
+        )
+
+    if algorithm not in ASYMMETRIC_ALGORITHMS:
+        raise EnvironmentError(f"Unsupported JWT algorithm: {algorithm}")
+
+    try:
+        parsed = jwk.construct(material, algorithm)
+        public_key = parsed if public_only else parsed.public_key()
+        public_jwk = public_key.to_dict()
+    except Exception as exc:
+        raise EnvironmentError(f"Invalid key material for {algorithm}.") from exc
+
+    canonical = json.dumps(public_jwk, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    fingerprint = hashlib.sha256(canonical).digest()
+    kid = kid or fingerprint.hex()[:16]
+
+    return SigningKey(
+        kid=kid,
+        algorithm=algorithm,
+        signing_key=None if public_only else parsed,
+        verification_key=public_key,
+        public_jwk={**public_jwk, "kid": kid, "use": "sig"},
+        fingerprint=fingerprint,
+        not_after=not_after,
+    )
+
+
+class KeyRing:
+    """
+    Set of keys indexed by `kid`, with one active key used for signing.
+
+    - `get(kid)` is a single dict lookup plus an overlap-window check.
+    - The JWKS document is computed once at construction.
+    """
+
+    def __init__(self, keys: list[SigningKey], active_kid: str):
+        self._keys: Dict[str, SigningKey] = {key.kid: key for key in keys}
+        active = self._keys.get(active_kid)
+        if active is None:
+            raise EnvironmentError(f"Active JWT key '{active_kid}' is not in the key ring.")
+        if active.signing_key is None:
+            raise EnvironmentError(f"Active JWT key '{active_kid}' cannot sign (public key only).")
+        self._active = active
+        self.loaded_at = time.time()
+
+        self.jwks: Dict[str, Any] = {
+            "keys": [key.public_jwk for key in keys if key.public_jwk is not None]
+        }
+        self.jwks_json: bytes = json.dumps(self.jwks, separators=(",", ":")).encode("utf-8")
+        self.jwks_etag: str = '"' + hashlib.sha256(self.jwks_json).hexdigest()[:32] + '"'
+
+    @property
+    def active(self) -> SigningKey:
+        """Key used to sign new tokens."""
+        return self._active
+
+    @property
+    def kids(self) -> list[str]:
+        return list(self._keys)
+
+    def get(self, kid: str | None) -> SigningKey | None:
+        """
+        Return the verification key for a token header `kid`.
+
+        - Tokens without `kid` (issued before kids were stamped) map to the active key.
+        - Keys past their overlap window (`not_after`) are no longer returned.
+        """
+        if kid is None:
+            return self._active
+        key = self._keys.get(kid)
+        if key is None or not key.is_valid_at(time.time()):
+            return None
+        return key
+
+
+def _read_private_key() -> str | None:
+    pem = os.getenv("JWT_PRIVATE_KEY")
+    if pem:
+        # Allow single-line values with escaped newlines (e.g. in .env files)
+        return pem.replace("\\n", "\n")
+    path = os.getenv("JWT_PRIVATE_KEY_FILE")
+    if path:
+        with open(path, "r", encoding="utf-8") as handle:
+            return handle.read()
+    return None
+
+
+def load_keyring_from_env() -> KeyRing:
+    """
+    Build a single-key ring from the environment.
+
+    - JWT_ALGORITHM: HS256/384/512, RS256/384/512 or ES256/384/512.
+    - JWT_SECRET_KEY: secret for HS* algorithms.
+    - JWT_PRIVATE_KEY or JWT_PRIVATE_KEY_FILE: PEM private key for RS*/ES*.
+    - JWT_KEY_ID: optional `kid` (derived from the key when unset).
+
+    Raises:
+        EnvironmentError: If required variables are missing or invalid.
+    """
+    algorithm = os.getenv("JWT_ALGORITHM")
+    if not algorithm:
+        raise EnvironmentError("Missing critical JWT environment variables.")
+
+    if algorithm in HMAC_ALGORITHMS:
+        material = os.getenv("JWT_SECRET_KEY")
+    else:
+        material = _read_private_key()
+    if not material:
+        raise EnvironmentError("Missing critical JWT environment variables.")
+
+    key = build_signing_key(os.getenv("JWT_KEY_ID") or None, algorithm, material)
+    return KeyRing([key], active_kid=key.kid)
+
+
+def _parse_not_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _read_text(entry: Dict[str, Any], inline: str, path: str) -> str | None:
+    if entry.get(inline):
+        return str(entry[inline])
+    if entry.get(path):
+        with open(entry[path], "r", encoding="utf-8") as handle:
+            return handle.read()
+    return None
+
+
+def load_keyring_from_file(path: str) -> KeyRing:
+    """
+    Build a multi-key ring from a JSON document (see module docstring).
+
+    Each key entry accepts `kid`, `algorithm`, one of `secret`,
+    `private_key`, `private_key_file`, `public_key`, `public_key_file`,
+    and an optional ISO-8601 `not_after`.
+
+    Raises:
+        EnvironmentError: If the document or one of its keys is invalid.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            document = json.load(handle)
+        keys: list[SigningKey] = []
+        for entry in document["keys"]:
+            algorithm = entry["algorithm"]
+            not_after = _parse_not_after(entry.get("not_after"))
+            if algorithm in HMAC_ALGORITHMS:
+                material, public_only = entry.get("secret"), False
+            else:
+                material = _read_text(entry, "private_key", "private_key_file")
+                public_only = material is None
+                if public_only:
+                    material = _read_text(entry, "public_key", "public_key_file")
+            if not material:
+                raise EnvironmentError(f"JWT key '{entry.get('kid')}' has no key material.")
+            keys.append(build_signing_key(
+                entry["kid"], algorithm, material, public_only=public_only, not_after=not_after,
+            ))
+        return KeyRing(keys, active_kid=document["active"])
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        raise EnvironmentError(f"Invalid JWT key ring file '{path}': {exc}") from exc
+
+
+class _KeyRingHolder:
+    """
+    Owns the process-wide key ring and reloads it when its file changes.
+    """
+
+    def __init__(self):
+        self.keyring: Optional[KeyRing] = None
+        self.pinned = False
+        self.path: Optional[str] = None
+        self.mtime: Optional[float] = None
+        self.checked_at = 0.0
+        self.reload_interval = 10.0
+        self.lock = threading.Lock()
+
+    def get(self) -> KeyRing:
+        keyring = self.keyring
+        if keyring is not None and (
+            self.pinned or self.path is None
+            or time.monotonic() - self.checked_at < self.reload_interval
+        ):
+            return keyring
+        with self.lock:
+            if self.keyring is None:
+                self._load()
+            elif not self.pinned and self.path is not None:
+                self._reload_if_changed()
+            return self.keyring
+
+    def _load(self) -> None:
+        self.path = os.getenv("JWT_KEYRING_FILE") or None
+        self.reload_interval = float(os.getenv("JWT_KEYRING_RELOAD_SECONDS", "10"))
+        if self.path is None:
+            self.keyring = load_keyring_from_env()
+            return
+        self.mtime = os.stat(self.path).st_mtime
+        self.keyring = load_keyring_from_file(self.path)
+        self.checked_at = time.monotonic()
+
+    def _reload_if_changed(self) -> None:
+        self.checked_at = time.monotonic()
+        try:
+            mtime = os.stat(self.path).st_mtime
+            if mtime == self.mtime:
+                return
+            self.keyring = load_keyring_from_file(self.path)
+            self.mtime = mtime
+            logger.info("Reloaded JWT key ring (active kid: %s)", self.keyring.active.kid)
+        except (OSError, EnvironmentError):
+            # Keep serving with the previous ring; a broken file must not drop auth
+            logger.exception("Failed to reload JWT key ring from %s", self.path)
+
+    def set(self, keyring: Optional[KeyRing]) -> None:
+        with self.lock:
+            self.keyring = keyring
+            self.pinned = keyring is not None
+            self.mtime = None
+
+    def stats(self) -> Dict[str, Any]:
+        keyring = self.keyring
+        if keyring is None:
+            return {"loaded": False}
+        return {
+            "loaded": True,
+            "source": self.path or "env",
+            "active_kid": keyring.active.kid,
+            "kids": keyring.kids,
+            "loaded_at": keyring.loaded_at,
+        }
+
+
+_HOLDER = _KeyRingHolder()
+register_metrics_source("keyring", _HOLDER.stats)
+
+
+def get_keyring() -> KeyRing:
+    """
+    Return the process-wide key ring (loaded once, reloaded when its file changes).
+    """
+    return _HOLDER.get()
+
+
+def set_keyring(keyring: KeyRing | None) -> None:
+    """
+    Pin a key ring for this process (None reloads from config on next use).
+    """
+    _HOLDER.set(keyring)
+
+
+__all__ = [
+    "SigningKey",
+    "KeyRing",
+    "build_signing_key",
+    "load_keyring_from_env",
+    "load_keyring_from_file",
+    "get_keyring",
+    "set_keyring",
+]
@@ -0,0 +1,22 @@
+# app/utils/normalization.py
+
+"""
+Canonical forms for case-insensitive identifiers.
+
+Emails, language codes and role names are stored in these forms and looked
+up through unique indexes on `lower(column)`, so `Foo@x` and `foo@x` are the
+same account and lookups never need a case-insensitive scan.
+"""
+
+
+def normalize_email(email: str) -> str:
+    """Return the stored form of an email address (trimmed, lower case)."""
+    return email.strip().lower()
+
+
+def normalize_key(value: str) -> str:
+    """Return the stored form of a language code or role name (trimmed, lower case)."""
+    return value.strip().lower()
+
+
+__all__ = ["normalize_email", "normalize_key"]
@@ -3,7 +3,7 @@
 """Utility helpers for consistent JSON responses."""
 
 from fastapi.responses import JSONResponse
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
 
 
 def json_response(
@@ -11,16 +11,18 @@ def json_response(
     message: str,
     status_code: int = 200,
     data: Dict[str, Any] | None = None,
+    headers: Mapping[str, str] | None = None,
 ) -> JSONResponse:
     """Return a standardized JSON response payload.
 
     The function wraps the provided ``data`` in a ``success``/``message`` envelope
     and avoids mutable default arguments by defaulting ``data`` to ``None`` and
-    replacing it with an empty dictionary.
+    replacing it with an empty dictionary. Optional ``headers`` are added to the
+    response (e.g. ``Retry-After``).
     """
     payload = {
         "success": success,
         "message": message,
         "data": data or {},
     }
-    return JSONResponse(content=payload, status_code=status_code)
+    return JSONResponse(content=payload, status_code=status_code, headers=headers)
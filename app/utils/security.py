@@ -2,15 +2,31 @@
 
 """Security utilities for password hashing and JWT token generation."""
 
+import asyncio
+import multiprocessing
 import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from jose import jwt
+from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv
 import bcrypt
 
+from app.utils.jwt_codec import get_codec
+from app.utils.keyring import get_keyring
+
 # Load environment variables from .env file
 load_dotenv()
 
+# --- Lazy-initialized hashing executor (private) ---
+_HASH_EXECUTOR: Optional[Executor] = None
+_HASH_EXECUTOR_LOCK = threading.Lock()
+
+# --- Lazy-initialized bulk import hashing executor (private) ---
+_IMPORT_HASH_EXECUTOR: Optional[Executor] = None
+_IMPORT_HASH_EXECUTOR_LOCK = threading.Lock()
+
 
 def get_password_hash(password: str) -> str:
     """
@@ -39,34 +55,173 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
 
 
-def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
+def _init_hash_executor(
+    prefix: str = "PASSWORD_HASH",
+    default_kind: str = "thread",
+    default_workers: Optional[int] = None,
+) -> Executor:
     """
-    Generate a JWT access token from the given payload.
+    Build the dedicated password hashing executor from environment settings.
+
+    - PASSWORD_HASH_EXECUTOR: "thread" (default) or "process".
+    - PASSWORD_HASH_WORKERS: pool size (defaults to the number of CPUs).
 
     Args:
-        data (dict): Payload to encode in the token.
-        expires_delta (timedelta | None): Optional custom expiration.
+        prefix (str): Environment variable prefix (`{prefix}_EXECUTOR`, `{prefix}_WORKERS`).
+        default_kind (str): Executor kind when `{prefix}_EXECUTOR` is unset.
+        default_workers (int | None): Pool size when `{prefix}_WORKERS` is unset
+            (defaults to the number of CPUs).
+
+    Raises:
+        EnvironmentError: If the executor kind or worker count is invalid.
+    """
+    kind = os.getenv(f"{prefix}_EXECUTOR", default_kind).strip().lower()
+    raw_workers = os.getenv(f"{prefix}_WORKERS", "").strip()
+
+    try:
+        workers = int(raw_workers) if raw_workers else (default_workers or os.cpu_count() or 1)
+    except ValueError as exc:
+        raise EnvironmentError(f"{prefix}_WORKERS must be an integer.") from exc
+    if workers < 1:
+        raise EnvironmentError(f"{prefix}_WORKERS must be at least 1.")
+
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+    if kind == "process":
+        # "spawn" avoids forking a process that already runs request threads
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    raise EnvironmentError(f"{prefix}_EXECUTOR must be 'thread' or 'process'.")
+
+
+def get_hash_executor() -> Executor:
+    """
+    Return the size-limited executor used for bcrypt work (lazy, thread-safe).
+
+    Hashing runs here instead of the request threadpool so that a burst of
+    logins cannot starve regular endpoints.
+    """
+    global _HASH_EXECUTOR
+    if _HASH_EXECUTOR is None:
+        with _HASH_EXECUTOR_LOCK:
+            if _HASH_EXECUTOR is None:
+                _HASH_EXECUTOR = _init_hash_executor()
+    return _HASH_EXECUTOR
+
+
+def shutdown_hash_executor() -> None:
+    """
+    Shut down the hashing executor, if it was started (idempotent).
+    """
+    global _HASH_EXECUTOR
+    with _HASH_EXECUTOR_LOCK:
+        executor, _HASH_EXECUTOR = _HASH_EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def get_import_hash_executor() -> Executor:
+    """
+    Return the executor used to hash passwords of bulk imports (lazy, thread-safe).
+
+    Kept apart from `get_hash_executor` so an import batch never queues
+    ahead of login verifications. Configured by IMPORT_HASH_EXECUTOR
+    ("process" by default) and IMPORT_HASH_WORKERS (default: half the CPUs).
+    """
+    global _IMPORT_HASH_EXECUTOR
+    if _IMPORT_HASH_EXECUTOR is None:
+        with _IMPORT_HASH_EXECUTOR_LOCK:
+            if _IMPORT_HASH_EXECUTOR is None:
+                _IMPORT_HASH_EXECUTOR = _init_hash_executor(
+                    "IMPORT_HASH", default_kind="process", default_workers=max(1, (os.cpu_count() or 1) // 2)
+                )
+    return _IMPORT_HASH_EXECUTOR
+
+
+def shutdown_import_hash_executor() -> None:
+    """
+    Shut down the bulk import hashing executor, if it was started (idempotent).
+    """
+    global _IMPORT_HASH_EXECUTOR
+    with _IMPORT_HASH_EXECUTOR_LOCK:
+        executor, _IMPORT_HASH_EXECUTOR = _IMPORT_HASH_EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a plaintext password on the dedicated hashing executor.
+
+    Args:
+        password (str): The raw password.
 
     Returns:
-        str: Encoded JWT token.
+        str: Bcrypt-hashed password.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_executor(), get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a plaintext password on the dedicated hashing executor.
+
+    Args:
+        plain_password (str): The raw password.
+        hashed_password (str): The hashed password stored in the database.
+
+    Returns:
+        bool: True if the password matches, False otherwise.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_hash_executor(), verify_password, plain_password, hashed_password
+    )
+
+
+@lru_cache(maxsize=1)
+def _access_token_lifetime() -> timedelta:
+    """
+    Parse ACCESS_TOKEN_EXPIRE_MINUTES once per process.
 
     Raises:
-        EnvironmentError: If required environment variables are missing or invalid.
+        EnvironmentError: If the variable is missing or not an integer.
     """
-    SECRET_KEY = os.getenv("JWT_SECRET_KEY")
-    ALGORITHM = os.getenv("JWT_ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")
 
-    if not SECRET_KEY or not ALGORITHM or not ACCESS_TOKEN_EXPIRE_MINUTES:
+    if not ACCESS_TOKEN_EXPIRE_MINUTES:
         raise EnvironmentError("Missing critical JWT environment variables.")
 
     try:
-        expire_minutes = int(ACCESS_TOKEN_EXPIRE_MINUTES)
+        return timedelta(minutes=int(ACCESS_TOKEN_EXPIRE_MINUTES))
     except ValueError as exc:
         raise EnvironmentError("ACCESS_TOKEN_EXPIRE_MINUTES must be an integer.") from exc
-    
+
+
+def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
+    """
+    Generate a JWT access token from the given payload.
+
+    The token is signed with the active key of the key ring (HS*, RS* or ES*)
+    and carries its `kid` header. Keys and the default lifetime are parsed
+    once, not per call.
+
+    Args:
+        data (dict): Payload to encode in the token.
+        expires_delta (timedelta | None): Optional custom expiration.
+
+    Returns:
+        str: Encoded JWT token.
+
+    Raises:
+        EnvironmentError: If required environment variables are missing or invalid.
+    """
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=expire_minutes))
+    expire = datetime.now(timezone.utc) + (expires_delta or _access_token_lifetime())
     to_encode.update({"exp": expire})
-    
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+    # Sign with the active key (via the configured codec) and stamp its kid
+    return get_codec().encode(to_encode, get_keyring().active)
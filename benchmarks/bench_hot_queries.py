@@ -0,0 +1,85 @@
+# benchmarks/bench_hot_queries.py
+
+"""
+Compare per-call overhead of `db.query(...)` constructs and the prebuilt
+statements in app/services/user_queries.py (and UPDATE + SELECT against
+UPDATE ... RETURNING), on an in-memory SQLite database.
+
+Usage:
+  python -m benchmarks.bench_hot_queries [iterations]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import joinedload, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.language import Language
+from app.models.user import User
+from app.models.user_role import UserRole
+from app.services import user_queries
+
+
+def _measure(label: str, fn, iterations: int) -> float:
+    fn()  # warm the compiled cache
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    per_call = (time.perf_counter() - started) * 1e6 / iterations
+    print(f"{label:<32} {iterations:>8} calls  {per_call:8.2f} us/call")
+    return per_call
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    role, language = UserRole(name="user"), Language(code="en", name="English")
+    db.add_all([role, language])
+    db.flush()
+    user = User(name="Bench", email="bench@example.net", hashed_password="x", role_id=role.id, language_id=language.id)
+    db.add(user)
+    db.commit()
+    user_id, language_id = user.id, language.id
+
+    cases = {
+        "principal by id": (
+            lambda: db.query(User.id, User.is_active, UserRole.name, Language.code)
+            .outerjoin(UserRole, User.role_id == UserRole.id)
+            .outerjoin(Language, User.language_id == Language.id)
+            .filter(User.id == user_id)
+            .first(),
+            lambda: user_queries.principal_row(db, user_id),
+        ),
+        "login user by email": (
+            lambda: db.query(User)
+            .options(joinedload(User.role), joinedload(User.language))
+            .filter(func.lower(User.email) == "bench@example.net")
+            .first(),
+            lambda: user_queries.login_user(db, "bench@example.net"),
+        ),
+        "update user, read state": (
+            lambda: (
+                db.query(User).filter_by(id=user_id).update({"language_id": language_id}),
+                db.query(*user_queries.UPDATED_USER_COLUMNS).filter(User.id == user_id).first(),
+            ),
+            lambda: user_queries.update_user_returning(db, user_id, {"language_id": language_id}),
+        ),
+    }
+    for name, (before, after) in cases.items():
+        old = _measure(f"{name} (before)", before, iterations)
+        new = _measure(f"{name} (after)", after, iterations)
+        db.rollback()
+        print(f"{'':<32} {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
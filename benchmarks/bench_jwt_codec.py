@@ -0,0 +1,40 @@
+# benchmarks/bench_jwt_codec.py
+
+"""
+Report JWT encode/decode throughput for each codec backend.
+
+Usage:
+  python -m benchmarks.bench_jwt_codec [iterations]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.utils.jwt_codec import CODECS
+from app.utils.keyring import build_signing_key
+
+
+def _ops_per_second(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    key = build_signing_key("bench", "HS256", "benchmark-secret")
+    claims = {"sub": "1", "exp": datetime.now(timezone.utc) + timedelta(hours=1)}
+
+    print(f"{'codec':<8} {'encode ops/s':>14} {'decode ops/s':>14}")
+    for name, codec_class in sorted(CODECS.items()):
+        codec = codec_class()
+        token = codec.encode(claims, key)
+        encode_ops = _ops_per_second(lambda: codec.encode(claims, key), iterations)
+        decode_ops = _ops_per_second(lambda: codec.decode(token, key), iterations)
+        print(f"{name:<8} {encode_ops:>14.0f} {decode_ops:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# benchmarks/bench_token_cache.py
+
+"""
+Compare uncached and cached JWT verification in app/services/users.py.
+
+Usage:
+  python -m benchmarks.bench_token_cache [iterations]
+"""
+
+import os
+import sys
+import time
+
+# Provide JWT settings before importing application modules
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("JWT_ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+
+from jose import jwt
+
+from app.services import users
+from app.utils.keyring import get_keyring
+from app.utils.security import create_access_token
+
+
+def _measure(label: str, fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - started
+    ops = iterations / elapsed
+    print(f"{label:<10} {iterations:>8} calls  {elapsed * 1e6 / iterations:8.2f} us/call  {ops:12.0f} ops/s")
+    return ops
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    token = create_access_token(data={"sub": "1"})
+    key = get_keyring().active
+
+    users._TOKEN_CACHE.clear()
+    uncached = _measure(
+        "uncached",
+        lambda: jwt.decode(token, key.verification_key, algorithms=[key.algorithm]),
+        iterations,
+    )
+    cached = _measure("cached", lambda: users.decode_token(token), iterations)
+    print(f"speedup    {cached / uncached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
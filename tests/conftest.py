@@ -2,7 +2,8 @@
 
 import os
 import pytest
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from app.core.database import Base
 
@@ -15,18 +16,19 @@ os.environ.setdefault("JWT_SECRET_KEY", "testsecret")
 os.environ.setdefault("JWT_ALGORITHM", "HS256")
 os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
 
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, instrument_engine
 from app.main import app
 from fastapi.testclient import TestClient
 from app.models.user import User
 from app.models.user_role import UserRole
 from app.models.language import Language
+from app.services.reference_data import reference_data
 from app.utils.security import get_password_hash
 
 # Ensure the test database directory exists
 os.makedirs("tests/databases", exist_ok=True)
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+engine = instrument_engine(create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}))
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -67,4 +69,42 @@ def client(db):
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
-    yield TestClient(app)
\ No newline at end of file
+    yield TestClient(app)
+
+@pytest.fixture(autouse=True)
+def fresh_reference_data():
+    """Tests insert languages and roles directly: reload the registry for each test."""
+    reference_data.invalidate()
+    yield
+    reference_data.invalidate()
+
+
+@pytest.fixture
+def assert_num_queries(db):
+    """
+    Pin the number of SQL statements a block executes on the test engine.
+
+    The session identity map is expired first, so lazy loads are counted:
+
+        with assert_num_queries(2):
+            client.post("/login", json=...)
+    """
+
+    @contextmanager
+    def check(expected: int):
+        db.expire_all()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert len(statements) == expected, (
+            f"Expected {expected} SQL statements, got {len(statements)}:\n" + "\n".join(statements)
+        )
+
+    return check
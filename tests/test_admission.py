@@ -0,0 +1,85 @@
+# tests/test_admission.py
+
+import asyncio
+import pytest
+from app.core.admission import AdmissionLimiter, AdmissionRejected
+
+
+def test_limiter_admits_up_to_max_concurrency():
+    """
+    Test that holders up to the concurrency limit are admitted without waiting.
+    """
+    async def run():
+        limiter = AdmissionLimiter(max_concurrency=2, max_queue=0, deadline=1.0)
+        async with limiter.slot():
+            async with limiter.slot():
+                assert limiter.snapshot()["active"] == 2
+        return limiter.snapshot()
+
+    snapshot = asyncio.run(run())
+
+    assert snapshot["active"] == 0
+    assert snapshot["admitted"] == 2
+    assert snapshot["rejected_queue_full"] == 0
+
+
+def test_limiter_rejects_when_queue_full():
+    """
+    Test that callers beyond the wait queue are rejected immediately.
+    """
+    async def run():
+        limiter = AdmissionLimiter(max_concurrency=1, max_queue=0, deadline=1.0, retry_after=3)
+        async with limiter.slot():
+            with pytest.raises(AdmissionRejected) as exc_info:
+                async with limiter.slot():
+                    pass
+        return limiter.snapshot(), exc_info.value
+
+    snapshot, exc = asyncio.run(run())
+
+    assert exc.reason == "queue_full"
+    assert exc.retry_after == 3
+    assert snapshot["rejected_queue_full"] == 1
+
+
+def test_limiter_rejects_waiter_after_deadline():
+    """
+    Test that a queued caller is rejected once its deadline expires and leaves the queue.
+    """
+    async def run():
+        limiter = AdmissionLimiter(max_concurrency=1, max_queue=1, deadline=0.01)
+        async with limiter.slot():
+            with pytest.raises(AdmissionRejected) as exc_info:
+                async with limiter.slot():
+                    pass
+            assert limiter.snapshot()["queue_depth"] == 0
+        return limiter.snapshot(), exc_info.value
+
+    snapshot, exc = asyncio.run(run())
+
+    assert exc.reason == "deadline_exceeded"
+    assert snapshot["rejected_deadline"] == 1
+    assert snapshot["active"] == 0
+
+
+def test_limiter_hands_slot_to_queued_waiter():
+    """
+    Test that a released slot is handed to the queued caller in FIFO order.
+    """
+    async def run():
+        limiter = AdmissionLimiter(max_concurrency=1, max_queue=1, deadline=1.0)
+        order = []
+
+        async def worker(name, hold):
+            async with limiter.slot():
+                order.append(name)
+                await asyncio.sleep(hold)
+
+        await asyncio.gather(worker("first", 0.01), worker("second", 0))
+        return order, limiter.snapshot()
+
+    order, snapshot = asyncio.run(run())
+
+    assert order == ["first", "second"]
+    assert snapshot["admitted"] == 2
+    assert snapshot["active"] == 0
@@ -0,0 +1,124 @@
+# tests/test_database.py
+
+import asyncio
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from app.core import database
+from app.core.database import Base, is_async_database_url, run_db, sync_database_url
+from app.models.language import Language
+
+
+def test_async_driver_detection():
+    """
+    Only async drivers select the async engine.
+    """
+    assert is_async_database_url("postgresql+asyncpg://u:p@db/app")
+    assert is_async_database_url("sqlite+aiosqlite:///./app.db")
+    assert not is_async_database_url("postgresql://u:p@db/app")
+    assert not is_async_database_url("sqlite:///./app.db")
+
+
+def test_sync_database_url_maps_async_drivers():
+    """
+    Scripts get the sync driver for the same database, password included.
+    """
+    assert sync_database_url("postgresql+asyncpg://u:p@db:5432/app") == "postgresql+psycopg2://u:p@db:5432/app"
+    assert sync_database_url("sqlite+aiosqlite:///./app.db") == "sqlite+pysqlite:///./app.db"
+    assert sync_database_url("postgresql://u:p@db/app") == "postgresql://u:p@db/app"
+
+
+def _answer(db, value):
+    return db.execute(text("SELECT :v"), {"v": value}).scalar_one()
+
+
+def test_run_db_with_sync_session():
+    """
+    A plain Session runs the function in the threadpool.
+    """
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+    with sessionmaker(bind=engine)() as db:
+        assert asyncio.run(run_db(db, _answer, 42)) == 42
+
+
+def test_run_db_with_async_session():
+    """
+    An AsyncSession runs the same Session-based function via run_sync.
+    """
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with async_sessionmaker(bind=engine)() as db:
+            result = await run_db(db, _answer, 7)
+        await engine.dispose()
+        return result
+
+    assert asyncio.run(scenario()) == 7
+
+
+def test_get_db_yields_async_session_in_async_mode(monkeypatch):
+    """
+    DATABASE_URL with an async driver makes get_db yield an AsyncSession.
+    """
+    monkeypatch.setenv("DATABASE_URL", "sqlite+aiosqlite://")
+    monkeypatch.setattr(database, "_ASYNC_ENGINE", None)
+    monkeypatch.setattr(database, "_AsyncSessionLocal", None)
+
+    async def scenario():
+        gen = database.get_db()
+        db = await gen.__anext__()
+        kind = type(db).__name__
+        assert await run_db(db, _answer, 1) == 1
+        await gen.aclose()
+        await database.get_async_engine().dispose()
+        return kind
+
+    assert asyncio.run(scenario()) == "AsyncSession"
+
+
+def _commit_then_read(db):
+    """Commit a new row, then count the statements needed to read it back."""
+    language = Language(code="zz", name="Test")
+    db.add(language)
+    db.commit()
+
+    statements = []
+    engine = db.get_bind()
+    record = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert (language.code, language.name) == ("zz", "Test")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+@pytest.mark.parametrize("driver", ["sqlite", "sqlite+aiosqlite"])
+def test_attributes_readable_after_commit_in_both_modes(monkeypatch, tmp_path, driver):
+    """
+    The app's sync and async session factories share expire_on_commit=False:
+    the same run_db helper reads committed attributes without a refresh query.
+    """
+    path = tmp_path / "session.db"
+    setup_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(setup_engine)
+    setup_engine.dispose()
+
+    monkeypatch.setenv("DATABASE_URL", f"{driver}:///{path}")
+    monkeypatch.delenv("DATABASE_REPLICA_URLS", raising=False)
+    for name in ("_ENGINE", "_SessionLocal", "_ASYNC_ENGINE", "_AsyncSessionLocal", "_REPLICAS"):
+        monkeypatch.setattr(database, name, None)
+
+    async def scenario():
+        gen = database.get_db()
+        db = await gen.__anext__()
+        try:
+            return await run_db(db, _commit_then_read)
+        finally:
+            await gen.aclose()
+            if database.is_async_mode():
+                await database.get_async_engine().dispose()
+            else:
+                database.get_engine().dispose()
+
+    assert asyncio.run(scenario()) == 0
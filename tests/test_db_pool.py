@@ -0,0 +1,101 @@
+# tests/test_db_pool.py
+
+import asyncio
+import pytest
+from sqlalchemy import create_engine, exc, text
+from app.core import database
+from app.core.db_pool import InstrumentedQueuePool, pool_options, pool_snapshot, warmup_size
+
+
+def test_pool_options_from_env(monkeypatch):
+    """
+    Pool sizing and pre-ping follow the DB_POOL_* variables.
+    """
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "3")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "1800")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+
+    options = pool_options("postgresql://u:p@db/app")
+
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 0
+    assert options["pool_timeout"] == 3
+    assert options["pool_recycle"] == 1800
+    assert options["pool_pre_ping"] is False
+
+
+def test_pool_options_keep_memory_sqlite_pool():
+    """
+    In-memory SQLite keeps its single-connection pool.
+    """
+    assert "poolclass" not in pool_options("sqlite://")
+
+
+def test_invalid_pool_setting_raises(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "many")
+    with pytest.raises(EnvironmentError):
+        pool_options("postgresql://u:p@db/app")
+
+
+def test_warmup_is_capped_at_pool_size(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "4")
+    monkeypatch.setenv("DB_POOL_WARMUP", "50")
+    assert warmup_size() == 4
+
+
+def test_instrumented_pool_records_checkouts_and_timeouts(tmp_path):
+    """
+    Checkouts and pool timeouts show up in the pool snapshot.
+    """
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        busy = pool_snapshot(engine.pool)
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    snapshot = pool_snapshot(engine.pool)
+    engine.dispose()
+
+    assert busy["checked_out"] == 1
+    assert snapshot["checked_out"] == 0
+    assert snapshot["checkouts"] == 1
+    assert snapshot["timeouts"] == 1
+    assert snapshot["wait_seconds_max"] >= 0.05
+
+
+def test_warm_up_pool_opens_connections(monkeypatch, tmp_path):
+    """
+    Startup warm-up leaves DB_POOL_WARMUP idle connections in the pool.
+    """
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'warm.db'}")
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setattr(database, "_ENGINE", None)
+    monkeypatch.setattr(database, "_SessionLocal", None)
+
+    opened = asyncio.run(database.warm_up_pool())
+    snapshot = pool_snapshot(database.get_engine().pool)
+    database.get_engine().dispose()
+
+    assert opened == 3
+    assert snapshot["checked_in"] == 3
+    assert snapshot["checked_out"] == 0
+
+
+def test_pool_metrics_exposed(client):
+    """
+    /metrics reports the pool of every engine created so far.
+    """
+    database.get_engine()
+    metrics = client.get("/metrics").json()
+    assert metrics["db_pool"]["mode"] == "sync"
+    assert "checked_out" in metrics["db_pool"]["sync"]
@@ -0,0 +1,148 @@
+# tests/test_db_routing.py
+
+import asyncio
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, exc, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+from app.core import db_routing
+from app.core.db_routing import ReplicaSet, RoutingSession, record_write, stick_to_primary_if_written, use_primary
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+    id = Column(Integer, primary_key=True)
+    origin = Column(String(20))
+
+
+def _database(path, origin):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(Item.__table__.insert(), [{"id": 1, "origin": origin}])
+    return engine
+
+
+@pytest.fixture
+def engines(tmp_path):
+    primary = _database(tmp_path / "primary.db", "primary")
+    replicas = [_database(tmp_path / f"replica{i}.db", f"replica{i}") for i in range(2)]
+    yield primary, replicas
+    for engine in [primary, *replicas]:
+        engine.dispose()
+
+
+def _factory(primary, replicas):
+    return sessionmaker(class_=RoutingSession, bind=primary, replicas=ReplicaSet(replicas))
+
+
+def _origin(db):
+    return db.execute(select(Item.origin).where(Item.id == 1)).scalar_one()
+
+
+def test_reads_round_robin_over_replicas(engines):
+    primary, replicas = engines
+    factory = _factory(primary, replicas)
+
+    origins = []
+    for _ in range(4):
+        with factory() as db:
+            origins.append(_origin(db))
+
+    assert origins == ["replica0", "replica1", "replica0", "replica1"]
+
+
+def test_session_reads_its_writes_from_primary(engines):
+    """
+    After a flush, every later read of the session goes to the primary.
+    """
+    primary, replicas = engines
+    with _factory(primary, replicas)() as db:
+        assert _origin(db) == "replica0"
+        db.add(Item(id=2, origin="new"))
+        db.commit()
+        assert _origin(db) == "primary"
+        assert db.get(Item, 2).origin == "new"
+
+
+def test_writes_locking_reads_and_text_use_primary(engines):
+    primary, replicas = engines
+    factory = _factory(primary, replicas)
+
+    with factory() as db:
+        db.execute(Item.__table__.update().values(origin="updated"))
+        db.commit()
+    with factory() as db:
+        assert db.execute(text("SELECT origin FROM items WHERE id = 1")).scalar_one() == "updated"
+    with factory() as db:
+        query = select(Item.origin).where(Item.id == 1).with_for_update()
+        assert db.execute(query).scalar_one() == "updated"
+
+
+def test_use_primary_pins_session(engines):
+    primary, replicas = engines
+    with _factory(primary, replicas)() as db:
+        use_primary(db)
+        assert _origin(db) == "primary"
+
+
+def test_failed_replica_is_skipped(engines, tmp_path):
+    """
+    A replica that cannot be reached is marked down; reads fall back to the primary.
+    """
+    primary, _ = engines
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    factory = _factory(primary, [broken])
+
+    with factory() as db:
+        with pytest.raises(exc.OperationalError):
+            _origin(db)
+    with factory() as db:
+        assert _origin(db) == "primary"
+
+    replicas = factory.kw["replicas"]
+    assert replicas.snapshot()[0]["healthy"] is False
+    replicas.mark_up(broken)
+    assert replicas.choose() is broken
+
+
+def test_recent_write_sticks_to_primary(engines, monkeypatch):
+    """
+    Reads about a key written within the sticky window go to the primary.
+    """
+    monkeypatch.setattr(db_routing._RECENT_WRITES, "ttl", 5.0)
+    primary, replicas = engines
+    factory = _factory(primary, replicas)
+
+    record_write(("item", 1))
+    with factory() as db:
+        stick_to_primary_if_written(db, ("item", 1))
+        assert _origin(db) == "primary"
+    with factory() as db:
+        stick_to_primary_if_written(db, ("item", 2))
+        assert _origin(db).startswith("replica")
+
+
+def test_async_session_routes_to_replica(engines, tmp_path):
+    """
+    AsyncSession with RoutingSession as its sync session routes the same way.
+    """
+    async def scenario():
+        primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+        replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica0.db'}")
+        factory = async_sessionmaker(
+            bind=primary,
+            sync_session_class=RoutingSession,
+            replicas=ReplicaSet([replica.sync_engine]),
+        )
+        async with factory() as db:
+            before = await db.run_sync(_origin)
+            use_primary(db.sync_session)
+            after = await db.run_sync(_origin)
+        await primary.dispose()
+        await replica.dispose()
+        return before, after
+
+    assert asyncio.run(scenario()) == ("replica0", "primary")
@@ -0,0 +1,66 @@
+# tests/test_jwt_codec.py
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from jose import jwt
+from jose.exceptions import ExpiredSignatureError, JWTError
+from app.utils.jwt_codec import HMACCodec, JoseCodec
+from app.utils.keyring import build_signing_key
+
+
+@pytest.fixture
+def hs256_key():
+    return build_signing_key("hs-test", "HS256", "codec-secret")
+
+
+def _claims(minutes=5):
+    return {"sub": "1", "exp": datetime.now(timezone.utc) + timedelta(minutes=minutes)}
+
+
+def test_hmac_codec_interoperates_with_jose(hs256_key):
+    """
+    Test that tokens from either backend verify with the other.
+    """
+    hmac_codec, jose_codec = HMACCodec(), JoseCodec()
+
+    token = hmac_codec.encode(_claims(), hs256_key)
+    assert jwt.decode(token, "codec-secret", algorithms=["HS256"])["sub"] == "1"
+    assert jose_codec.decode(token, hs256_key)["sub"] == "1"
+    assert hmac_codec.get_unverified_header(token)["kid"] == "hs-test"
+
+    token = jose_codec.encode(_claims(), hs256_key)
+    assert hmac_codec.decode(token, hs256_key)["sub"] == "1"
+
+
+def test_hmac_codec_rejects_expired_and_tampered_tokens(hs256_key):
+    """
+    Test that expiry and signature checks raise python-jose exceptions.
+    """
+    codec = HMACCodec()
+
+    with pytest.raises(ExpiredSignatureError):
+        codec.decode(codec.encode(_claims(minutes=-1), hs256_key), hs256_key)
+
+    token = codec.encode(_claims(), hs256_key)
+    header, payload, signature = token.split(".")
+    tampered = ".".join([header, payload, signature[:-2] + ("AA" if signature[-2:] != "AA" else "BB")])
+    with pytest.raises(JWTError):
+        codec.decode(tampered, hs256_key)
+
+    with pytest.raises(JWTError):
+        codec.decode("not-a-token", hs256_key)
+
+
+def test_hmac_codec_only_accepts_whitelisted_algorithms(hs256_key):
+    """
+    Test that 'none' and mismatched algorithms are rejected.
+    """
+    codec = HMACCodec()
+    unsigned = jwt.encode({"sub": "1"}, "codec-secret", algorithm="HS384")
+    with pytest.raises(JWTError):
+        codec.decode(unsigned, hs256_key)
+
+    header = "eyJhbGciOiJub25lIiwidHlwIjoiSldUIn0"  # {"alg":"none","typ":"JWT"}
+    payload = codec.encode(_claims(), hs256_key).split(".")[1]
+    with pytest.raises(JWTError):
+        codec.decode(f"{header}.{payload}.", hs256_key)
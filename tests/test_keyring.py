@@ -0,0 +1,157 @@
+# tests/test_keyring.py
+
+import ecdsa
+import pytest
+from jose import jwt
+from app.services import users
+from app.utils import security
+from app.utils.jwt_codec import JoseCodec, get_codec, set_codec
+from app.utils.keyring import KeyRing, build_signing_key, get_keyring, set_keyring
+
+
+@pytest.fixture
+def es256_keyring():
+    """Install a single ES256 key as the active key ring."""
+    pem = ecdsa.SigningKey.generate(curve=ecdsa.NIST256p).to_pem().decode("utf-8")
+    key = build_signing_key("es-test", "ES256", pem)
+    original, original_codec = get_keyring(), get_codec()
+    set_keyring(KeyRing([key], active_kid=key.kid))
+    set_codec(JoseCodec())  # the hmac codec only handles HS* keys
+    users._TOKEN_CACHE.clear()
+    yield key
+    set_keyring(original)
+    set_codec(original_codec)
+    users._TOKEN_CACHE.clear()
+
+
+def test_hmac_key_is_not_published():
+    """
+    Test that symmetric keys get a kid but never appear in the JWKS document.
+    """
+    key = build_signing_key(None, "HS256", "testsecret")
+    keyring = KeyRing([key], active_kid=key.kid)
+
+    assert key.kid
+    assert keyring.jwks == {"keys": []}
+
+
+def test_unsupported_algorithm_is_rejected():
+    """
+    Test that an unknown algorithm is reported as a configuration error.
+    """
+    with pytest.raises(EnvironmentError):
+        build_signing_key(None, "none", "material")
+
+
+def test_asymmetric_token_verifies_with_published_key(es256_keyring):
+    """
+    Test that ES256 tokens carry the kid and verify with the public JWK only.
+    """
+    token = security.create_access_token({"sub": "42"})
+
+    assert jwt.get_unverified_header(token)["kid"] == "es-test"
+
+    public_jwk = get_keyring().jwks["keys"][0]
+    assert "d" not in public_jwk
+    decoded = jwt.decode(token, public_jwk, algorithms=["ES256"])
+    assert decoded["sub"] == "42"
+
+    assert users.decode_token(token)["sub"] == "42"
+
+
+def test_unknown_kid_is_rejected(es256_keyring):
+    """
+    Test that tokens naming a kid outside the key ring are rejected.
+    """
+    token = jwt.encode({"sub": "1"}, "other", algorithm="HS256", headers={"kid": "unknown"})
+
+    with pytest.raises(users.JWTError):
+        users.decode_token(token)
+
+
+def test_jwks_endpoint_serves_cacheable_document(client, es256_keyring):
+    """
+    Test that the JWKS endpoint returns the public keys with cache headers.
+    """
+    response = client.get("/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"].startswith("public")
+    body = response.json()
+    assert [k["kid"] for k in body["keys"]] == ["es-test"]
+
+    etag = response.headers["ETag"]
+    response = client.get("/.well-known/jwks.json", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def _write_keyring(path, active, keys):
+    import json
+    path.write_text(json.dumps({"active": active, "keys": keys}))
+
+
+@pytest.fixture
+def keyring_file(tmp_path, monkeypatch):
+    """Point the application at a key ring file that reloads on every check."""
+    path = tmp_path / "keyring.json"
+    monkeypatch.setenv("JWT_KEYRING_FILE", str(path))
+    monkeypatch.setenv("JWT_KEYRING_RELOAD_SECONDS", "0")
+    original = get_keyring()
+    yield path
+    set_keyring(original)
+    users._TOKEN_CACHE.clear()
+
+
+def test_rotation_keeps_previous_key_during_overlap(keyring_file):
+    """
+    Test that tokens signed by the previous key verify until its not_after.
+    """
+    import os
+
+    _write_keyring(keyring_file, "k1", [{"kid": "k1", "algorithm": "HS256", "secret": "one"}])
+    set_keyring(None)
+    old_token = security.create_access_token({"sub": "7"})
+    assert jwt.get_unverified_header(old_token)["kid"] == "k1"
+
+    # Rotate: k2 signs, k1 verifies during the overlap window
+    _write_keyring(keyring_file, "k2", [
+        {"kid": "k2", "algorithm": "HS256", "secret": "two"},
+        {"kid": "k1", "algorithm": "HS256", "secret": "one", "not_after": "2999-01-01T00:00:00Z"},
+    ])
+    os.utime(keyring_file, (1, 1))
+
+    new_token = security.create_access_token({"sub": "7"})
+    assert jwt.get_unverified_header(new_token)["kid"] == "k2"
+    assert users.decode_token(old_token)["sub"] == "7"
+    assert users.decode_token(new_token)["sub"] == "7"
+
+
+def test_key_past_overlap_window_is_rejected(keyring_file):
+    """
+    Test that a retired key no longer verifies once its window has ended.
+    """
+    _write_keyring(keyring_file, "k2", [
+        {"kid": "k2", "algorithm": "HS256", "secret": "two"},
+        {"kid": "k1", "algorithm": "HS256", "secret": "one", "not_after": "2000-01-01T00:00:00Z"},
+    ])
+    set_keyring(None)
+    token = jwt.encode({"sub": "7"}, "one", algorithm="HS256", headers={"kid": "k1"})
+
+    with pytest.raises(users.JWTError):
+        users.decode_token(token)
+
+
+def test_broken_keyring_file_keeps_previous_ring(keyring_file):
+    """
+    Test that an invalid key ring file does not replace the loaded ring.
+    """
+    import os
+
+    _write_keyring(keyring_file, "k1", [{"kid": "k1", "algorithm": "HS256", "secret": "one"}])
+    set_keyring(None)
+    assert get_keyring().active.kid == "k1"
+
+    keyring_file.write_text("{not json")
+    os.utime(keyring_file, (2, 2))
+
+    assert get_keyring().active.kid == "k1"
@@ -0,0 +1,57 @@
+# tests/test_normalization.py
+
+import pytest
+from sqlalchemy import create_engine, func, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models.language import Language
+from app.models.user import User
+from app.models.user_role import UserRole
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all([UserRole(name="User"), Language(code=" EN ", name="English")])
+    db.commit()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+def _user(email: str) -> User:
+    return User(name="x", email=email, hashed_password="x", role_id=1, language_id=1)
+
+
+def test_identifiers_are_stored_normalized(session):
+    session.add(_user("  Foo@Example.NET "))
+    session.commit()
+
+    assert session.query(User.email).scalar() == "foo@example.net"
+    assert session.query(UserRole.name).scalar() == "user"
+    assert session.query(Language.code).scalar() == "en"
+
+
+def test_case_only_duplicates_are_rejected(session):
+    session.add(_user("foo@example.net"))
+    session.commit()
+
+    # Bypass the ORM normalization: the lower(email) index still applies
+    with pytest.raises(IntegrityError):
+        session.execute(
+            text("INSERT INTO users (name, email, hashed_password, role_id, language_id, token_version) "
+                 "VALUES ('y', 'FOO@example.net', 'x', 1, 1, 0)")
+        )
+    session.rollback()
+
+
+def test_lookup_uses_lower_index(session):
+    query = session.query(User.id).filter(func.lower(User.email) == "foo@example.net")
+    sql = str(query.statement.compile(compile_kwargs={"literal_binds": True}))
+
+    plan = " ".join(str(row) for row in session.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+    assert "ix_users_email_lower" in plan
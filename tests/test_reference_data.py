@@ -0,0 +1,71 @@
+# tests/test_reference_data.py
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models.language import Language
+from app.models.user_role import UserRole
+from app.services.reference_data import ReferenceDataRegistry
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    db = sessionmaker(bind=engine)()
+    db.add_all([
+        Language(code="en", name="English"),
+        Language(code="es", name="Spanish"),
+        UserRole(name="Admin"),
+        UserRole(name="user"),
+    ])
+    db.commit()
+    statements.clear()
+    db.statements = statements
+    yield db
+    db.close()
+    engine.dispose()
+
+
+def test_lookups_are_case_insensitive(session):
+    registry = ReferenceDataRegistry(ttl=300)
+
+    assert registry.language(session, " ES ").code == "es"
+    assert registry.role(session, "admin").name == "admin"
+    assert registry.role(session, "USER").name == "user"
+    assert registry.language(session, "de") is None
+    assert registry.role(session, "nobody") is None
+
+
+def test_lookups_do_not_query_after_load(session):
+    registry = ReferenceDataRegistry(ttl=300)
+    registry.load(session)
+    loaded = len(session.statements)
+
+    for _ in range(10):
+        registry.language(session, "en")
+        registry.role(session, "admin")
+        registry.role_by_id(session, 1)
+
+    assert len(session.statements) == loaded == 2
+
+
+def test_invalidate_and_ttl_reload(session):
+    registry = ReferenceDataRegistry(ttl=300)
+    assert registry.language(session, "fr") is None
+
+    session.add(Language(code="fr", name="French"))
+    session.commit()
+    assert registry.language(session, "fr") is None
+
+    registry.invalidate()
+    assert registry.language(session, "fr").name == "French"
+
+    registry.ttl = 0
+    session.add(UserRole(name="auditor"))
+    session.commit()
+    assert registry.role(session, "auditor") is not None
+    assert registry.stats()["loads"] == 3
@@ -1,5 +1,6 @@
 # tests/test_security.py
 
+import asyncio
 import os
 import pytest
 from datetime import datetime, timezone, timedelta
@@ -75,3 +76,27 @@ def test_create_access_token_with_custom_expiry(fake_env):
         # Check that expiry is within a few seconds of now + 5 minutes
         expected_expiry = now + expires
         assert abs((expire_time - expected_expiry).total_seconds()) < 5
+
+def test_async_hash_and_verify_use_hash_executor():
+    """
+    Test that the async helpers hash and verify passwords on the dedicated executor.
+    """
+    async def run():
+        hashed = await security.get_password_hash_async("securepassword123")
+        ok = await security.verify_password_async("securepassword123", hashed)
+        bad = await security.verify_password_async("wrongpassword", hashed)
+        return hashed, ok, bad
+
+    hashed, ok, bad = asyncio.run(run())
+
+    assert security.verify_password("securepassword123", hashed) is True
+    assert ok is True
+    assert bad is False
+
+def test_hash_executor_rejects_unknown_kind():
+    """
+    Test that an unsupported PASSWORD_HASH_EXECUTOR value is reported as a configuration error.
+    """
+    with patch.dict(os.environ, {"PASSWORD_HASH_EXECUTOR": "gpu"}):
+        with pytest.raises(EnvironmentError):
+            security._init_hash_executor()
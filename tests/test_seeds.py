@@ -0,0 +1,81 @@
+# tests/test_seeds.py
+
+"""Test suite for the seeds: set-based upserts and the synthetic users seeder."""
+
+import pytest
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.db.seeds import run_seeds, seed_synthetic_users
+from app.models.language import Language
+from app.models.user import User
+from app.models.user_role import UserRole
+from app.utils.security import verify_password
+
+
+@pytest.fixture
+def seed_db():
+    """A private in-memory database, so seeded rows don't leak into other tests."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _synthetic(db):
+    return [
+        tuple(row)
+        for row in db.query(User.email, User.name, User.hashed_password, User.is_active, User.role_id, User.language_id)
+        .filter(User.email.like("synthetic%"))
+        .order_by(User.id)
+    ]
+
+
+def test_run_seeds_is_idempotent(seed_db):
+    seed_db.add(UserRole(name="ADMIN", description="Pre-existing"))
+    seed_db.commit()
+
+    run_seeds(seed_db)
+    run_seeds(seed_db)
+
+    assert seed_db.query(func.count(UserRole.id)).scalar() == 3
+    assert seed_db.query(UserRole.description).filter(UserRole.name == "admin").scalar() == "Pre-existing"
+    assert seed_db.query(func.count(Language.id)).scalar() == 3
+    assert seed_db.query(func.count(User.id)).scalar() == 4
+
+
+def test_synthetic_users_are_deterministic_and_resumable(seed_db):
+    run_seeds(seed_db, include_examples=False)
+
+    assert seed_synthetic_users(seed_db, 30, seed=7, hash_pool_size=2, batch_size=8) == 30
+    first = _synthetic(seed_db)
+    seed_db.query(User).filter(User.email.in_([first[3][0], first[20][0]])).delete(synchronize_session=False)
+    seed_db.commit()
+
+    # Only the two missing users are recreated, identical to before
+    assert seed_synthetic_users(seed_db, 30, seed=7, hash_pool_size=2, batch_size=8) == 2
+    assert sorted(_synthetic(seed_db)) == sorted(first)
+    assert verify_password("synthetic-password-1", first[1][2])
+
+
+def test_synthetic_users_follow_weights(seed_db):
+    run_seeds(seed_db, include_examples=False)
+    admin_id = seed_db.query(UserRole.id).filter(UserRole.name == "admin").scalar()
+    fr_id = seed_db.query(Language.id).filter(Language.code == "fr").scalar()
+
+    seed_synthetic_users(
+        seed_db, 20, role_weights={"admin": 1}, language_weights={"FR": 1, "en": 0},
+        inactive_ratio=0, hash_pool_size=1,
+    )
+
+    assert {row[3:] for row in _synthetic(seed_db)} == {(True, admin_id, fr_id)}
+
+
+def test_synthetic_users_require_known_roles(seed_db):
+    run_seeds(seed_db, include_examples=False)
+    with pytest.raises(ValueError):
+        seed_synthetic_users(seed_db, 1, role_weights={"owner": 1}, hash_pool_size=1)
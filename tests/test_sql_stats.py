@@ -0,0 +1,59 @@
+# tests/test_sql_stats.py
+
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from app.core.database import instrument_engine
+from app.core.sql_stats import SQLStatsMiddleware, route_totals
+
+
+def _app(expose_header: bool) -> FastAPI:
+    engine = instrument_engine(create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ))
+
+    def run_queries(n: int) -> None:
+        with engine.connect() as conn:
+            for _ in range(n):
+                conn.execute(text("SELECT 1"))
+
+    app = FastAPI()
+
+    @app.get("/items/{n}")
+    async def items(n: int):
+        # Same path as the routes: DB work in the threadpool
+        await run_in_threadpool(run_queries, n)
+        return {"n": n}
+
+    app.add_middleware(SQLStatsMiddleware, expose_header=expose_header)
+    return app
+
+
+def test_header_reports_request_statements():
+    client = TestClient(_app(expose_header=True))
+
+    response = client.get("/items/3")
+
+    assert response.headers["x-db-query-count"] == "3"
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert 'desc="3 queries"' in response.headers["server-timing"]
+
+
+def test_header_is_opt_in():
+    response = TestClient(_app(expose_header=False)).get("/items/1")
+    assert "x-db-query-count" not in response.headers
+
+
+def test_totals_are_aggregated_per_route():
+    route_totals.clear()
+    client = TestClient(_app(expose_header=False))
+
+    client.get("/items/1")
+    client.get("/items/3")
+
+    totals = route_totals.snapshot()["GET /items/{n}"]
+    assert totals["requests"] == 2
+    assert totals["statements"] == 4
+    assert totals["statements_max"] == 3
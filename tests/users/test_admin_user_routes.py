@@ -1,12 +1,14 @@
 # tests/users/test_admin_user_routes.py
 
-"""Test suite for admin-only partial updates via PATCH /users/{user_id}."""
+"""Test suite for admin-only user management: GET /users and PATCH /users/{user_id}."""
 
 import uuid
 import pytest
 from app.models.user import User
 from app.models.user_role import UserRole
 from app.models.language import Language
+from app.services.reference_data import reference_data
+from app.services.users import clear_principal_cache
 from app.utils.security import get_password_hash, create_access_token
 
 
@@ -72,6 +74,27 @@ def test_patch_user_is_active_success(client, db, regular_user):
     assert "is_active" in body["data"]["updated_fields"]
 
 
+def test_patch_user_query_count(client, db, regular_user, assert_num_queries):
+    """
+    With warm reference data: admin principal and one UPDATE ... RETURNING.
+    """
+    token = _admin_token(db)
+    user_id = regular_user.id
+    reference_data.load(db)
+    clear_principal_cache()
+
+    with assert_num_queries(2) as statements:
+        response = client.patch(
+            f"/users/{user_id}",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"language": "EN", "role": "user"},
+        )
+
+    assert response.status_code == 200
+    assert "RETURNING" in statements[-1]
+    assert response.json()["data"]["user_role"] == "user"
+
+
 def test_patch_user_not_found(client, db):
     """
     Returns 404 when target user does not exist.
@@ -281,3 +304,257 @@ def test_patch_user_multiple_fields_success(client, db, regular_user):
     # Ensure updated_fields contains all three keys (order not guaranteed)
     fields = set(body["data"]["updated_fields"])
     assert {"is_active", "language", "role"} <= fields
+
+
+def test_patch_user_deactivation_invalidates_cached_principal(client, db, regular_user):
+    """
+    A cached principal must not outlive an admin deactivation.
+    Expects:
+      - first self-update succeeds (principal cached)
+      - after PATCH is_active=False the same token gets 401
+    """
+    user_token = create_access_token(data={"sub": str(regular_user.id)})
+    headers = {"Authorization": f"Bearer {user_token}"}
+
+    response = client.put("/users/me", headers=headers, json={"language_code": "en"})
+    assert response.status_code == 200
+
+    response = client.patch(
+        f"/users/{regular_user.id}",
+        headers={"Authorization": f"Bearer {_admin_token(db)}"},
+        json={"is_active": False},
+    )
+    assert response.status_code == 200
+
+    response = client.put("/users/me", headers=headers, json={"language_code": "en"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Inactive or invalid user"
+
+
+def _list(client, token, **params):
+    return client.get("/users", headers={"Authorization": f"Bearer {token}"}, params=params)
+
+
+def test_list_users_keyset_pages_cover_all_users(client, db, regular_user):
+    """
+    Following next_cursor visits every user exactly once, in id order.
+    """
+    token = _admin_token(db)
+    expected = [u.id for u in db.query(User.id).order_by(User.id)]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        body = _list(client, token, **params).json()
+        seen.extend(u["user_id"] for u in body["data"]["users"])
+        cursor = body["data"]["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+
+def test_list_users_newest_first_and_projection(client, db, regular_user):
+    token = _admin_token(db)
+
+    body = _list(client, token, limit=1, order="desc").json()
+
+    user = body["data"]["users"][0]
+    assert user["user_id"] == db.query(User.id).order_by(User.id.desc()).first()[0]
+    assert set(user) == {
+        "user_id", "user_name", "user_email", "user_role", "user_language", "is_active", "created_at",
+    }
+
+
+def test_list_users_filters(client, db, regular_user):
+    token = _admin_token(db)
+    regular_user.is_active = False
+    db.commit()
+
+    body = _list(client, token, role="USER", language="en", is_active=False, limit=500).json()
+    users = body["data"]["users"]
+
+    assert regular_user.id in [u["user_id"] for u in users]
+    assert all(u["user_role"] == "user" and u["is_active"] is False for u in users)
+    assert _list(client, token, role="nobody").json()["data"] == {"users": [], "next_cursor": None}
+
+
+def test_list_users_query_count_and_no_password_hash(client, db, regular_user, assert_num_queries):
+    """
+    With warm reference data: one principal lookup and one page query, without hashed_password.
+    """
+    token = _admin_token(db)
+    reference_data.load(db)
+    clear_principal_cache()
+
+    with assert_num_queries(2) as statements:
+        response = _list(client, token, limit=10)
+
+    assert response.status_code == 200
+    assert "hashed_password" not in statements[-1]
+
+
+def test_list_users_invalid_cursor_400(client, db):
+    response = _list(client, _admin_token(db), cursor="bm9wZQ")
+    assert response.status_code == 400
+    assert response.json()["message"] == "Invalid cursor"
+
+
+def test_list_users_forbidden_for_regular_user(client, db, regular_user):
+    token = create_access_token(data={"sub": str(regular_user.id)})
+    assert _list(client, token).status_code == 403
+
+
+
+def _bulk(client, token, payload):
+    return client.patch("/users", headers={"Authorization": f"Bearer {token}"}, json=payload)
+
+
+@pytest.fixture
+def regular_users(db, regular_user):
+    """Three regular users (same role and language)."""
+    users = [regular_user]
+    for _ in range(2):
+        user = User(
+            name="Regular",
+            email=f"{uuid.uuid4().hex}@example.net",
+            hashed_password="x",
+            role_id=regular_user.role_id,
+            language_id=regular_user.language_id,
+            is_active=True,
+        )
+        db.add(user)
+        users.append(user)
+    db.commit()
+    return users
+
+
+def test_bulk_update_by_ids_with_per_id_results(client, db, regular_users):
+    token = _admin_token(db)
+    ids = [u.id for u in regular_users]
+
+    response = _bulk(client, token, {"user_ids": ids + [999999], "changes": {"is_active": False}})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["matched"] == 3
+    assert {r["user_id"]: r["status"] for r in data["results"]} == {
+        **{i: "updated" for i in ids}, 999999: "not_found",
+    }
+    db.expire_all()
+    users = db.query(User).filter(User.id.in_(ids)).all()
+    assert all(u.is_active is False and u.token_version >= 1 for u in users)
+
+
+def test_bulk_update_by_filter(client, db, regular_users):
+    token = _admin_token(db)
+    lang_fr = db.query(Language).filter_by(code="fr").first()
+    if not lang_fr:
+        db.add(Language(code="fr", name="French"))
+        db.commit()
+    marker = regular_users[0]
+    marker.is_active = False
+    db.commit()
+
+    response = _bulk(client, token, {
+        "filter": {"role": "user", "is_active": False},
+        "changes": {"language": "FR"},
+    })
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    # Filter mode reports a count, not one result per user
+    assert data["matched"] >= 1 and data["results"] == []
+    db.expire_all()
+    assert marker.language.code == "fr"
+    assert regular_users[1].language.code != "fr"
+
+
+def test_bulk_deactivation_by_filter_revokes_tokens(client, db, regular_users):
+    """
+    Filter mode picks the bumped versions up with one sync instead of per-id bookkeeping.
+    """
+    from app.services.token_revocations import revocations
+
+    role = db.query(UserRole).filter_by(name="user").first()
+    spare_role = UserRole(name=f"bulk-{uuid.uuid4().hex[:8]}")
+    db.add(spare_role)
+    db.commit()
+    for user in regular_users:
+        user.role_id = spare_role.id
+    db.commit()
+    ids = [u.id for u in regular_users]
+    revocations.clear()
+
+    response = _bulk(client, _admin_token(db), {
+        "filter": {"role": spare_role.name}, "changes": {"is_active": False},
+    })
+
+    assert response.json()["data"]["matched"] == 3
+    assert all(revocations.is_revoked(user_id, 0) for user_id in ids)
+    for user in regular_users:
+        user.role_id = role.id
+    db.commit()
+
+
+def test_bulk_update_dry_run_writes_nothing(client, db, regular_users):
+    token = _admin_token(db)
+
+    by_ids = _bulk(client, token, {
+        "user_ids": [u.id for u in regular_users], "changes": {"is_active": False}, "dry_run": True,
+    }).json()["data"]
+    by_filter = _bulk(client, token, {
+        "filter": {"role": "user"}, "changes": {"is_active": False}, "dry_run": True,
+    }).json()["data"]
+
+    assert by_ids["matched"] == 3
+    assert {r["status"] for r in by_ids["results"]} == {"matched"}
+    assert by_filter["matched"] >= 3 and by_filter["results"] == []
+    db.expire_all()
+    assert all(u.is_active for u in regular_users)
+
+
+@pytest.mark.parametrize("payload", [
+    {"changes": {"is_active": False}},
+    {"user_ids": [1], "filter": {"role": "user"}, "changes": {"is_active": False}},
+    {"filter": {}, "changes": {"is_active": False}},
+])
+def test_bulk_update_requires_one_selector_422(client, db, payload):
+    assert _bulk(client, _admin_token(db), payload).status_code == 422
+
+
+@pytest.mark.parametrize("payload", [
+    {"changes": {"role": " "}},
+    {"changes": {"language": ""}},
+])
+def test_bulk_update_blank_values_400(client, db, regular_users, payload):
+    """
+    Blank role/language values are rejected like on the single-user PATCH.
+    """
+    response = _bulk(client, _admin_token(db), {"user_ids": [regular_users[0].id], **payload})
+    assert response.status_code == 400
+
+    response = _bulk(client, _admin_token(db), {"filter": {"role": ""}, "changes": {"is_active": True}})
+    assert response.status_code == 400
+
+
+def test_bulk_update_unknown_role_404(client, db, regular_users):
+    response = _bulk(client, _admin_token(db), {"user_ids": [regular_users[0].id], "changes": {"role": "nobody"}})
+    assert response.status_code == 404
+
+
+def test_bulk_update_is_set_based_per_chunk(db, regular_users, assert_num_queries):
+    """
+    One SELECT and one UPDATE per chunk, whatever the number of fields.
+    """
+    from app.services.user_bulk_update import bulk_update_users
+
+    ids = [u.id for u in regular_users]
+    language_id = regular_users[0].language_id
+
+    with assert_num_queries(4):
+        result = bulk_update_users(
+            db, {"is_active": True, "language_id": language_id}, user_ids=ids, chunk_size=2,
+        )
+
+    assert result.matched == sorted(ids)
@@ -26,6 +26,29 @@ def test_login_success(client):
     assert data["user_language"] == "en"
 
 
+def test_login_email_is_case_insensitive(client):
+    """The email matches regardless of case and surrounding spaces."""
+    response = client.post("/login", json={
+        "email": "TestAdmin@Example.NET",
+        "password": "testpassword"
+    })
+
+    assert response.status_code == 200
+    assert response.json()["data"]["user_email"] == "testadmin@example.net"
+
+
+def test_login_query_count(client, assert_num_queries):
+    """Login: one SELECT for user, role and language, one INSERT for the refresh token."""
+    with assert_num_queries(2):
+        response = client.post("/login", json={
+            "email": "testadmin@example.net",
+            "password": "testpassword"
+        })
+
+    assert response.status_code == 200
+    assert response.json()["data"]["user_role"] == "admin"
+
+
 @pytest.mark.parametrize("email,password", [
     ("testadmin@example.net", "wrongpassword"),  # incorrect password
     ("nonexistent@example.com", "testpassword"),  # nonexistent user
@@ -70,3 +93,26 @@ def test_login_inactive_user(client, db):
     # Restore user to active state for other tests
     user.is_active = True
     db.commit()
+
+
+def test_login_shed_with_503_when_verification_queue_full(client, monkeypatch):
+    """Test login returns 503 with Retry-After when password verification is saturated."""
+    from app.core import admission
+
+    limiter = admission.AdmissionLimiter(max_concurrency=1, max_queue=0, deadline=1.0, retry_after=7)
+    limiter._active = 1  # simulate a verification already in progress
+    monkeypatch.setattr(admission, "_PASSWORD_LIMITER", limiter)
+
+    response = client.post("/login", json={
+        "email": "testadmin@example.net",
+        "password": "testpassword"
+    })
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+    json = response.json()
+    assert json["success"] is False
+    assert json["data"] == {}
+
+    metrics = client.get("/metrics").json()
+    assert metrics["password_verification"]["rejected_queue_full"] == 1
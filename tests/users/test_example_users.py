@@ -27,11 +27,11 @@ def insert_example_users(db):
         if not db.query(Language).filter_by(code=lang.code).first():
             db.add(lang)
 
-    # Seed roles
+    # Seed roles (names are stored lower case, as in app/db/seeds)
     roles = {
-        "User": UserRole(name="User", description="Standard user"),
-        "Admin": UserRole(name="Admin", description="Administrator"),
-        "SuperAdmin": UserRole(name="SuperAdmin", description="Super administrator"),
+        "user": UserRole(name="user", description="Standard user"),
+        "admin": UserRole(name="admin", description="Administrator"),
+        "superadmin": UserRole(name="superadmin", description="Super administrator"),
     }
     for role in roles.values():
         if not db.query(UserRole).filter_by(name=role.name).first():
@@ -41,9 +41,9 @@ def insert_example_users(db):
 
     # Seed users
     users_data = [
-        ("user@example.net", "user", "es", "User"),
-        ("admin@example.net", "admin", "en", "Admin"),
-        ("superadmin@example.net", "superadmin", "fr", "SuperAdmin"),
+        ("user@example.net", "user", "es", "user"),
+        ("admin@example.net", "admin", "en", "admin"),
+        ("superadmin@example.net", "superadmin", "fr", "superadmin"),
     ]
     for email, password, lang_code, role_name in users_data:
         if not db.query(User).filter_by(email=email).first():
@@ -83,7 +83,7 @@ def test_get_example_users_success(client, db, insert_example_users):
         "admin": "adminPassword",
         "superadmin": "superadminPassword",
     }
-    expected_roles = {"User", "Admin", "SuperAdmin"}
+    expected_roles = {"user", "admin", "superadmin"}
     expected_languages = {"en", "es", "fr"}
 
     for user_data in json["data"]:
@@ -93,3 +93,13 @@ def test_get_example_users_success(client, db, insert_example_users):
         assert user_data["user_password"] == expected_passwords[user_name]
         assert user_data["user_role"] in expected_roles
         assert user_data["user_language"] in expected_languages
+
+
+def test_get_example_users_query_count(client, insert_example_users, assert_num_queries):
+    """
+    The listing resolves roles and languages in the same query (no N+1).
+    """
+    with assert_num_queries(1):
+        response = client.get("/users/examples")
+
+    assert response.status_code == 200
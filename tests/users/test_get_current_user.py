@@ -4,9 +4,16 @@ from datetime import datetime, timedelta, timezone
 from jose import jwt
 from fastapi import HTTPException, status
 from app.models.user import User
-from app.services.users import get_current_user, JWT_SECRET_KEY, JWT_ALGORITHM
+from app.services.users import get_current_user
+from app.utils.keyring import get_keyring
 
-# Reuse from your code or define directly
+
+def sign(payload: dict) -> str:
+    """
+    Signs a payload with the active key of the application key ring.
+    """
+    key = get_keyring().active
+    return jwt.encode(payload, key.signing_key, algorithm=key.algorithm, headers={"kid": key.kid})
 
 
 def generate_expired_token(user_id: int) -> str:
@@ -18,7 +25,7 @@ def generate_expired_token(user_id: int) -> str:
         "sub": str(user_id),
         "exp": int(expire.timestamp())
     }
-    return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    return sign(payload)
 
 
 def test_expired_token_returns_token_expired(client, db):
@@ -36,3 +43,48 @@ def test_expired_token_returns_token_expired(client, db):
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json()["detail"] == "Token expired"
+
+
+def test_decode_token_caches_claims_until_token_expiry():
+    """
+    Verifies that verified claims are cached, never beyond the token 'exp'.
+    """
+    import time
+    from app.services import users
+
+    users._TOKEN_CACHE.clear()
+    exp = int((datetime.now(timezone.utc) + timedelta(seconds=30)).timestamp())
+    token = sign({"sub": "1", "exp": exp})
+
+    first = users.decode_token(token)
+    hits_before = users._TOKEN_CACHE.stats()["hits"]
+    second = users.decode_token(token)
+
+    assert first == second
+    assert users._TOKEN_CACHE.stats()["hits"] == hits_before + 1
+
+    (deadline, _), = users._TOKEN_CACHE._data.values()
+    assert deadline <= time.monotonic() + 30
+
+
+def test_decode_token_cache_is_keyed_per_signing_key():
+    """
+    Verifies that claims cached under one signing key are not served for another.
+    """
+    from app.services import users
+
+    users._TOKEN_CACHE.clear()
+    token = sign({"sub": "1", "exp": int((datetime.now(timezone.utc) + timedelta(minutes=5)).timestamp())})
+    users.decode_token(token)
+
+    # Simulate a key rotation: the cached entry must not be reused
+    from app.utils.keyring import KeyRing, build_signing_key, set_keyring
+
+    original = get_keyring()
+    rotated = build_signing_key(original.active.kid, original.active.algorithm, "rotated-secret")
+    set_keyring(KeyRing([rotated], active_kid=rotated.kid))
+    try:
+        with pytest.raises(users.JWTError):
+            users.decode_token(token)
+    finally:
+        set_keyring(original)
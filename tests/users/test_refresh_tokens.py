@@ -0,0 +1,76 @@
+# tests/users/test_refresh_tokens.py
+
+"""Test suite for refresh token issuance and rotation (/token/refresh)."""
+
+from app.models.refresh_token import RefreshToken
+from app.services.refresh_tokens import hash_refresh_token
+
+
+def _login(client):
+    response = client.post("/login", json={
+        "email": "testadmin@example.net",
+        "password": "testpassword"
+    })
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+def test_login_issues_refresh_token_stored_hashed(client, db):
+    """Login returns a refresh token whose digest (not the raw value) is stored."""
+    data = _login(client)
+
+    refresh_token = data["refresh_token"]
+    assert isinstance(refresh_token, str) and refresh_token
+
+    stored = db.query(RefreshToken).filter_by(token_hash=hash_refresh_token(refresh_token)).first()
+    assert stored is not None
+    assert db.query(RefreshToken).filter_by(token_hash=refresh_token).first() is None
+
+
+def test_refresh_rotates_token_pair(client):
+    """A refresh token is exchanged for a new access/refresh pair."""
+    data = _login(client)
+
+    response = client.post("/token/refresh", json={"refresh_token": data["refresh_token"]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert body["message"] == "Token refreshed"
+    assert body["data"]["access_token"]
+    assert body["data"]["refresh_token"] != data["refresh_token"]
+
+    # The new access token authorizes protected routes
+    response = client.put(
+        "/users/me",
+        headers={"Authorization": f"Bearer {body['data']['access_token']}"},
+        json={"language_code": "en"},
+    )
+    assert response.status_code == 200
+
+
+def test_refresh_token_reuse_revokes_family(client):
+    """Reusing a consumed refresh token fails and revokes its successors."""
+    data = _login(client)
+    first = data["refresh_token"]
+
+    second = client.post("/token/refresh", json={"refresh_token": first}).json()["data"]["refresh_token"]
+
+    response = client.post("/token/refresh", json={"refresh_token": first})
+    assert response.status_code == 401
+    assert response.json()["message"] == "Refresh token reuse detected"
+
+    response = client.post("/token/refresh", json={"refresh_token": second})
+    assert response.status_code == 401
+    assert response.json()["message"] == "Refresh token reuse detected"
+
+
+def test_refresh_with_unknown_token(client):
+    """An unknown refresh token is rejected with 401."""
+    response = client.post("/token/refresh", json={"refresh_token": "not-a-token"})
+
+    assert response.status_code == 401
+    body = response.json()
+    assert body["success"] is False
+    assert body["message"] == "Invalid refresh token"
+    assert body["data"] == {}
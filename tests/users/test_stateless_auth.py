@@ -0,0 +1,154 @@
+# tests/users/test_stateless_auth.py
+
+"""Test suite for the opt-in stateless authorization mode (AUTH_STATELESS)."""
+
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from jose import jwt
+from app.models.user import User
+from app.models.user_role import UserRole
+from app.models.language import Language
+from app.services import users as users_service
+from app.services.token_revocations import RevocationList, revocations
+from app.utils.security import get_password_hash, create_access_token
+
+
+@pytest.fixture
+def stateless(monkeypatch):
+    """Enable stateless mode with a fresh revocation list."""
+    monkeypatch.setattr(users_service, "AUTH_STATELESS", True)
+    revocations.clear()
+    yield
+    revocations.clear()
+
+
+@pytest.fixture
+def stateless_user(db):
+    """Create a regular user that can log in."""
+    role = db.query(UserRole).filter_by(name="user").first()
+    if not role:
+        role = UserRole(name="user")
+        db.add(role)
+        db.commit()
+    lang = db.query(Language).filter_by(code="en").first()
+
+    user = User(
+        name="Stateless",
+        email=f"{uuid.uuid4().hex}@example.net",
+        hashed_password=get_password_hash("password"),
+        role_id=role.id,
+        language_id=lang.id,
+        is_active=True,
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _login(client, email, password):
+    response = client.post("/login", json={"email": email, "password": password})
+    assert response.status_code == 200
+    return response.json()["data"]["access_token"]
+
+
+def test_login_embeds_role_language_and_version(client, stateless, stateless_user):
+    """
+    Tokens issued in stateless mode carry role, language and account version.
+    """
+    token = _login(client, stateless_user.email, "password")
+
+    claims = jwt.get_unverified_claims(token)
+    assert claims["sub"] == str(stateless_user.id)
+    assert claims["role"] == "user"
+    assert claims["lang"] == "en"
+    assert claims["ver"] == 0
+
+
+def test_stateless_principal_skips_user_lookup(client, stateless, stateless_user, monkeypatch):
+    """
+    Versioned tokens are authorized from claims without loading the user.
+    """
+    token = _login(client, stateless_user.email, "password")
+
+    def fail_lookup(db, user_id):
+        raise AssertionError("users must not be queried in stateless mode")
+
+    monkeypatch.setattr(users_service, "_load_principal", fail_lookup)
+
+    response = client.put(
+        "/users/me",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"language_code": "en"},
+    )
+    assert response.status_code == 200
+
+
+def test_deactivation_revokes_stateless_token(client, db, stateless, stateless_user):
+    """
+    Deactivating a user bumps the account version and revokes issued tokens.
+    """
+    token = _login(client, stateless_user.email, "password")
+    admin = db.query(User).filter_by(email="testadmin@example.net").first()
+    admin_token = create_access_token(data={"sub": str(admin.id)})
+
+    response = client.patch(
+        f"/users/{stateless_user.id}",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"is_active": False},
+    )
+    assert response.status_code == 200
+
+    response = client.put(
+        "/users/me",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"language_code": "en"},
+    )
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Inactive or invalid user"
+
+
+def test_revocation_list_resyncs_from_database(db, stateless, stateless_user):
+    """
+    Version bumps committed elsewhere are picked up by the periodic sync.
+    """
+    stateless_user.token_version = 3
+    stateless_user.token_version_changed_at = datetime.now(timezone.utc)
+    db.commit()
+
+    revocations.sync_if_stale(db)
+
+    assert revocations.is_revoked(stateless_user.id, 2) is True
+    assert revocations.is_revoked(stateless_user.id, 3) is False
+
+
+def test_revocation_sync_is_incremental_and_bounded(db, stateless_user, assert_num_queries):
+    """
+    A sync reads only bumps since the previous one (minus the overlap), and
+    entries older than the token lifetime are dropped.
+    """
+    revocation_list = RevocationList(sync_interval=30, retention=3600, overlap=60)
+    now = datetime.now(timezone.utc)
+    stateless_user.token_version = 2
+    stateless_user.token_version_changed_at = now - timedelta(hours=2)
+    db.commit()
+
+    revocation_list.sync(db)
+    assert revocation_list.is_revoked(stateless_user.id, 1) is False  # older than the retention
+
+    stateless_user.token_version_changed_at = now - timedelta(minutes=10)
+    db.commit()
+    revocation_list.sync(db)
+    assert revocation_list.is_revoked(stateless_user.id, 1) is False  # before the watermark - overlap
+
+    revocation_list.clear()
+    revocation_list.sync(db)
+    assert revocation_list.is_revoked(stateless_user.id, 1) is True  # first sync reads the whole retention
+
+    revocation_list.record(stateless_user.id + 1000, 5, changed_at=time.time() - 7200)
+    with assert_num_queries(1):
+        revocation_list.sync(db)
+    assert revocation_list.is_revoked(stateless_user.id + 1000, 1) is False  # pruned
+    assert revocation_list.is_revoked(stateless_user.id, 1) is True
@@ -0,0 +1,83 @@
+# tests/users/test_token_introspection.py
+
+"""Test suite for batch token introspection (POST /tokens/introspect)."""
+
+from datetime import timedelta
+import pytest
+from app.models.user import User
+from app.routes import token_routes
+from app.utils.security import create_access_token
+
+API_KEY = {"X-API-Key": "gateway-key"}
+
+
+@pytest.fixture(autouse=True)
+def introspection_key(monkeypatch):
+    """Configure the gateway key; the endpoint is disabled without one."""
+    monkeypatch.setattr(token_routes, "INTROSPECTION_API_KEY", "gateway-key")
+
+
+def test_introspect_mixed_batch_preserves_order(client, db):
+    """
+    Each token gets its own status, in request order.
+    """
+    admin = db.query(User).filter_by(email="testadmin@example.net").first()
+    valid = create_access_token(data={"sub": str(admin.id)})
+    expired = create_access_token(data={"sub": str(admin.id)}, expires_delta=timedelta(minutes=-1))
+    unknown_user = create_access_token(data={"sub": "99999"})
+
+    response = client.post("/tokens/introspect", headers=API_KEY, json={
+        "tokens": [valid, expired, "garbage", unknown_user]
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    results = body["data"]["tokens"]
+    assert len(results) == 4
+
+    assert results[0]["active"] is True
+    assert results[0]["sub"] == str(admin.id)
+    assert results[0]["role"] == "admin"
+    assert isinstance(results[0]["exp"], int)
+
+    assert results[1] == {"active": False, "error": "token_expired"}
+    assert results[2] == {"active": False, "error": "invalid_token"}
+    assert results[3] == {"active": False, "error": "inactive_or_invalid_user"}
+
+
+def test_introspect_rejects_empty_batch(client):
+    """
+    An empty token list is a validation error.
+    """
+    response = client.post("/tokens/introspect", headers=API_KEY, json={"tokens": []})
+
+    assert response.status_code == 422
+
+
+def test_introspect_disabled_without_configured_key(client, monkeypatch):
+    """
+    Without INTROSPECTION_API_KEY the endpoint fails closed, whatever the caller sends.
+    """
+    monkeypatch.setattr(token_routes, "INTROSPECTION_API_KEY", None)
+
+    for headers in ({}, API_KEY, {"X-API-Key": ""}):
+        response = client.post("/tokens/introspect", headers=headers, json={"tokens": ["garbage"]})
+        assert response.status_code == 503
+        assert response.json()["success"] is False
+
+
+def test_introspect_requires_api_key(client):
+    """
+    Callers must send the X-API-Key matching INTROSPECTION_API_KEY.
+    """
+    response = client.post("/tokens/introspect", json={"tokens": ["garbage"]})
+    assert response.status_code == 401
+    assert response.json()["message"] == "Invalid API key"
+
+    response = client.post(
+        "/tokens/introspect",
+        headers={"X-API-Key": "gateway-key"},
+        json={"tokens": ["garbage"]},
+    )
+    assert response.status_code == 200
@@ -0,0 +1,262 @@
+# tests/users/test_user_import.py
+
+"""Test suite for bulk user import (POST /users/import and the CLI)."""
+
+import asyncio
+import csv
+import io
+import json
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from sqlalchemy.exc import IntegrityError
+from app.db import import_users as import_cli
+from app.routes import admin_user_routes
+from app.services import user_import
+from app.models.language import Language
+from app.models.user import User
+from app.models.user_role import UserRole
+from app.services.reference_data import reference_data
+from app.services.user_import import import_users, parse_rows
+from app.utils import security
+from app.utils.security import create_access_token, get_password_hash, verify_password
+
+
+@pytest.fixture(autouse=True)
+def user_role(db):
+    """Ensure the default import role ('user') and language ('en') exist."""
+    role = db.query(UserRole).filter_by(name="user").first()
+    if not role:
+        role = UserRole(name="user")
+        db.add(role)
+    if not db.query(Language).filter_by(code="en").first():
+        db.add(Language(code="en", name="English"))
+    db.commit()
+    return role
+
+
+@pytest.fixture(autouse=True)
+def import_hash_threads(monkeypatch):
+    """Hash imports on a small thread pool instead of spawning processes."""
+    monkeypatch.setenv("IMPORT_HASH_EXECUTOR", "thread")
+    monkeypatch.setenv("IMPORT_HASH_WORKERS", "1")
+    security.shutdown_import_hash_executor()
+    yield
+    security.shutdown_import_hash_executor()
+
+
+def _admin_headers(db, **extra):
+    admin = db.query(User).filter_by(email="testadmin@example.net").first()
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}", **extra}
+
+
+def _email():
+    return f"import-{uuid.uuid4().hex}@example.net"
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_import_ndjson_streams_errors_and_summary(client, db):
+    """
+    Valid rows are created; every rejected row is reported with its line number.
+    """
+    first, second = _email(), _email()
+    body = "\n".join([
+        json.dumps({"name": "One", "email": first.upper(), "password": "pw-one", "role": "ADMIN"}),
+        "{not json",
+        json.dumps({"name": "Two", "email": second, "password": "pw-two", "is_active": False}),
+        json.dumps({"name": "Dup", "email": second, "password": "pw"}),
+        json.dumps({"name": "Old", "email": "testadmin@example.net", "password": "pw"}),
+        json.dumps({"name": "Bad", "email": _email(), "password": "pw", "role": "nobody"}),
+        json.dumps({"name": "NoMail", "email": "not-an-email", "password": "pw"}),
+    ])
+
+    response = client.post("/users/import", headers=_admin_headers(db), content=body)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = _lines(response)
+    assert lines[-1] == {"status": "summary", "processed": 7, "created": 2, "failed": 5}
+    assert {line["line"]: line["error"] for line in lines[:-1]} == {
+        2: "Invalid JSON",
+        4: "Duplicate email in import",
+        5: "Email already exists",
+        6: "Role not found",
+        7: "Invalid email",
+    }
+
+    db.expire_all()
+    one = db.query(User).filter_by(email=first).first()
+    two = db.query(User).filter_by(email=second).first()
+    assert one.role.name == "admin" and one.is_active is True
+    assert two.is_active is False
+    assert verify_password("pw-two", two.hashed_password)
+
+
+def test_import_csv_by_content_type(client, db):
+    email = _email()
+    body = f"name,email,password,language\nCsv,{email},secret,EN\n"
+
+    response = client.post(
+        "/users/import", headers=_admin_headers(db, **{"Content-Type": "text/csv"}), content=body
+    )
+
+    assert _lines(response)[-1]["created"] == 1
+    db.expire_all()
+    assert db.query(User).filter_by(email=email).first().language.code == "en"
+
+
+def test_import_requires_admin(client, db, user_role):
+    language = db.query(Language).filter_by(code="en").first()
+    user = User(name="Plain", email=_email(), hashed_password="x", role_id=user_role.id, language_id=language.id)
+    db.add(user)
+    db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+
+    assert client.post("/users/import", headers=headers, content="").status_code == 403
+
+
+def test_import_writes_one_insert_per_batch(db, assert_num_queries):
+    """
+    Per batch: one SELECT for existing emails and one multi-row INSERT.
+    """
+    reference_data.load(db)
+    rows = [{"name": f"B{i}", "email": _email(), "password": "pw"} for i in range(4)]
+    stream = iter([(i + 1, row) for i, row in enumerate(rows)])
+
+    with ThreadPoolExecutor(max_workers=4) as executor, assert_num_queries(4):
+        results = list(import_users(db, stream, executor, batch_size=2))
+
+    assert results == [{"status": "summary", "processed": 4, "created": 4, "failed": 0}]
+
+
+def test_failed_batch_is_reported_and_import_continues(db, monkeypatch):
+    """
+    A batch whose write fails is rolled back and reported row by row; later batches still import.
+    """
+    reference_data.load(db)
+    rows = [{"name": f"F{i}", "email": _email(), "password": "pw"} for i in range(4)]
+    stream = iter([(i + 1, row) for i, row in enumerate(rows)])
+    real_insert = user_import.insert_user_rows
+    calls = []
+
+    def flaky_insert(session, batch):
+        calls.append(len(batch))
+        if len(calls) == 1:
+            raise IntegrityError("INSERT INTO users", None, Exception("duplicate key"))
+        real_insert(session, batch)
+
+    monkeypatch.setattr(user_import, "insert_user_rows", flaky_insert)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(import_users(db, stream, executor, batch_size=2))
+
+    assert [(r["line"], r["email"]) for r in results[:-1]] == [(1, rows[0]["email"]), (2, rows[1]["email"])]
+    assert all(r["status"] == "error" and "IntegrityError" in r["error"] for r in results[:-1])
+    assert results[-1] == {"status": "summary", "processed": 4, "created": 2, "failed": 2}
+    db.expire_all()
+    imported = {u.email for u in db.query(User).filter(User.email.in_([r["email"] for r in rows]))}
+    assert imported == {rows[2]["email"], rows[3]["email"]}
+
+
+def test_login_verify_not_queued_behind_import(db, monkeypatch):
+    """
+    Import batches hash on their own pool: a login verification completes
+    while every import hashing worker is busy.
+    """
+    monkeypatch.setenv("PASSWORD_HASH_EXECUTOR", "thread")
+    monkeypatch.setenv("PASSWORD_HASH_WORKERS", "1")
+    security.shutdown_hash_executor()
+    hashed = get_password_hash("login-pw")
+
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash(password):
+        started.set()
+        release.wait(10)
+        return hashed
+
+    monkeypatch.setattr(user_import, "get_password_hash", slow_hash)
+    spool = tempfile.SpooledTemporaryFile()
+    spool.write("\n".join(
+        json.dumps({"name": f"Slow{i}", "email": _email(), "password": "pw"}) for i in range(3)
+    ).encode())
+    spool.seek(0)
+
+    results = []
+    importer = threading.Thread(target=lambda: results.extend(admin_user_routes._stream_import(spool, "ndjson")))
+    importer.start()
+    try:
+        assert started.wait(5)
+        verified = asyncio.run(asyncio.wait_for(security.verify_password_async("login-pw", hashed), 5))
+        assert verified is True
+        assert importer.is_alive()
+    finally:
+        release.set()
+        importer.join(10)
+        security.shutdown_hash_executor()
+
+    assert json.loads(results[-1]) == {"status": "summary", "processed": 3, "created": 3, "failed": 0}
+
+
+def test_parse_rows_reports_malformed_csv_rows_and_continues():
+    """
+    csv.Error rows (e.g. a field over csv.field_size_limit) are reported; the following rows still parse.
+    """
+    huge = "x" * (csv.field_size_limit() + 1)
+    stream = io.StringIO(f"name,email,password\nA,a@example.net,pw\n\"{huge}\",b@example.net,pw\n{huge},c@example.net,pw\nD,d@example.net,pw\n")
+
+    parsed = list(parse_rows(stream, "csv"))
+
+    assert [p for p in parsed if isinstance(p[1], str)] == [(3, "Malformed CSV row"), (4, "Malformed CSV row")]
+    assert [(p[0], p[1]["email"]) for p in parsed if isinstance(p[1], dict)] == [(2, "a@example.net"), (5, "d@example.net")]
+
+
+def test_import_malformed_csv_still_sends_summary(client, db):
+    huge = "x" * (csv.field_size_limit() + 1)
+    body = f"name,email,password\n{huge},{_email()},pw\nNul\0,{_email()},pw\nGood,{_email()},pw\n"
+
+    response = client.post("/users/import", headers=_admin_headers(db, **{"Content-Type": "text/csv"}), content=body)
+
+    lines = _lines(response)
+    assert lines[:2] == [
+        {"line": 2, "status": "error", "error": "Malformed CSV row"},
+        {"line": 3, "status": "error", "error": "Invalid NUL character"},
+    ]
+    assert lines[-1] == {"status": "summary", "processed": 3, "created": 1, "failed": 2}
+
+
+def test_import_body_over_limit_413(client, db, monkeypatch):
+    monkeypatch.setattr(admin_user_routes, "IMPORT_MAX_BYTES", 16)
+    body = json.dumps({"name": "Big", "email": _email(), "password": "pw"})
+
+    response = client.post("/users/import", headers=_admin_headers(db), content=body)
+    assert response.status_code == 413
+    assert response.json()["success"] is False
+
+    # Without Content-Length (chunked), the limit applies while reading
+    response = client.post("/users/import", headers=_admin_headers(db), content=iter([body.encode()]))
+    assert response.status_code == 413
+
+
+def test_parse_rows_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        list(parse_rows(iter([]), "xml"))
+
+
+def test_cli_imports_file(tmp_path, db, capsys):
+    email = _email()
+    path = tmp_path / "users.csv"
+    path.write_text(f"name,email,password\nCli,{email},secret\nBroken,,secret\n")
+
+    exit_code = import_cli.main([str(path), "--executor", "thread", "--workers", "2"])
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert exit_code == 2
+    assert lines[0] == {"line": 3, "status": "error", "error": "Invalid email"}
+    assert lines[-1] == {"status": "summary", "processed": 2, "created": 1, "failed": 1}
+    db.expire_all()
+    assert db.query(User).filter_by(email=email).count() == 1
@@ -0,0 +1,40 @@
+# tests/users/test_user_queries.py
+
+"""Test suite for the prebuilt hot-path statements (app/services/user_queries.py)."""
+
+import pytest
+from app.models.user import User
+from app.services.user_queries import login_user, principal_row, principal_rows, update_user_returning
+
+
+def test_principal_lookups(db):
+    admin = db.query(User).filter_by(email="testadmin@example.net").first()
+
+    row = principal_row(db, admin.id)
+    assert tuple(row) == (admin.id, True, "admin", "en")
+    assert principal_row(db, 999999) is None
+    assert [r[0] for r in principal_rows(db, {admin.id, 999999})] == [admin.id]
+
+
+def test_login_user_loads_role_and_language(db, assert_num_queries):
+    with assert_num_queries(1):
+        user = login_user(db, "testadmin@example.net")
+        assert (user.role.name, user.language.code) == ("admin", "en")
+    assert login_user(db, "nobody@example.net") is None
+
+
+@pytest.mark.parametrize("returning", [True, False])
+def test_update_user_returning(db, monkeypatch, assert_num_queries, returning):
+    """
+    One UPDATE ... RETURNING, or UPDATE + SELECT where the dialect lacks RETURNING.
+    """
+    admin = db.query(User).filter_by(email="testadmin@example.net").first()
+    admin_id, version = admin.id, admin.token_version
+    monkeypatch.setattr(db.get_bind().dialect, "update_returning", returning)
+
+    with assert_num_queries(1 if returning else 2):
+        row = update_user_returning(db, admin_id, {"token_version": User.token_version + 1})
+    assert tuple(row) == (admin_id, True, admin.role_id, admin.language_id, version + 1)
+
+    assert update_user_returning(db, 999999, {"is_active": False}) is None
+    db.rollback()
@@ -5,6 +5,8 @@
 import pytest
 from app.models.user import User
 from app.models.language import Language
+from app.services.reference_data import reference_data
+from app.services.users import clear_principal_cache, invalidate_principal
 from app.utils.security import create_access_token
 
 
@@ -53,6 +55,26 @@ def test_update_language_success(client, db):
     assert user.language.code == "es"
 
 
+def test_update_language_query_count(client, db, assert_num_queries):
+    """
+    With warm reference data: one principal lookup and one UPDATE.
+    """
+    user = db.query(User).filter(User.email == "testadmin@example.net").first()
+    ensure_language_exists(db, "es", "Español")
+    token = create_access_token(data={"sub": str(user.id)})
+    reference_data.load(db)
+    clear_principal_cache()
+
+    with assert_num_queries(2):
+        response = client.put(
+            "/users/me",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"language_code": "en"}
+        )
+
+    assert response.status_code == 200
+
+
 def test_update_language_not_found(client, db):
     """
     Verify that an unknown language code returns 400.
@@ -90,6 +112,8 @@ def test_update_language_inactive_user(client, db):
 
     user.is_active = False
     db.commit()
+    # Direct DB writes bypass the routes, so drop the cached principal here
+    invalidate_principal(user.id)
 
     token = create_access_token(data={"sub": str(user.id)})
 
@@ -106,6 +130,7 @@ def test_update_language_inactive_user(client, db):
     # Restore user for future tests
     user.is_active = True
     db.commit()
+    invalidate_principal(user.id)
 
 
 def test_update_language_user_not_found(client):
@@ -128,3 +153,39 @@ def test_update_language_user_not_found(client):
     data = response.json()
     assert data["detail"] == "Inactive or invalid user"
 
+
+
+def test_update_language_deleted_user(client, db):
+    """
+    A user deleted while its principal is still cached gets 401, not a language error.
+
+    Asserts:
+        - 401 Unauthorized shaped like other authentication failures (detail, WWW-Authenticate)
+        - Nothing is written for the missing row
+    """
+    admin = db.query(User).filter(User.email == "testadmin@example.net").first()
+    user = User(
+        name="Gone",
+        email="deleted-user@example.net",
+        hashed_password="x",
+        role_id=admin.role_id,
+        language_id=admin.language_id,
+        is_active=True,
+    )
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user_id)})}"}
+    # Authenticating caches the principal
+    assert client.get("/auth/verify", headers=headers).status_code == 204
+
+    # Delete behind the principal cache's back
+    db.query(User).filter(User.id == user_id).delete()
+    db.commit()
+
+    response = client.put("/users/me", headers=headers, json={"language_code": "en"})
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Inactive or invalid user"
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+    assert db.query(User).filter(User.id == user_id).count() == 0
@@ -0,0 +1,54 @@
+# tests/users/test_verify_routes.py
+
+"""Test suite for the reverse-proxy auth check (GET /auth/verify)."""
+
+from app.models.user import User
+from app.utils.security import create_access_token
+
+
+def _admin_token(db):
+    admin = db.query(User).filter_by(email="testadmin@example.net").first()
+    return admin, create_access_token(data={"sub": str(admin.id)})
+
+
+def test_verify_valid_token_returns_identity_headers(client, db):
+    """
+    A valid token yields 204, identity headers, no body and a short cache hint.
+    """
+    admin, token = _admin_token(db)
+
+    response = client.get("/auth/verify", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 204
+    assert response.content == b""
+    assert response.headers["X-User-Id"] == str(admin.id)
+    assert response.headers["X-User-Role"] == "admin"
+    assert response.headers["Cache-Control"].startswith("public, s-maxage=")
+    assert response.headers["Vary"] == "Authorization"
+
+
+def test_verify_missing_or_invalid_token_returns_401(client):
+    """
+    Missing and invalid tokens yield 401 with no body and no caching.
+    """
+    for headers in ({}, {"Authorization": "Bearer garbage"}, {"Authorization": "Basic abc"}):
+        response = client.get("/auth/verify", headers=headers)
+
+        assert response.status_code == 401
+        assert response.content == b""
+        assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_verify_required_role(client, db):
+    """
+    The optional role parameter yields 403 when the user's role is not accepted.
+    """
+    _, token = _admin_token(db)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/auth/verify", params={"role": "Admin,superadmin"}, headers=headers)
+    assert response.status_code == 204
+
+    response = client.get("/auth/verify", params={"role": "superadmin"}, headers=headers)
+    assert response.status_code == 403
+    assert response.content == b""